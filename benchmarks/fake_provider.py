@@ -0,0 +1,180 @@
+"""
+벤치마크용 가짜 데이터 제공자
+네트워크 없이 항상 같은 결과를 돌려주는 합성 데이터 제공자와,
+아무 제공자나 감싸서 메서드별 호출 횟수를 세는 래퍼를 제공합니다.
+"""
+
+import functools
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+import providers
+
+
+# 합성 일봉의 마지막 날짜 (실행 날짜와 관계없이 같은 결과가 나오도록 고정)
+END_DATE = pd.Timestamp('2026-10-16')
+
+# 합성 한국 ETF 목록 (브랜드 x 테마)
+ETF_BRANDS = ['KODEX', 'TIGER', 'ACE', 'SOL', 'RISE', 'PLUS', 'HANARO', 'KIWOOM']
+ETF_THEMES = [
+    '200', '코스닥150', '미국S&P500', '미국나스닥100', '미국배당다우존스', '커버드콜',
+    '미국배당커버드콜액티브', '반도체', '2차전지산업', '고배당', '단기채권', '금현물',
+    '리츠', '인도Nifty50', '일본니케이225', '중국CSI300', '미국30년국채', '은행',
+    '헬스케어', 'AI반도체', '조선TOP10', '방산', '원자력', '월배당'
+]
+US_STOCKS = {'AAPL': 'Apple Inc.', 'MSFT': 'Microsoft Corp.', 'NVDA': 'NVIDIA Corp.', 'AMZN': 'Amazon.com Inc.',
+             'GOOGL': 'Alphabet Inc. Class A', 'META': 'Meta Platforms Inc.', 'JPM': 'JPMorgan Chase & Co.',
+             'KO': 'Coca-Cola Co.', 'PEP': 'PepsiCo Inc.', 'JNJ': 'Johnson & Johnson'}
+# 합성 S&P 500 목록 크기 (실제 종목 + ZZ000 형식 합성 티커, 'BRK.B'처럼 점 표기 포함)
+SP500_SIZE = 500
+KRX_STOCKS = ['삼성전자', 'SK하이닉스', 'LG에너지솔루션', '현대차', '기아', 'NAVER', '카카오',
+              '셀트리온', 'POSCO홀딩스', 'KB금융', '신한지주', '삼성바이오로직스']
+
+
+def _seed(*parts) -> int:
+    return zlib.crc32('|'.join(map(str, parts)).encode('utf-8'))
+
+
+@functools.lru_cache(maxsize=4)
+def _business_days(end: pd.Timestamp) -> pd.DatetimeIndex:
+    """합성 일봉 날짜 (end 이전 400일의 영업일)"""
+    return pd.bdate_range(end - pd.Timedelta(days=400), end)
+
+
+def etf_listing() -> pd.DataFrame:
+    names = [f"{brand} {theme}" for brand in ETF_BRANDS for theme in ETF_THEMES]
+    codes = [f"{400000 + i * 7:06d}" for i in range(len(names))]
+    # 실제 워치리스트/검색에 쓰이는 대표 종목코드 포함
+    codes[:3] = ['069500', '360750', '441640']
+    return pd.DataFrame({'Symbol': codes, 'Name': names})
+
+
+def krx_listing() -> pd.DataFrame:
+    codes = [f"{5930 + i * 1000:06d}" for i in range(len(KRX_STOCKS))]
+    return pd.DataFrame({'Code': codes, 'Name': KRX_STOCKS})
+
+
+def sp500_listing() -> pd.DataFrame:
+    symbols = list(US_STOCKS) + ['BRK.B'] + [f"ZZ{i:03d}" for i in range(SP500_SIZE - len(US_STOCKS) - 1)]
+    names = list(US_STOCKS.values()) + ['Berkshire Hathaway Inc. Class B'] + [f"{symbol} Corp." for symbol in symbols[len(US_STOCKS) + 1:]]
+    return pd.DataFrame({'Symbol': symbols, 'Name': names})
+
+
+class FakeProvider(providers.DataProvider):
+    """
+    합성 데이터 제공자.
+
+    티커별 값은 티커 문자열로 시드를 만들어 생성하므로 실행할 때마다 같고,
+    모든 호출에 latency(초)만큼 지연을 넣어 네트워크 조회를 흉내 냅니다.
+    """
+
+    def __init__(self, name: str, latency: float = 0.0):
+        self.name = name
+        self.latency = latency
+
+    def _wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _daily(self, symbol: str, start) -> pd.DataFrame:
+        # 날짜별 값은 start와 관계없이 같음 (마지막 저장일을 다시 받아도 값이 바뀌지 않음)
+        full_index = _business_days(END_DATE)
+        rng = np.random.default_rng(_seed(symbol))
+        base = 1000 + _seed(symbol, 'price') % 50000
+        close = base * np.cumprod(1 + rng.normal(0, 0.01, len(full_index)))
+        volume = rng.integers(1_000, 1_000_000, len(full_index))
+        first = full_index.searchsorted(pd.Timestamp(start))
+        close, volume = close[first:], volume[first:]
+        return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': volume},
+                            index=full_index[first:])
+
+    def get_info(self, ticker: str) -> Dict:
+        self._wait()
+        rng = np.random.default_rng(_seed(ticker, 'info'))
+        price = float(rng.uniform(10, 500))
+        return {
+            'currentPrice': price,
+            'regularMarketPrice': 1380.0 if ticker == 'KRW=X' else price,
+            'previousClose': price * float(rng.uniform(0.95, 1.05)),
+            'longName': f"{ticker} Fund",
+            'shortName': ticker,
+            'dividendYield': round(float(rng.uniform(0, 10)), 2)
+        }
+
+    def get_recent_history(self, ticker: str, period: str = '1d') -> pd.DataFrame:
+        self._wait()
+        return self._daily(ticker, END_DATE - pd.Timedelta(days=40)).tail(22 if period == '1mo' else 5)
+
+    def download(self, tickers: List[str], period: str = '1mo') -> pd.DataFrame:
+        self._wait()
+        rows = {'3mo': 64, '1mo': 22}.get(period, 5)
+        frames = {ticker: self._daily(ticker, END_DATE - pd.Timedelta(days=100)).tail(rows) for ticker in tickers}
+        closes = pd.concat({ticker: frame['Close'] for ticker, frame in frames.items()}, axis=1)
+        volumes = pd.concat({ticker: frame['Volume'] for ticker, frame in frames.items()}, axis=1)
+        return pd.concat({'Close': closes, 'Volume': volumes}, axis=1)
+
+    def get_history(self, symbol: str, start: str) -> pd.DataFrame:
+        self._wait()
+        if symbol == 'USD/KRW':
+            history = self._daily(symbol, start)
+            return history.assign(Close=1300 + history['Close'] % 150)
+        return self._daily(symbol, start)
+
+    def get_listing(self, market: str) -> pd.DataFrame:
+        self._wait()
+        if market == 'ETF/KR':
+            return etf_listing()
+        if market == 'KRX':
+            return krx_listing()
+        if market == 'S&P500':
+            return sp500_listing()
+        raise ValueError(f"지원하지 않는 시장: {market}")
+
+    def get_fx_rate(self, pair: str = 'KRW=X') -> Optional[float]:
+        return self.get_info(pair).get('regularMarketPrice')
+
+
+class CountingProvider(providers.DataProvider):
+    """다른 제공자를 감싸서 메서드별 호출 횟수를 셉니다."""
+
+    def __init__(self, inner: providers.DataProvider):
+        self.name = inner.name
+        self.inner = inner
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _count(self, method: str) -> None:
+        with self._lock:
+            self.calls[method] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+    def get_info(self, ticker: str) -> Dict:
+        self._count('get_info')
+        return self.inner.get_info(ticker)
+
+    def get_recent_history(self, ticker: str, period: str = '1d') -> pd.DataFrame:
+        self._count('get_recent_history')
+        return self.inner.get_recent_history(ticker, period)
+
+    def download(self, tickers: List[str], period: str = '1mo') -> pd.DataFrame:
+        self._count('download')
+        return self.inner.download(tickers, period)
+
+    def get_history(self, symbol: str, start: str) -> pd.DataFrame:
+        self._count('get_history')
+        return self.inner.get_history(symbol, start)
+
+    def get_listing(self, market: str) -> pd.DataFrame:
+        self._count('get_listing')
+        return self.inner.get_listing(market)
+
+    def get_fx_rate(self, pair: str = 'KRW=X') -> Optional[float]:
+        self._count('get_fx_rate')
+        return self.inner.get_fx_rate(pair)
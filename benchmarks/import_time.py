@@ -0,0 +1,122 @@
+"""
+시작 시간(import) 측정 스크립트
+새 프로세스에서 `python -X importtime`으로 앱 모듈을 import하여 모듈별 import 시간을 보고하고,
+예산(IMPORT_BUDGET_MS)과 지연 import 대상(DEFERRED_MODULES)을 확인합니다.
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/import_time.py            # 보고서 출력
+    python benchmarks/import_time.py --check    # 예산 초과 또는 지연 import 대상이 불러와지면 종료 코드 1
+    python benchmarks/import_time.py --top 30   # import 시간 상위 30개 모듈 표시
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# app.py가 import하는 프로젝트 모듈 (streamlit 제외)
+APP_MODULES = ['config', 'metrics', 'utils', 'quote_store', 'data_fetcher', 'async_fetcher', 'portfolio', 'scheduler']
+
+# 실제 조회/기능 사용 시점까지 import를 미뤄야 하는 모듈
+# yfinance / FinanceDataReader: 네트워크 조회 시, apscheduler: 백그라운드 갱신 시작 시,
+# http.server: /metrics 엔드포인트 시작 시
+DEFERRED_MODULES = ['yfinance', 'FinanceDataReader', 'apscheduler', 'http.server']
+
+IMPORT_BUDGET_MS = 1200  # 앱 모듈 전체 import 시간 예산 (pandas 포함, 밀리초)
+
+
+def run_importtime(modules: List[str]) -> List[Dict]:
+    """
+    새 프로세스에서 modules를 import하고 -X importtime 결과를 파싱합니다.
+
+    Args:
+        modules: import할 모듈 이름 리스트
+
+    Returns:
+        [{'module', 'self_ms', 'cumulative_ms', 'depth'}] (import 순서, depth 0이 최상위)
+    """
+    env = {**os.environ, 'PYTHONPATH': str(SRC_DIR)}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {', '.join(modules)}"],
+        cwd=SRC_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import 실패:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append({
+            'module': name.strip(),
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2
+        })
+    return rows
+
+
+def total_ms(rows: List[Dict]) -> float:
+    """최상위 import의 누적 시간 합계 (밀리초)"""
+    return sum(row['cumulative_ms'] for row in rows if row['depth'] == 0)
+
+
+def deferred_imported(rows: List[Dict]) -> List[str]:
+    """import된 지연 import 대상 모듈 (하위 모듈 포함, 예: yfinance.utils → yfinance)"""
+    imported = {row['module'].split('.')[0] for row in rows} | {row['module'] for row in rows}
+    return [module for module in DEFERRED_MODULES if module in imported]
+
+
+def measure(modules: List[str], repeat: int) -> List[Dict]:
+    """repeat번 측정해 합계가 중앙값인 실행 결과를 반환합니다 (첫 실행의 .pyc 생성 영향 제외)."""
+    run_importtime(modules)
+    runs = sorted((run_importtime(modules) for _ in range(repeat)), key=total_ms)
+    return runs[len(runs) // 2]
+
+
+def print_report(rows: List[Dict], top: int) -> None:
+    print(f"import 합계 (인터프리터 기본 모듈 포함): {total_ms(rows):.1f}ms (예산 {IMPORT_BUDGET_MS}ms)")
+
+    print("\n[최상위 모듈 누적 시간]")
+    for row in sorted((row for row in rows if row['depth'] == 0), key=lambda row: -row['cumulative_ms']):
+        print(f"  {row['module']:<40} {row['cumulative_ms']:>8.1f}ms")
+
+    print(f"\n[모듈 자체 시간 상위 {top}개]")
+    for row in sorted(rows, key=lambda row: -row['self_ms'])[:top]:
+        print(f"  {row['module']:<40} {row['self_ms']:>8.1f}ms")
+
+    print(f"\n전체 모듈 수: {len(rows)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="앱 모듈 import 시간 측정")
+    parser.add_argument('--check', action='store_true', help="예산 초과 또는 지연 import 대상이 불러와지면 종료 코드 1")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument('--top', type=int, default=15, help="표시할 상위 모듈 수")
+    args = parser.parse_args()
+
+    rows = measure(APP_MODULES, args.repeat)
+    print_report(rows, args.top)
+
+    problems = []
+    eager = deferred_imported(rows)
+    if eager:
+        problems.append(f"지연 import 대상이 시작 시 import됨: {', '.join(eager)}")
+    if total_ms(rows) > IMPORT_BUDGET_MS:
+        problems.append(f"import 시간 예산 초과: {total_ms(rows):.1f}ms > {IMPORT_BUDGET_MS}ms")
+
+    for problem in problems:
+        print(f"⚠️ {problem}")
+    if not problems:
+        print("✅ import 예산 통과")
+
+    return 1 if args.check and problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+성능 벤치마크
+가짜(또는 기록 재생) 데이터 제공자로 data_fetcher 주요 경로와 app.py 전체 실행을
+측정하고, 저장된 기준값(baselines.json)과 비교합니다.
+
+측정 항목: 실행 시간(중앙값), 데이터 제공자 호출 수, 최대 메모리(tracemalloc)
+
+사용법 (프로젝트 루트에서):
+    python benchmarks/run_benchmarks.py                  # 측정 후 기준값과 비교
+    python benchmarks/run_benchmarks.py --check          # 성능 저하가 있으면 종료 코드 1
+    python benchmarks/run_benchmarks.py --save-baseline  # 현재 결과를 기준값으로 저장
+    python benchmarks/run_benchmarks.py --only enrich     # 이름에 'enrich'가 들어간 항목만
+    python benchmarks/run_benchmarks.py --provider replay # 기록된 응답(data/recordings) 사용
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List
+import pandas as pd
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCHMARK_DIR.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+import config  # noqa: E402
+
+# 벤치마크 중에는 백그라운드 갱신과 탭 미리 조회를 끄고 캐시를 임시 폴더에 둠
+# (탭 미리 조회는 app_tab_switch_warm 준비 단계에서만 켬)
+config.BACKGROUND_PREFETCH_ENABLED = False
+config.TAB_PREFETCH_ENABLED = False
+config.METRICS_EXPORT_INTERVAL = None
+config.METRICS_HTTP_PORT = None
+
+import async_fetcher  # noqa: E402
+import data_fetcher  # noqa: E402
+import fx_service  # noqa: E402
+import metrics  # noqa: E402
+import persistent_cache  # noqa: E402
+import price_store  # noqa: E402
+import providers  # noqa: E402
+import quote_store  # noqa: E402
+import search_index  # noqa: E402
+import symbol_listing  # noqa: E402
+import import_time  # noqa: E402
+from fake_provider import CountingProvider, FakeProvider, etf_listing  # noqa: E402
+
+
+BASELINE_PATH = BENCHMARK_DIR / "baselines.json"
+
+# 측정 후 남은 작업 스레드를 기다리는 최대 시간 (초)
+DRAIN_TIMEOUT = 120
+
+# 기준값 대비 허용 범위 (실행 시간은 기기/부하에 따라 흔들리므로 넉넉하게)
+WALL_TOLERANCE = 0.5  # 실행 시간 50% 초과 시 성능 저하
+MEMORY_TOLERANCE = 0.25  # 최대 메모리 25% 초과 시 성능 저하
+
+# 설치된 계수 제공자 {제공자 이름: CountingProvider}
+_counting: Dict[str, CountingProvider] = {}
+_workdir: Path = Path(tempfile.mkdtemp(prefix="dashboard-bench-"))
+
+
+def install_providers(kind: str, latency: float) -> None:
+    """yfinance / FDR 자리에 호출 수를 세는 가짜(또는 재생) 제공자를 넣습니다."""
+    for name in (providers.YFINANCE, providers.FDR):
+        if kind == 'replay':
+            inner = providers.RecordReplayProvider(name, providers.REPLAY, config.PROVIDER_RECORDINGS_DIR,
+                                                   latency=latency)
+        else:
+            inner = FakeProvider(name, latency=latency)
+        _counting[name] = CountingProvider(inner)
+        providers.set_provider(name, _counting[name])
+
+
+def reset_state() -> None:
+    """모든 캐시를 비우고 새 임시 폴더를 사용합니다 (매 측정을 콜드 상태에서 시작)."""
+    global _workdir
+
+    shutil.rmtree(_workdir, ignore_errors=True)
+    _workdir = Path(tempfile.mkdtemp(prefix="dashboard-bench-"))
+    config.CACHE_DIR = _workdir
+    config.PERSISTENT_CACHE_PATH = _workdir / "quote_cache.sqlite3"
+    config.PRICE_STORE_DIR = _workdir / "ohlcv"
+    config.US_METADATA_PATH = _workdir / "us_metadata.csv"
+
+    with persistent_cache._lock:
+        if persistent_cache._conn is not None:
+            persistent_cache._conn.close()
+            persistent_cache._conn = None
+    symbol_listing.clear()
+    search_index.clear()
+    quote_store.store.clear()
+    fx_service.clear()
+    async_fetcher.clear_prefetch_history()
+    price_store._histories.clear()
+    data_fetcher._us_metadata = None
+
+    if 'streamlit' in sys.modules:
+        sys.modules['streamlit'].cache_data.clear()
+
+    metrics.reset()
+    for provider in _counting.values():
+        provider.reset()
+
+
+def provider_calls() -> Dict[str, int]:
+    """제공자별 호출 수"""
+    return {name: sum(provider.calls.values()) for name, provider in _counting.items()}
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크 항목
+# ---------------------------------------------------------------------------
+
+def _kr_watchlist(size: int) -> pd.DataFrame:
+    codes = etf_listing()['Symbol'].tolist()
+    tickers = [codes[i % len(codes)] if i < len(codes) else f"{900000 + i:06d}" for i in range(size)]
+    return pd.DataFrame({'ticker': tickers, 'name': tickers, 'type': 'ETF', 'target_ratio': 100 / size})
+
+
+def _us_watchlist(size: int) -> pd.DataFrame:
+    tickers = (data_fetcher.HOT_US_TICKERS + [f"ZZ{i:03d}" for i in range(size)])[:size]
+    return pd.DataFrame({'ticker': tickers, 'name': tickers, 'type': 'ETF', 'target_ratio': 100 / size})
+
+
+def _enrich(size: int, is_us: bool) -> Callable[[], None]:
+    def run():
+        df = _us_watchlist(size) if is_us else _kr_watchlist(size)
+        # 제한 시간 없이 조회 (tracemalloc으로 느려져도 시간 초과 행이 섞이지 않도록)
+        result = data_fetcher.enrich_watchlist_with_data(df, is_us=is_us, timeout=None)
+        assert len(result) == size
+        missing = int(result['price'].isna().sum())
+        assert not missing, f"시세 없는 종목 {missing}/{size}개"
+    return run
+
+
+def _hot_us() -> None:
+    for period in data_fetcher.HOT_PERIODS:
+        assert not data_fetcher.fetch_hot_us_stocks(period, 10).empty
+
+
+def _hot_kr() -> None:
+    for period in data_fetcher.HOT_PERIODS:
+        assert not data_fetcher.fetch_hot_kr_etfs(period, 10).empty
+
+
+def _search(query: str) -> Callable[[], None]:
+    def run():
+        assert data_fetcher.search_stock_multiple(query)
+    return run
+
+
+WARM_SEARCH_QUERIES = ['커버드콜', 'ㅋㅂㄷㅋ', '0695', 'KODEX', 'tiger 미국', 'AAPL', '삼성', 'zzzz']
+
+
+def _search_warm() -> None:
+    # 인덱스를 만든 뒤(SETUPS) 1,000번 조회
+    for i in range(1000):
+        search_index.search(WARM_SEARCH_QUERIES[i % len(WARM_SEARCH_QUERIES)])
+
+
+def _concurrent_dashboard(sessions: int) -> Callable[[], None]:
+    # 캐시 만료 직후 여러 세션이 동시에 대시보드를 여는 상황
+    def run():
+        with ThreadPoolExecutor(max_workers=sessions) as executor:
+            results = list(executor.map(lambda _: async_fetcher.load_dashboard(10), range(sessions)))
+        assert all(not result['isa'].empty for result in results)
+    return run
+
+
+def _import_cold() -> None:
+    # 새 프로세스에서 앱 모듈 import (yfinance 등 지연 import 대상이 불러와지면 실패)
+    rows = import_time.run_importtime(import_time.APP_MODULES)
+    eager = import_time.deferred_imported(rows)
+    assert not eager, f"시작 시 import됨: {eager}"
+
+
+def _app_run(lazy_tabs: bool) -> Callable[[], None]:
+    # lazy_tabs=True: 기본 탭(ISA)만 로드, False: 모든 탭 데이터를 한 번에 로드
+    def run():
+        from streamlit.testing.v1 import AppTest
+
+        lazy_default = config.LAZY_TABS_ENABLED
+        config.LAZY_TABS_ENABLED = lazy_tabs
+        try:
+            at = AppTest.from_file(str(SRC_DIR / "app.py"), default_timeout=120).run()
+        finally:
+            config.LAZY_TABS_ENABLED = lazy_default
+        assert not at.exception, at.exception
+    return run
+
+
+# 탭 전환 측정용 AppTest (SETUPS에서 만들고 측정에서 사용)
+_warm_app: Dict[str, object] = {}
+
+
+def _prefetched_app() -> None:
+    # 기본 탭(ISA)을 그리면 앱이 나머지 탭 데이터셋을 미리 조회하고, 끝날 때까지 기다림
+    from streamlit.testing.v1 import AppTest
+
+    config.TAB_PREFETCH_ENABLED = True
+    try:
+        at = AppTest.from_file(str(SRC_DIR / "app.py"), default_timeout=120).run()
+    finally:
+        config.TAB_PREFETCH_ENABLED = False
+    assert not at.exception, at.exception
+    async_fetcher.wait_for_prefetch()
+    _warm_app['at'] = at
+
+
+def _tab_switch_warm() -> None:
+    # 미리 조회가 끝난 뒤 나머지 탭으로 차례로 전환 (제공자 호출 없이 캐시에서 그려야 정상)
+    at = _warm_app.pop('at')
+    labels = [radio for radio in at.radio if radio.key == 'active_tab'][0].options
+    for label in labels[1:]:
+        [radio for radio in at.radio if radio.key == 'active_tab'][0].set_value(label).run()
+        assert not at.exception, at.exception
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    'enrich_kr_5': _enrich(5, is_us=False),
+    'enrich_kr_50': _enrich(50, is_us=False),
+    'enrich_kr_500': _enrich(500, is_us=False),
+    'enrich_us_5': _enrich(5, is_us=True),
+    'enrich_us_50': _enrich(50, is_us=True),
+    'enrich_us_500': _enrich(500, is_us=True),
+    'hot_us_all_periods': _hot_us,
+    'hot_kr_all_periods': _hot_kr,
+    'search_hangul': _search('커버드콜'),
+    'search_numeric': _search('069500'),
+    'search_latin': _search('JEPI'),
+    'search_warm_1000': _search_warm,
+    'dashboard_1_session': _concurrent_dashboard(1),
+    'dashboard_16_sessions': _concurrent_dashboard(16),
+    'import_cold': _import_cold,
+    'app_full_run': _app_run(lazy_tabs=True),
+    'app_eager_tabs': _app_run(lazy_tabs=False),
+    'app_tab_switch_warm': _tab_switch_warm,
+}
+
+
+# 측정 전에 실행할 준비 작업 (측정 시간에서 제외)
+SETUPS: Dict[str, Callable[[], None]] = {
+    'search_warm_1000': search_index.get_index,
+    'app_tab_switch_warm': _prefetched_app,
+}
+
+
+# ---------------------------------------------------------------------------
+# 측정 / 비교
+# ---------------------------------------------------------------------------
+
+def drain_workers(before: set) -> None:
+    """
+    측정 중에 시작된 작업 스레드(스레드 풀, 비동기 로드의 제공자/관심 종목 스레드 풀)와 보이지 않는 탭의
+    미리 조회(app_full_run)가 끝날 때까지 기다립니다.
+
+    제한 시간을 넘겨 남은 조회가 다음 항목의 시간/호출 수에 섞이지 않도록 합니다.
+    """
+    deadline = time.monotonic() + DRAIN_TIMEOUT
+    async_fetcher.wait_for_prefetch(timeout=DRAIN_TIMEOUT)
+    for thread in threading.enumerate():
+        if thread in before or not thread.name.startswith(('ThreadPoolExecutor', 'asyncio', 'provider', 'watchlist')):
+            continue
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            print(f"⚠️ 작업 스레드가 끝나지 않음: {thread.name}")
+
+
+def measure(func: Callable[[], None], repeat: int, setup: Callable[[], None] = None) -> Dict:
+    """
+    콜드 상태에서 repeat번 실행한 시간의 중앙값과, 별도 1회 실행의 최대 메모리를 잽니다.
+    setup이 있으면 매번 setup을 먼저 실행하고, 그 시간과 제공자 호출은 측정에서 뺍니다.
+
+    tracemalloc은 실행 시간을 늘리므로 시간 측정과 메모리 측정을 나눠서 실행합니다.
+    매 실행 후에는 남은 작업 스레드가 끝날 때까지 기다립니다 (drain_workers).
+    """
+    walls = []
+    calls: Dict[str, int] = {}
+    for _ in range(repeat):
+        reset_state()
+        if setup:
+            setup()
+            for provider in _counting.values():
+                provider.reset()
+        before = set(threading.enumerate())
+        start = time.perf_counter()
+        func()
+        walls.append(time.perf_counter() - start)
+        drain_workers(before)
+        calls = provider_calls()
+
+    reset_state()
+    if setup:
+        setup()
+    before = set(threading.enumerate())
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        drain_workers(before)
+
+    return {
+        'wall_s': round(statistics.median(walls), 4),
+        'calls': calls,
+        'total_calls': sum(calls.values()),
+        'peak_mb': round(peak / 1024 / 1024, 2)
+    }
+
+
+def compare(name: str, result: Dict, baseline: Dict) -> List[str]:
+    """기준값보다 나빠진 항목 목록 (비어 있으면 통과)"""
+    problems = []
+    if result['wall_s'] > baseline['wall_s'] * (1 + WALL_TOLERANCE):
+        problems.append(f"시간 {baseline['wall_s']}s → {result['wall_s']}s")
+    if result['total_calls'] > baseline['total_calls']:
+        problems.append(f"호출 {baseline['total_calls']} → {result['total_calls']}")
+    if result['peak_mb'] > baseline['peak_mb'] * (1 + MEMORY_TOLERANCE):
+        problems.append(f"메모리 {baseline['peak_mb']}MB → {result['peak_mb']}MB")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="투자 대시보드 성능 벤치마크")
+    parser.add_argument('--only', help="이름에 이 문자열이 포함된 항목만 실행")
+    parser.add_argument('--repeat', type=int, default=3, help="시간 측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--latency', type=float, default=0.01, help="제공자 호출마다 넣을 지연 시간 (초)")
+    parser.add_argument('--provider', choices=['fake', 'replay'], default='fake',
+                        help="fake: 합성 데이터 / replay: data/recordings에 기록된 응답")
+    parser.add_argument('--save-baseline', action='store_true', help="결과를 기준값으로 저장")
+    parser.add_argument('--check', action='store_true', help="성능 저하가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    install_providers(args.provider, args.latency)
+    baselines = json.loads(BASELINE_PATH.read_text(encoding='utf-8')) if BASELINE_PATH.exists() else {}
+
+    results = {}
+    regressions = {}
+    print(f"{'항목':<22}{'시간(s)':>10}{'호출':>8}{'메모리(MB)':>12}  비교")
+    for name, func in BENCHMARKS.items():
+        if args.only and args.only not in name:
+            continue
+        result = measure(func, args.repeat, SETUPS.get(name))
+        results[name] = result
+
+        status = '기준값 없음'
+        if name in baselines:
+            problems = compare(name, result, baselines[name])
+            status = '통과' if not problems else '⚠️ ' + ', '.join(problems)
+            if problems:
+                regressions[name] = problems
+        print(f"{name:<22}{result['wall_s']:>10.3f}{result['total_calls']:>8}{result['peak_mb']:>12.2f}  {status}")
+
+    shutil.rmtree(_workdir, ignore_errors=True)
+
+    if args.save_baseline:
+        baselines.update(results)
+        BASELINE_PATH.write_text(json.dumps(baselines, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"기준값 저장: {BASELINE_PATH}")
+
+    if regressions:
+        print(f"⚠️ 성능 저하 {len(regressions)}건: {', '.join(regressions)}")
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,7 +7,12 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import config
+import async_fetcher
 import data_fetcher
+import metrics
+import portfolio
+import quote_store
+import scheduler
 import utils
 
 
@@ -25,6 +30,25 @@ st.title("📊 투자 포트폴리오 대시보드")
 st.markdown("---")
 
 
+# 백그라운드 데이터 갱신 시작 (프로세스당 한 번)
+@st.cache_resource
+def start_background_prefetch():
+    """워치리스트/환율/HOT 종목을 캐시 만료 전에 미리 갱신하는 스케줄러 시작"""
+    return scheduler.start()
+
+
+start_background_prefetch()
+
+
+@st.cache_resource
+def start_metrics_server():
+    """로컬 /metrics 엔드포인트 시작 (config.METRICS_HTTP_PORT가 설정된 경우만)"""
+    return metrics.start_http_server()
+
+
+start_metrics_server()
+
+
 # 세션 상태 초기화 (임시 워치리스트)
 if 'temp_watchlist_isa' not in st.session_state:
     st.session_state.temp_watchlist_isa = []
@@ -32,30 +56,145 @@ if 'temp_watchlist_direct' not in st.session_state:
     st.session_state.temp_watchlist_direct = []
 
 
-# 사이드바
-with st.sidebar:
-    st.header("⚙️ 설정")
+# 탭 이름
+TAB_ISA = "🇰🇷 ISA 계좌"
+TAB_DIRECT = "🇺🇸 미국 직투"
+TAB_HOT = "🔥 HOT 종목 Top 10"
+TAB_SUMMARY = "📈 전체 요약"
+
+# HOT 미국 주식 후보 표시 이름 (그 외 값은 시장 코드 그대로 표시)
+HOT_US_UNIVERSE_LABELS = {
+    'S&P500': "S&P 500",
+    'NASDAQ': "나스닥 전체",
+    data_fetcher.US_UNIVERSE_MAJOR: "S&P 500 주요 종목",
+    data_fetcher.US_UNIVERSE_CUSTOM: "사용자 지정 종목",
+}
+
+# 새로고침 대상: 이름 → 데이터셋 (None이면 전체 캐시 초기화)
+REFRESH_TARGETS = {
+    "ISA 관심 종목": [async_fetcher.ISA],
+    "미국 직투 관심 종목": [async_fetcher.DIRECT],
+    "환율": [async_fetcher.EXCHANGE_RATE],
+    "HOT 종목": [async_fetcher.HOT],
+    "전체": None,
+}
+
+# 탭별 기본 새로고침 대상 (지연 로드 모드에서 현재 탭에 맞춰 선택)
+TAB_REFRESH_TARGETS = {
+    TAB_ISA: "ISA 관심 종목",
+    TAB_DIRECT: "미국 직투 관심 종목",
+    TAB_HOT: "HOT 종목",
+    TAB_SUMMARY: "전체",
+}
+
+
+# 검색 결과 선택, 임시 관심 종목 추가/삭제는 @st.fragment 조각 안에서 처리합니다.
+# 조각 안의 버튼을 누르면 앱 전체가 아니라 그 조각만 다시 실행됩니다.
+def select_search_result(ticker):
+    """검색 결과 선택 (버튼 콜백 - 조각을 다시 그리기 전에 실행)"""
+    st.session_state.selected_stock = ticker
+
+
+def remove_temp_item(state_key, idx):
+    """임시 관심 종목 삭제 (버튼 콜백 - 조각을 다시 그리기 전에 실행)"""
+    st.session_state[state_key].pop(idx)
+
+
+def refresh_temp_watchlist(tab):
+    """
+    임시 관심 종목을 추가한 뒤 호출합니다.
+
+    추가한 목록(tab의 임시 관심 종목)이 지금 화면에 보이면 목록도 갱신되도록
+    앱 전체를 다시 실행하고, 보이지 않으면 현재 조각만 그대로 둡니다.
+    """
+    if not config.LAZY_TABS_ENABLED or st.session_state.get('active_tab', TAB_ISA) == tab:
+        st.rerun()
 
-    # 새로고침 버튼
-    if st.button("🔄 데이터 새로고침", width='stretch'):
+
+# 캐시를 사용한 데이터 로드 함수
+@st.cache_data(ttl=config.CACHE_TTL)
+def load_dashboard_data():
+    """전체 탭 데이터 로드 (ISA, 직투, 환율, HOT 종목 - 동시 조회, 캐시 사용)"""
+    return async_fetcher.load_dashboard(hot_limit=10)
+
+
+@st.cache_data(ttl=config.CACHE_TTL)
+def load_dataset(name):
+    """데이터셋 하나만 로드 (지연 로드 모드에서 선택한 탭에 필요한 것만 조회, 캐시 사용)"""
+    return async_fetcher.load_dataset(name, hot_limit=10)
+
+
+def get_data(name):
+    """
+    탭에 필요한 데이터셋을 반환합니다.
+
+    지연 로드 모드면 그 데이터셋만 조회하고, 아니면 한 번에 불러온 전체 데이터에서 꺼냅니다.
+    """
+    if not config.LAZY_TABS_ENABLED:
+        if name == async_fetcher.HOT:
+            return {'hot_us': dashboard_data['hot_us'], 'hot_kr': dashboard_data['hot_kr']}
+        return dashboard_data[name]
+
+    with st.spinner("데이터를 불러오는 중..."):
+        with metrics.timer(metrics.FETCH_LATENCY, function=f'app.load_dataset.{name}'):
+            return load_dataset(name)
+
+
+def refresh_datasets(names):
+    """
+    선택한 데이터셋만 새로 조회하고 그 캐시만 비웁니다 (다른 데이터셋 캐시는 유지).
+
+    Args:
+        names: 데이터셋 이름 리스트 (None이면 모든 캐시 초기화)
+    """
+    if names is None:
         st.cache_data.clear()
-        st.rerun()
+        data_fetcher.clear_cache()
+        async_fetcher.clear_prefetch_history()
+        return
 
-    st.markdown("---")
+    for name in names:
+        async_fetcher.refresh_dataset(name, hot_limit=10)
+        load_dataset.clear(name)
+    # 전체 로드 결과에서 다른 데이터셋은 캐시(시세 저장소, 영구 캐시)에서 다시 채워짐
+    load_dashboard_data.clear()
 
-    # 환율 정보
-    st.subheader("💱 환율 정보")
-    exchange_rate = data_fetcher.fetch_exchange_rate()
-    st.metric("USD/KRW", f"₩{exchange_rate:,.2f}")
 
-    st.markdown("---")
+def save_to_watchlist(name, row, message):
+    """
+    임시 관심 종목을 CSV에 저장하고 새 종목 시세만 조회한 뒤 앱 전체를 다시 실행합니다.
+
+    관심 종목 표는 기존 종목을 시세 저장소에서 읽고 새 종목만 합쳐 다시 만듭니다.
+    """
+    async_fetcher.add_to_watchlist(name, row)
+    load_dataset.clear(name)
+    load_dashboard_data.clear()
+    st.session_state[f'saved_message_{name}'] = message
+    st.rerun()
+
+
+def show_saved_message(name):
+    """CSV 저장 후 다시 실행된 화면에 저장 완료 메시지를 표시합니다."""
+    message = st.session_state.pop(f'saved_message_{name}', None)
+    if message:
+        st.success(message)
 
-    # 종목 검색
+
+# 데이터 로드 (지연 로드 모드가 아니면 모든 탭 데이터를 한 번에 동시 조회)
+if not config.LAZY_TABS_ENABLED:
+    with st.spinner("데이터를 불러오는 중..."):
+        with metrics.timer(metrics.FETCH_LATENCY, function='app.load_dashboard_data'):
+            dashboard_data = load_dashboard_data()
+
+
+@st.fragment
+def render_search():
+    """사이드바 종목 검색 (결과 선택, 임시 관심 종목 추가는 이 영역만 다시 실행)"""
     st.subheader("🔍 종목 검색")
     search_query = st.text_input(
         "티커 또는 종목명 입력",
         key="search_input",
-        placeholder="AAPL, 삼성전자, 커버드콜..."
+        placeholder="AAPL, 005930, 삼성전자, 커버드콜, ㅋㅂㄷㅋ..."
     )
 
     if search_query:
@@ -74,17 +213,13 @@ with st.sidebar:
                 for idx, result in enumerate(search_results):
                     with st.expander(f"📊 {result['name']} ({result['ticker']})"):
                         # 선택 버튼
-                        if st.button(f"이 종목 선택", key=f"select_{result['ticker']}_{idx}"):
-                            st.session_state.selected_stock = result['ticker']
-                            st.rerun()
+                        st.button(f"이 종목 선택", key=f"select_{result['ticker']}_{idx}",
+                                  on_click=select_search_result, args=(result['ticker'],))
 
                         # 선택된 종목이면 상세 정보 표시
                         if st.session_state.selected_stock == result['ticker']:
                             with st.spinner("상세 정보 로딩 중..."):
-                                if result['market'] == 'US':
-                                    stock_detail = data_fetcher.fetch_us_etf_data(result['ticker'])
-                                else:
-                                    stock_detail = data_fetcher.fetch_kr_etf_data(result['ticker'])
+                                stock_detail = data_fetcher.get_quote(result['ticker'], result['market'])
 
                             if stock_detail and stock_detail.get('price') is not None:
                                 stock_detail['market'] = result['market']
@@ -121,7 +256,7 @@ with st.sidebar:
                                                 'currency': 'USD'
                                             })
                                             st.success("추가 완료!")
-                                            st.rerun()
+                                            refresh_temp_watchlist(TAB_DIRECT)
                                         else:
                                             st.warning("이미 추가된 종목입니다.")
                                 else:  # KR
@@ -137,7 +272,7 @@ with st.sidebar:
                                                 'currency': 'KRW'
                                             })
                                             st.success("추가 완료!")
-                                            st.rerun()
+                                            refresh_temp_watchlist(TAB_ISA)
                                         else:
                                             st.warning("이미 추가된 종목입니다.")
                             else:
@@ -147,10 +282,7 @@ with st.sidebar:
             else:
                 result = search_results[0]
                 with st.spinner("상세 정보 로딩 중..."):
-                    if result['market'] == 'US':
-                        search_result = data_fetcher.fetch_us_etf_data(result['ticker'])
-                    else:
-                        search_result = data_fetcher.fetch_kr_etf_data(result['ticker'])
+                    search_result = data_fetcher.get_quote(result['ticker'], result['market'])
 
                 if search_result and search_result.get('price') is not None:
                     search_result['market'] = result['market']
@@ -192,7 +324,7 @@ with st.sidebar:
                                         'currency': 'USD'
                                     })
                                     st.success("추가 완료!")
-                                    st.rerun()
+                                    refresh_temp_watchlist(TAB_DIRECT)
                                 else:
                                     st.warning("이미 추가된 종목입니다.")
                         else:  # KR
@@ -208,7 +340,7 @@ with st.sidebar:
                                         'currency': 'KRW'
                                     })
                                     st.success("추가 완료!")
-                                    st.rerun()
+                                    refresh_temp_watchlist(TAB_ISA)
                                 else:
                                     st.warning("이미 추가된 종목입니다.")
                 else:
@@ -216,140 +348,231 @@ with st.sidebar:
         else:
             st.error(f"❌ '{search_query}' 종목을 찾을 수 없습니다.")
 
+
+# 사이드바
+with st.sidebar:
+    st.header("⚙️ 설정")
+
+    # 새로고침 (선택한 데이터만 새로 조회, 나머지 캐시는 유지)
+    refresh_options = list(REFRESH_TARGETS)
+    default_target = TAB_REFRESH_TARGETS[st.session_state.get('active_tab', TAB_ISA)] \
+        if config.LAZY_TABS_ENABLED else "전체"
+    refresh_target = st.selectbox("새로고침 대상", refresh_options, index=refresh_options.index(default_target))
+    if st.button("🔄 데이터 새로고침", width='stretch'):
+        with st.spinner(f"{refresh_target} 새로 조회 중..."):
+            refresh_datasets(REFRESH_TARGETS[refresh_target])
+        st.rerun()
+
     st.markdown("---")
 
-    # 마지막 업데이트 시간
-    st.caption(f"⏰ 마지막 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    # 환율 정보
+    st.subheader("💱 환율 정보")
+    exchange_rate = get_data(async_fetcher.EXCHANGE_RATE)  # 전체 로드 결과 또는 환율 데이터셋 캐시
+    st.metric("USD/KRW", f"₩{exchange_rate:,.2f}")
 
+    st.markdown("---")
 
-# 캐시를 사용한 데이터 로드 함수
-@st.cache_data(ttl=config.CACHE_TTL)
-def load_isa_data():
-    """ISA 관심 종목 데이터 로드 (캐시 사용)"""
-    watchlist = data_fetcher.load_watchlist(str(config.ISA_WATCHLIST_PATH))
-    if watchlist.empty:
-        return pd.DataFrame()
-    return data_fetcher.enrich_watchlist_with_data(watchlist, is_us=False)
+    # 종목 검색 (검색/선택/추가는 이 영역만 다시 실행)
+    render_search()
 
+    st.markdown("---")
 
-@st.cache_data(ttl=config.CACHE_TTL)
-def load_direct_data():
-    """미국 직투 관심 종목 데이터 로드 (캐시 사용)"""
-    watchlist = data_fetcher.load_watchlist(str(config.DIRECT_WATCHLIST_PATH))
+    # 마지막 업데이트 시간
+    st.caption(f"⏰ 마지막 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # 성능 지표 디버그 패널
+    if config.DEBUG_PANEL_ENABLED:
+        with st.expander("🛠️ 성능 지표 (디버그)"):
+            st.markdown("**캐시 적중률**")
+            st.dataframe(
+                metrics.cache_hit_ratios().style.format({'hit_ratio': '{:.1%}'}),
+                width='stretch',
+                hide_index=True
+            )
+
+            st.markdown("**지연 시간 (ms)**")
+            st.dataframe(
+                metrics.latency_summary().style.format(
+                    {'avg_ms': '{:.1f}', 'p50_ms': '{:.1f}', 'p95_ms': '{:.1f}', 'max_ms': '{:.1f}'}
+                ),
+                width='stretch',
+                hide_index=True
+            )
+
+            st.markdown("**느린 호출 Top 10**")
+            slowest = pd.DataFrame(metrics.slowest_calls(10), columns=['호출', '초'])
+            st.dataframe(slowest.style.format({'초': '{:.3f}'}), width='stretch', hide_index=True)
+
+            store_stats = quote_store.store.stats()
+            st.markdown(
+                f"**시세 저장소**: {store_stats['entries']}개 종목, "
+                f"{store_stats['bytes'] / 1024:,.0f} / {store_stats['max_bytes'] / 1024:,.0f} KB"
+            )
+
+            st.markdown("**호출 / 재시도 / 실패 횟수**")
+            st.dataframe(metrics.counter_summary(), width='stretch', hide_index=True)
+
+            st.download_button(
+                "📥 Prometheus 형식 다운로드",
+                data=metrics.render_prometheus(),
+                file_name="metrics.prom",
+                mime="text/plain",
+                width='stretch'
+            )
+
+
+# ==================== 관심 종목 카드 ====================
+def stream_watchlist_cards(name, render_card, num_cols):
+    """
+    관심 종목 카드를 시세가 도착하는 대로 하나씩 그립니다.
+
+    모든 종목 자리에 먼저 불러오는 중 표시를 넣고, 조회가 끝난 종목부터
+    그 자리를 카드로 바꿉니다. 느린 종목이 있어도 나머지 카드는 바로 보입니다.
+
+    Returns:
+        모든 종목 시세가 채워진 DataFrame (워치리스트가 비어 있으면 빈 DataFrame)
+    """
+    file_path, is_us = async_fetcher.WATCHLISTS[name]
+    watchlist = data_fetcher.load_watchlist(str(file_path))
     if watchlist.empty:
         return pd.DataFrame()
-    return data_fetcher.enrich_watchlist_with_data(watchlist, is_us=True)
 
+    cols = st.columns(num_cols)
+    placeholders = [cols[idx % num_cols].empty() for idx in range(len(watchlist))]
+    for placeholder, ticker in zip(placeholders, watchlist['ticker']):
+        placeholder.info(f"⏳ {ticker} 시세를 불러오는 중...")
+
+    rows = [None] * len(watchlist)
+    with metrics.timer(metrics.FETCH_LATENCY, function=f'app.stream_watchlist.{name}'):
+        for idx, row in data_fetcher.stream_watchlist_with_data(watchlist, is_us=is_us):
+            rows[idx] = row
+            with placeholders[idx].container():
+                render_card(pd.Series(row))
+
+    return pd.DataFrame(rows)
+
+
+def render_watchlist(name, render_card, render_summary, num_cols, error_message):
+    """
+    관심 종목 카드와 요약 테이블을 그립니다.
+
+    지연 로드 모드에서 STREAMING_WATCHLIST_ENABLED이면 카드를 시세가 도착하는 대로 그리고
+    요약 테이블은 모든 종목이 채워진 뒤 표시합니다. 아니면 전체 데이터를 불러온 뒤 한 번에 그립니다.
+    """
+    if config.LAZY_TABS_ENABLED and config.STREAMING_WATCHLIST_ENABLED:
+        data = stream_watchlist_cards(name, render_card, num_cols)
+        if data.empty:
+            st.error(error_message)
+            return
+    else:
+        data = get_data(name)
+        if data.empty:
+            st.error(error_message)
+            return
 
-# HOT 종목 데이터 로드 함수
-@st.cache_data(ttl=config.CACHE_TTL)
-def load_hot_us_data(period='1d'):
-    """HOT 미국 주식 데이터 로드 (캐시 사용)"""
-    return data_fetcher.fetch_hot_us_stocks(period=period, limit=10)
+        # ETF 카드 표시
+        cols = st.columns(num_cols)
+        for idx, row in data.iterrows():
+            with cols[idx % num_cols]:
+                render_card(row)
 
+    # 포트폴리오 요약 테이블
+    render_summary(data)
 
-@st.cache_data(ttl=config.CACHE_TTL)
-def load_hot_kr_data(period='1d'):
-    """HOT 한국 ETF 데이터 로드 (캐시 사용)"""
-    return data_fetcher.fetch_hot_kr_etfs(period=period, limit=10)
 
+# ==================== ISA 계좌 탭 ====================
+def render_isa_card(row):
+    """ISA 종목 카드 하나"""
+    # 카드 컨테이너
+    with st.container():
+        # 종목명 및 티커
+        st.subheader(f"{row['name']}")
+        st.caption(f"종목코드: {row['ticker']} | {row['type']}")
+
+        # 가격 정보
+        if row['price'] is not None:
+            # 등락률 색상
+            change_color = utils.get_color_for_change(row['change_percent'])
+
+            # 현재가
+            st.metric(
+                label="현재가",
+                value=utils.format_price(row['price'], "KRW"),
+                delta=utils.format_percent(row['change_percent'])
+            )
+
+            # 추가 정보
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("등락액", utils.format_price(row['change'], "KRW"))
+            with col2:
+                st.metric("배당률", utils.format_ratio(row['dividend_yield']) if row['dividend_yield'] else "N/A")
+            with col3:
+                st.metric("목표 비중", utils.format_ratio(row['target_ratio']))
+        else:
+            st.warning("⚠️ 데이터를 불러올 수 없습니다.")
 
-# 탭 생성
-tab_isa, tab_direct, tab_hot, tab_summary = st.tabs(["🇰🇷 ISA 계좌", "🇺🇸 미국 직투", "🔥 HOT 종목 Top 10", "📈 전체 요약"])
+        st.markdown("---")
+
+
+def render_isa_summary(data):
+    """ISA 포트폴리오 요약 테이블"""
+    st.subheader("📊 ISA 포트폴리오 요약")
+
+    summary_df = data[['ticker', 'name', 'price', 'change_percent', 'dividend_yield', 'target_ratio']].copy()
+    summary_df.columns = ['종목코드', '종목명', '현재가 (원)', '등락률 (%)', '배당률 (%)', '목표 비중 (%)']
+
+    # 포맷팅 함수 (None 처리 포함)
+    def format_price_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"{val:,.0f}"
+
+    def format_percent_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"{val:+.2f}"
+
+    def format_dividend_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"{val:.1f}"
+
+    def format_ratio_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"{val:.1f}"
+
+    # 포맷팅 적용
+    st.dataframe(
+        summary_df.style.format({
+            '현재가 (원)': format_price_safe,
+            '등락률 (%)': format_percent_safe,
+            '배당률 (%)': format_dividend_safe,
+            '목표 비중 (%)': format_ratio_safe
+        }),
+        width='stretch',
+        hide_index=True
+    )
 
 
-# ==================== ISA 계좌 탭 ====================
-with tab_isa:
+def render_isa_tab():
+    """ISA 계좌 탭 (국내 상장 ETF 카드, 요약 테이블, 임시 관심 종목)"""
     st.header("🇰🇷 ISA 계좌 - 국내 상장 ETF")
 
-    # 데이터 로드
-    with st.spinner("데이터를 불러오는 중..."):
-        isa_data = load_isa_data()
+    render_watchlist(async_fetcher.ISA, render_isa_card, render_isa_summary, num_cols=3,
+                     error_message="❌ ISA 관심 종목 데이터를 불러올 수 없습니다.")
 
-    if isa_data.empty:
-        st.error("❌ ISA 관심 종목 데이터를 불러올 수 없습니다.")
-    else:
-        # ETF 카드 표시
-        num_cols = 3
-        cols = st.columns(num_cols)
+    # 임시 관심 종목 섹션 (삭제는 이 영역만 다시 실행)
+    render_temp_watchlist_isa()
 
-        for idx, row in isa_data.iterrows():
-            col_idx = idx % num_cols
-
-            with cols[col_idx]:
-                # 카드 컨테이너
-                with st.container():
-                    # 종목명 및 티커
-                    st.subheader(f"{row['name']}")
-                    st.caption(f"종목코드: {row['ticker']} | {row['type']}")
-
-                    # 가격 정보
-                    if row['price'] is not None:
-                        # 등락률 색상
-                        change_color = utils.get_color_for_change(row['change_percent'])
-
-                        # 현재가
-                        st.metric(
-                            label="현재가",
-                            value=utils.format_price(row['price'], "KRW"),
-                            delta=utils.format_percent(row['change_percent'])
-                        )
-
-                        # 추가 정보
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("등락액", utils.format_price(row['change'], "KRW"))
-                        with col2:
-                            st.metric("배당률", utils.format_ratio(row['dividend_yield']) if row['dividend_yield'] else "N/A")
-                        with col3:
-                            st.metric("목표 비중", utils.format_ratio(row['target_ratio']))
-                    else:
-                        st.warning("⚠️ 데이터를 불러올 수 없습니다.")
-
-                    st.markdown("---")
-
-        # 포트폴리오 요약 테이블
-        st.subheader("📊 ISA 포트폴리오 요약")
-
-        summary_df = isa_data[['ticker', 'name', 'price', 'change_percent', 'dividend_yield', 'target_ratio']].copy()
-        summary_df.columns = ['종목코드', '종목명', '현재가 (원)', '등락률 (%)', '배당률 (%)', '목표 비중 (%)']
-
-        # 포맷팅 함수 (None 처리 포함)
-        def format_price_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"{val:,.0f}"
-
-        def format_percent_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"{val:+.2f}"
-
-        def format_dividend_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"{val:.1f}"
-
-        def format_ratio_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"{val:.1f}"
-
-        # 포맷팅 적용
-        st.dataframe(
-            summary_df.style.format({
-                '현재가 (원)': format_price_safe,
-                '등락률 (%)': format_percent_safe,
-                '배당률 (%)': format_dividend_safe,
-                '목표 비중 (%)': format_ratio_safe
-            }),
-            width='stretch',
-            hide_index=True
-        )
 
-    # 임시 관심 종목 섹션
+@st.fragment
+def render_temp_watchlist_isa():
+    """ISA 임시 관심 종목 (삭제 버튼은 이 영역만 다시 실행, CSV에 저장하면 관심 종목 표도 갱신)"""
     st.markdown("---")
     st.subheader("⭐ 임시 관심 종목")
+    show_saved_message(async_fetcher.ISA)
 
     if len(st.session_state.temp_watchlist_isa) == 0:
         st.info("💡 HOT 종목 탭에서 종목을 추가해보세요!")
@@ -372,9 +595,8 @@ with tab_isa:
 
                 with col4:
                     # 삭제 버튼
-                    if st.button("🗑️", key=f"remove_isa_{idx}", help="임시 워치리스트에서 제거"):
-                        st.session_state.temp_watchlist_isa.pop(idx)
-                        st.rerun()
+                    st.button("🗑️", key=f"remove_isa_{idx}", help="임시 워치리스트에서 제거",
+                              on_click=remove_temp_item, args=('temp_watchlist_isa', idx))
 
                 # 영구 저장 기능 (CSV 추가)
                 with st.expander("💾 영구 저장 (CSV에 추가)"):
@@ -388,116 +610,112 @@ with tab_isa:
                     )
 
                     if st.button("CSV에 저장", key=f"save_isa_{idx}"):
-                        # CSV에 추가
-                        import csv
-                        with open(config.ISA_WATCHLIST_PATH, 'a', newline='', encoding='utf-8') as f:
-                            writer = csv.writer(f)
-                            writer.writerow([
-                                item['ticker'],
-                                item['name'],
-                                item['type'],
-                                target_ratio,
-                                0  # dividend_yield (수동 입력 필요)
-                            ])
-                        st.success(f"✅ {item['name']}이(가) CSV에 저장되었습니다!")
-                        st.info("📝 캐시를 새로고침하려면 사이드바의 '데이터 새로고침' 버튼을 클릭하세요.")
+                        # CSV에 추가하고 새 종목 시세만 조회
+                        save_to_watchlist(async_fetcher.ISA, {
+                            'ticker': item['ticker'],
+                            'name': item['name'],
+                            'type': item['type'],
+                            'target_ratio': target_ratio,
+                            'dividend_yield': 0  # 수동 입력 필요
+                        }, f"✅ {item['name']}이(가) CSV에 저장되었습니다!")
 
                 st.markdown("---")
 
 
 # ==================== 미국 직투 탭 ====================
-with tab_direct:
+def render_direct_card(row):
+    """미국 직투 종목 카드 하나"""
+    # 카드 컨테이너
+    with st.container():
+        # 종목명 및 티커
+        st.subheader(f"{row['ticker']}")
+        st.caption(f"{row['name']} | {row['type']}")
+
+        # 가격 정보
+        if row['price'] is not None:
+            # 현재가
+            st.metric(
+                label="현재가 (USD)",
+                value=utils.format_price(row['price'], "USD"),
+                delta=utils.format_percent(row['change_percent'])
+            )
+
+            # 원화 환산 가격
+            krw_price = utils.convert_usd_to_krw(row['price'], exchange_rate)
+            st.caption(f"원화 환산: {utils.format_price(krw_price, 'KRW')}")
+
+            # 추가 정보
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("등락액", utils.format_price(row['change'], "USD"))
+            with col2:
+                st.metric("배당률", utils.format_ratio(row['dividend_yield']))
+            with col3:
+                st.metric("목표 비중", utils.format_ratio(row['target_ratio']))
+        else:
+            st.warning("⚠️ 데이터를 불러올 수 없습니다.")
+
+        st.markdown("---")
+
+
+def render_direct_summary(data):
+    """미국 직투 포트폴리오 요약 테이블"""
+    st.subheader("📊 미국 직투 포트폴리오 요약")
+
+    summary_df = data[['ticker', 'name', 'price', 'change_percent', 'dividend_yield', 'target_ratio']].copy()
+    summary_df.columns = ['티커', '종목명', '현재가 (USD)', '등락률 (%)', '배당률 (%)', '목표 비중 (%)']
+
+    # 포맷팅 함수 (None 처리 포함)
+    def format_usd_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"${val:.2f}"
+
+    def format_percent_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"{val:+.2f}"
+
+    def format_dividend_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"{val:.2f}"
+
+    def format_ratio_safe(val):
+        if val is None or pd.isna(val):
+            return "N/A"
+        return f"{val:.1f}"
+
+    # 포맷팅 적용
+    st.dataframe(
+        summary_df.style.format({
+            '현재가 (USD)': format_usd_safe,
+            '등락률 (%)': format_percent_safe,
+            '배당률 (%)': format_dividend_safe,
+            '목표 비중 (%)': format_ratio_safe
+        }),
+        width='stretch',
+        hide_index=True
+    )
+
+
+def render_direct_tab():
+    """미국 직투 탭 (미국 상장 ETF 카드, 요약 테이블, 임시 관심 종목)"""
     st.header("🇺🇸 미국 직투 계좌 - 미국 상장 ETF")
 
-    # 데이터 로드
-    with st.spinner("데이터를 불러오는 중..."):
-        direct_data = load_direct_data()
+    render_watchlist(async_fetcher.DIRECT, render_direct_card, render_direct_summary, num_cols=2,
+                     error_message="❌ 미국 직투 관심 종목 데이터를 불러올 수 없습니다.")
 
-    if direct_data.empty:
-        st.error("❌ 미국 직투 관심 종목 데이터를 불러올 수 없습니다.")
-    else:
-        # ETF 카드 표시
-        num_cols = 2
-        cols = st.columns(num_cols)
+    # 임시 관심 종목 섹션 (삭제는 이 영역만 다시 실행)
+    render_temp_watchlist_direct()
 
-        for idx, row in direct_data.iterrows():
-            col_idx = idx % num_cols
-
-            with cols[col_idx]:
-                # 카드 컨테이너
-                with st.container():
-                    # 종목명 및 티커
-                    st.subheader(f"{row['ticker']}")
-                    st.caption(f"{row['name']} | {row['type']}")
-
-                    # 가격 정보
-                    if row['price'] is not None:
-                        # 현재가
-                        st.metric(
-                            label="현재가 (USD)",
-                            value=utils.format_price(row['price'], "USD"),
-                            delta=utils.format_percent(row['change_percent'])
-                        )
-
-                        # 원화 환산 가격
-                        krw_price = utils.convert_usd_to_krw(row['price'], exchange_rate)
-                        st.caption(f"원화 환산: {utils.format_price(krw_price, 'KRW')}")
-
-                        # 추가 정보
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("등락액", utils.format_price(row['change'], "USD"))
-                        with col2:
-                            st.metric("배당률", utils.format_ratio(row['dividend_yield']))
-                        with col3:
-                            st.metric("목표 비중", utils.format_ratio(row['target_ratio']))
-                    else:
-                        st.warning("⚠️ 데이터를 불러올 수 없습니다.")
-
-                    st.markdown("---")
-
-        # 포트폴리오 요약 테이블
-        st.subheader("📊 미국 직투 포트폴리오 요약")
-
-        summary_df = direct_data[['ticker', 'name', 'price', 'change_percent', 'dividend_yield', 'target_ratio']].copy()
-        summary_df.columns = ['티커', '종목명', '현재가 (USD)', '등락률 (%)', '배당률 (%)', '목표 비중 (%)']
-
-        # 포맷팅 함수 (None 처리 포함)
-        def format_usd_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"${val:.2f}"
-
-        def format_percent_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"{val:+.2f}"
-
-        def format_dividend_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"{val:.2f}"
-
-        def format_ratio_safe(val):
-            if val is None or pd.isna(val):
-                return "N/A"
-            return f"{val:.1f}"
-
-        # 포맷팅 적용
-        st.dataframe(
-            summary_df.style.format({
-                '현재가 (USD)': format_usd_safe,
-                '등락률 (%)': format_percent_safe,
-                '배당률 (%)': format_dividend_safe,
-                '목표 비중 (%)': format_ratio_safe
-            }),
-            width='stretch',
-            hide_index=True
-        )
 
-    # 임시 관심 종목 섹션
+@st.fragment
+def render_temp_watchlist_direct():
+    """미국 직투 임시 관심 종목 (삭제 버튼은 이 영역만 다시 실행, CSV에 저장하면 관심 종목 표도 갱신)"""
     st.markdown("---")
     st.subheader("⭐ 임시 관심 종목")
+    show_saved_message(async_fetcher.DIRECT)
 
     if len(st.session_state.temp_watchlist_direct) == 0:
         st.info("💡 HOT 종목 탭에서 종목을 추가해보세요!")
@@ -520,9 +738,8 @@ with tab_direct:
 
                 with col4:
                     # 삭제 버튼
-                    if st.button("🗑️", key=f"remove_direct_{idx}", help="임시 워치리스트에서 제거"):
-                        st.session_state.temp_watchlist_direct.pop(idx)
-                        st.rerun()
+                    st.button("🗑️", key=f"remove_direct_{idx}", help="임시 워치리스트에서 제거",
+                              on_click=remove_temp_item, args=('temp_watchlist_direct', idx))
 
                 # 영구 저장 기능 (CSV 추가)
                 with st.expander("💾 영구 저장 (CSV에 추가)"):
@@ -536,24 +753,20 @@ with tab_direct:
                     )
 
                     if st.button("CSV에 저장", key=f"save_direct_{idx}"):
-                        # CSV에 추가
-                        import csv
-                        with open(config.DIRECT_WATCHLIST_PATH, 'a', newline='', encoding='utf-8') as f:
-                            writer = csv.writer(f)
-                            writer.writerow([
-                                item['ticker'],
-                                item['name'],
-                                item['type'],
-                                target_ratio
-                            ])
-                        st.success(f"✅ {item['ticker']}이(가) CSV에 저장되었습니다!")
-                        st.info("📝 캐시를 새로고침하려면 사이드바의 '데이터 새로고침' 버튼을 클릭하세요.")
+                        # CSV에 추가하고 새 종목 시세만 조회
+                        save_to_watchlist(async_fetcher.DIRECT, {
+                            'ticker': item['ticker'],
+                            'name': item['name'],
+                            'type': item['type'],
+                            'target_ratio': target_ratio
+                        }, f"✅ {item['ticker']}이(가) CSV에 저장되었습니다!")
 
                 st.markdown("---")
 
 
 # ==================== HOT 종목 Top 10 탭 ====================
-with tab_hot:
+def render_hot_tab():
+    """HOT 종목 탭 (기간별 미국 주식 / 한국 ETF 상승률 순위)"""
     st.header("🔥 HOT 종목 Top 10")
     st.caption("상승률 기준 인기 종목 (클릭하여 임시 워치리스트에 추가)")
 
@@ -567,6 +780,7 @@ with tab_hot:
 
     period_map = {"일일": "1d", "주간": "5d", "월간": "1mo"}
     selected_period = period_map[period_option]
+    hot_data = get_data(async_fetcher.HOT)
 
     st.markdown("---")
 
@@ -575,99 +789,105 @@ with tab_hot:
 
     # 미국 HOT 주식
     with col_us:
-        st.subheader("🇺🇸 미국 HOT 주식 (S&P 500 주요 종목)")
+        universe_label = HOT_US_UNIVERSE_LABELS.get(config.HOT_US_UNIVERSE, config.HOT_US_UNIVERSE)
+        st.subheader(f"🇺🇸 미국 HOT 주식 ({universe_label})")
 
-        with st.spinner("미국 HOT 주식 데이터 로딩 중..."):
-            hot_us_data = load_hot_us_data(period=selected_period)
-
-        if hot_us_data.empty:
-            st.warning("⚠️ 데이터를 불러올 수 없습니다.")
-        else:
-            for idx, row in hot_us_data.iterrows():
-                with st.container():
-                    col1, col2, col3 = st.columns([3, 2, 1])
-
-                    with col1:
-                        st.markdown(f"**{idx + 1}. {row['ticker']}** - {row['name']}")
-
-                    with col2:
-                        change_color = "🔴" if row['change_percent'] < 0 else "🟢"
-                        st.markdown(f"{change_color} **{row['change_percent']:+.2f}%**")
-
-                    with col3:
-                        # 임시 워치리스트에 추가 버튼
-                        if st.button("➕", key=f"add_us_{row['ticker']}", help="미국 직투 임시 워치리스트에 추가"):
-                            # 중복 체크
-                            if row['ticker'] not in [item['ticker'] for item in st.session_state.temp_watchlist_direct]:
-                                st.session_state.temp_watchlist_direct.append({
-                                    'ticker': row['ticker'],
-                                    'name': row['name'],
-                                    'type': '임시 종목',
-                                    'price': row['price'],
-                                    'change_percent': row['change_percent'],
-                                    'dividend_yield': row['dividend_yield'],
-                                    'currency': 'USD'
-                                })
-                                st.success(f"✅ {row['ticker']} 추가됨!")
-                                st.rerun()
-                            else:
-                                st.warning("이미 추가된 종목입니다.")
-
-                    st.caption(f"가격: ${row['price']:.2f} | 배당률: {row['dividend_yield']:.2f}%")
-                    st.markdown("---")
+        render_hot_us_list(hot_data['hot_us'][selected_period])
 
     # 한국 HOT ETF
     with col_kr:
         st.subheader("🇰🇷 한국 HOT ETF")
 
-        with st.spinner("한국 HOT ETF 데이터 로딩 중..."):
-            hot_kr_data = load_hot_kr_data(period=selected_period)
+        render_hot_kr_list(hot_data['hot_kr'][selected_period])
 
-        if hot_kr_data.empty:
-            st.warning("⚠️ 데이터를 불러올 수 없습니다.")
-        else:
-            for idx, row in hot_kr_data.iterrows():
-                with st.container():
-                    col1, col2, col3 = st.columns([3, 2, 1])
-
-                    with col1:
-                        st.markdown(f"**{idx + 1}. {row['ticker']}** - {row['name']}")
-
-                    with col2:
-                        change_color = "🔴" if row['change_percent'] < 0 else "🟢"
-                        st.markdown(f"{change_color} **{row['change_percent']:+.2f}%**")
-
-                    with col3:
-                        # 임시 워치리스트에 추가 버튼
-                        if st.button("➕", key=f"add_kr_{row['ticker']}", help="ISA 임시 워치리스트에 추가"):
-                            # 중복 체크
-                            if row['ticker'] not in [item['ticker'] for item in st.session_state.temp_watchlist_isa]:
-                                st.session_state.temp_watchlist_isa.append({
-                                    'ticker': row['ticker'],
-                                    'name': row['name'],
-                                    'type': '임시 종목',
-                                    'price': row['price'],
-                                    'change_percent': row['change_percent'],
-                                    'dividend_yield': 0,
-                                    'currency': 'KRW'
-                                })
-                                st.success(f"✅ {row['name']} 추가됨!")
-                                st.rerun()
-                            else:
-                                st.warning("이미 추가된 종목입니다.")
 
-                    st.caption(f"가격: ₩{row['price']:,.0f}")
-                    st.markdown("---")
+@st.fragment
+def render_hot_us_list(hot_us_df):
+    """미국 HOT 주식 목록 (➕ 버튼은 이 목록만 다시 실행)"""
+    if hot_us_df.empty:
+        st.warning("⚠️ 데이터를 불러올 수 없습니다.")
+    else:
+        for idx, row in hot_us_df.iterrows():
+            with st.container():
+                col1, col2, col3 = st.columns([3, 2, 1])
+
+                with col1:
+                    st.markdown(f"**{idx + 1}. {row['ticker']}** - {row['name']}")
+
+                with col2:
+                    change_color = "🔴" if row['change_percent'] < 0 else "🟢"
+                    st.markdown(f"{change_color} **{row['change_percent']:+.2f}%**")
+
+                with col3:
+                    # 임시 워치리스트에 추가 버튼
+                    if st.button("➕", key=f"add_us_{row['ticker']}", help="미국 직투 임시 워치리스트에 추가"):
+                        # 중복 체크
+                        if row['ticker'] not in [item['ticker'] for item in st.session_state.temp_watchlist_direct]:
+                            st.session_state.temp_watchlist_direct.append({
+                                'ticker': row['ticker'],
+                                'name': row['name'],
+                                'type': '임시 종목',
+                                'price': row['price'],
+                                'change_percent': row['change_percent'],
+                                'dividend_yield': row['dividend_yield'],
+                                'currency': 'USD'
+                            })
+                            st.success(f"✅ {row['ticker']} 추가됨!")
+                            refresh_temp_watchlist(TAB_DIRECT)
+                        else:
+                            st.warning("이미 추가된 종목입니다.")
+
+                st.caption(f"가격: ${row['price']:.2f} | 배당률: {row['dividend_yield']:.2f}%")
+                st.markdown("---")
+
+
+@st.fragment
+def render_hot_kr_list(hot_kr_df):
+    """한국 HOT ETF 목록 (➕ 버튼은 이 목록만 다시 실행)"""
+    if hot_kr_df.empty:
+        st.warning("⚠️ 데이터를 불러올 수 없습니다.")
+    else:
+        for idx, row in hot_kr_df.iterrows():
+            with st.container():
+                col1, col2, col3 = st.columns([3, 2, 1])
+
+                with col1:
+                    st.markdown(f"**{idx + 1}. {row['ticker']}** - {row['name']}")
+
+                with col2:
+                    change_color = "🔴" if row['change_percent'] < 0 else "🟢"
+                    st.markdown(f"{change_color} **{row['change_percent']:+.2f}%**")
+
+                with col3:
+                    # 임시 워치리스트에 추가 버튼
+                    if st.button("➕", key=f"add_kr_{row['ticker']}", help="ISA 임시 워치리스트에 추가"):
+                        # 중복 체크
+                        if row['ticker'] not in [item['ticker'] for item in st.session_state.temp_watchlist_isa]:
+                            st.session_state.temp_watchlist_isa.append({
+                                'ticker': row['ticker'],
+                                'name': row['name'],
+                                'type': '임시 종목',
+                                'price': row['price'],
+                                'change_percent': row['change_percent'],
+                                'dividend_yield': 0,
+                                'currency': 'KRW'
+                            })
+                            st.success(f"✅ {row['name']} 추가됨!")
+                            refresh_temp_watchlist(TAB_ISA)
+                        else:
+                            st.warning("이미 추가된 종목입니다.")
+
+                st.caption(f"가격: ₩{row['price']:,.0f}")
+                st.markdown("---")
 
 
 # ==================== 전체 요약 탭 ====================
-with tab_summary:
+def render_summary_tab():
+    """전체 요약 탭 (계좌별 관심 종목, 포트폴리오 평가)"""
     st.header("📈 전체 포트폴리오 요약")
 
-    # 데이터 로드
-    with st.spinner("데이터를 불러오는 중..."):
-        isa_data = load_isa_data()
-        direct_data = load_direct_data()
+    isa_data = get_data(async_fetcher.ISA)
+    direct_data = get_data(async_fetcher.DIRECT)
 
     # 통합 요약
     col1, col2, col3 = st.columns(3)
@@ -699,12 +919,79 @@ with tab_summary:
 
     st.markdown("---")
 
+    # 포트폴리오 평가 (CSV의 shares / avg_price 컬럼 사용)
+    st.subheader("💰 포트폴리오 평가")
+    valuation = portfolio.value_portfolio({
+        portfolio.ISA_ACCOUNT: (isa_data, data_fetcher.load_watchlist(str(config.ISA_WATCHLIST_PATH))),
+        portfolio.DIRECT_ACCOUNT: (direct_data, data_fetcher.load_watchlist(str(config.DIRECT_WATCHLIST_PATH)))
+    }, exchange_rate)
+    positions = valuation['positions']
+    account_summary = valuation['summary']
+
+    if positions.empty or not (positions['shares'] > 0).any():
+        st.caption("💡 관심 종목 CSV에 `shares`(보유 수량), `avg_price`(평균 매입가) 컬럼을 추가하면 "
+                   "평가액, 손익, 예상 배당금이 계산됩니다.")
+    else:
+        total = account_summary.loc['전체']
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("총 평가액", f"₩{total['market_value_krw']:,.0f}")
+        with col2:
+            st.metric(
+                "총 손익",
+                f"₩{total['pnl_krw']:,.0f}",
+                utils.format_percent(total['return_pct']) if pd.notna(total['return_pct']) else None
+            )
+        with col3:
+            st.metric("월 예상 배당금 (세후)", f"₩{total['monthly_dividend_krw']:,.0f}")
+
+        st.caption(f"환율 {exchange_rate:,.2f}원 기준 | 세후 배당: 미국 원천징수 15% + 국내 과세, "
+                   f"ISA는 비과세 한도(₩{config.ISA_TAX_FREE_LIMIT:,}) 초과분만 {config.ISA_EXCESS_TAX * 100:.1f}% 과세 가정")
+        if total['unpriced'] > 0:
+            st.warning(f"⚠️ 시세를 가져오지 못한 보유 종목 {int(total['unpriced'])}개는 평가액, 손익, 수익률에서 제외했습니다.")
+
+        # 계좌별 요약
+        display_summary = account_summary[['market_value_krw', 'cost_basis_krw', 'pnl_krw', 'return_pct',
+                                           'after_tax_dividend_krw', 'monthly_dividend_krw']].copy()
+        display_summary.index.name = '계좌'
+        display_summary.columns = ['평가액 (원)', '매입액 (원)', '손익 (원)', '수익률 (%)', '연 배당 세후 (원)', '월 배당 세후 (원)']
+        st.dataframe(
+            display_summary.style.format({
+                '평가액 (원)': '{:,.0f}',
+                '매입액 (원)': '{:,.0f}',
+                '손익 (원)': '{:+,.0f}',
+                '수익률 (%)': '{:+.2f}',
+                '연 배당 세후 (원)': '{:,.0f}',
+                '월 배당 세후 (원)': '{:,.0f}'
+            }, na_rep='-'),
+            width='stretch'
+        )
+
+        # 종목별 평가 (목표 비중 대비)
+        display_positions = positions[['account', 'ticker', 'name', 'shares', 'market_value_krw', 'pnl_krw',
+                                       'return_pct', 'weight', 'target_ratio', 'weight_gap', 'monthly_dividend_krw']].copy()
+        display_positions.columns = ['계좌', '종목', '종목명', '수량', '평가액 (원)', '손익 (원)', '수익률 (%)',
+                                     '현재 비중 (%)', '목표 비중 (%)', '비중 차이 (%p)', '월 배당 세후 (원)']
+        st.dataframe(
+            display_positions.style.format({
+                '수량': '{:,.0f}',
+                '평가액 (원)': '{:,.0f}',
+                '손익 (원)': '{:+,.0f}',
+                '수익률 (%)': '{:+.2f}',
+                '현재 비중 (%)': '{:.1f}',
+                '목표 비중 (%)': '{:.1f}',
+                '비중 차이 (%p)': '{:+.1f}',
+                '월 배당 세후 (원)': '{:,.0f}'
+            }, na_rep='-'),
+            width='stretch',
+            hide_index=True
+        )
+
+    st.markdown("---")
+
     # 향후 기능 안내
     st.info("""
     💡 **향후 추가 예정 기능**
-    - 실제 보유 수량 입력 및 포트폴리오 평가액
-    - 총 수익률 계산
-    - 월 예상 배당금 계산
     - 리밸런싱 추천
     - 배당 캘린더
     - 금융 뉴스 큐레이션
@@ -712,6 +999,32 @@ with tab_summary:
     """)
 
 
+# ==================== 탭 구성 ====================
+# 탭 이름: (렌더링 함수, 필요한 데이터셋)
+TABS = {
+    TAB_ISA: (render_isa_tab, [async_fetcher.ISA]),
+    TAB_DIRECT: (render_direct_tab, [async_fetcher.DIRECT]),
+    TAB_HOT: (render_hot_tab, [async_fetcher.HOT]),
+    TAB_SUMMARY: (render_summary_tab, [async_fetcher.ISA, async_fetcher.DIRECT]),
+}
+
+if config.LAZY_TABS_ENABLED:
+    # st.tabs는 모든 탭 본문을 매번 실행하므로, 선택한 탭만 렌더링하고
+    # 나머지 탭 데이터는 화면을 그린 뒤 백그라운드에서 미리 조회
+    active_tab = st.radio("탭 선택", list(TABS), horizontal=True, key="active_tab", label_visibility="collapsed")
+    render_tab, active_datasets = TABS[active_tab]
+    render_tab()
+
+    if config.TAB_PREFETCH_ENABLED:
+        async_fetcher.prefetch_datasets([
+            name for _, datasets in TABS.values() for name in datasets if name not in active_datasets
+        ])
+else:
+    for tab, (render_tab, _) in zip(st.tabs(list(TABS)), TABS.values()):
+        with tab:
+            render_tab()
+
+
 # 푸터
 st.markdown("---")
 st.caption("📊 투자 대시보드 v0.1 | 개인 투자 참고용 | 투자 결정은 본인 책임입니다.")
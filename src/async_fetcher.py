@@ -0,0 +1,381 @@
+"""
+비동기 데이터 수집 모듈
+data_fetcher의 동기 함수들을 asyncio로 감싸서 여러 데이터셋을 동시에 가져옵니다.
+데이터 제공자(yfinance, FinanceDataReader)별로 동시 요청 수를 제한합니다.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+import pandas as pd
+import config
+import data_fetcher
+import fx_service
+import quote_store
+from resilience import YFINANCE, FDR
+from singleflight import SingleFlight
+
+
+class ProviderLimiter:
+    """
+    데이터 제공자별 asyncio 세마포어 묶음과 동기 함수를 실행할 전용 스레드 풀.
+
+    세마포어는 이벤트 루프에 묶이므로 load_dashboard 실행마다 새로 만듭니다.
+    루프 기본 실행기를 쓰면 asyncio.run이 끝날 때 남은 작업을 모두 기다리므로
+    전용 스레드 풀을 쓰고, 로드가 끝나면 shutdown으로 기다리지 않고 정리합니다.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        limits = limits or config.PROVIDER_CONCURRENCY
+        self._semaphores = {provider: asyncio.Semaphore(limit) for provider, limit in limits.items()}
+        self._executor = ThreadPoolExecutor(max_workers=sum(limits.values()), thread_name_prefix='provider')
+
+    async def run(self, provider: str, func: Callable, *args, executor: Optional[ThreadPoolExecutor] = None,
+                  **kwargs) -> Any:
+        """
+        provider 세마포어를 잡은 상태로 동기 함수를 스레드에서 실행합니다.
+
+        Args:
+            provider: 데이터 제공자 이름 (YFINANCE, FDR)
+            func: 실행할 동기 함수
+            *args, **kwargs: func 인자
+            executor: 실행할 스레드 풀 (None이면 limiter 전용 스레드 풀)
+
+        Returns:
+            func 반환값
+        """
+        async with self._semaphores[provider]:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor or self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """전용 스레드 풀을 정리합니다 (진행 중인 작업은 기다리지 않고, 대기 중인 작업은 취소)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def enrich_watchlist_async(limiter: ProviderLimiter, watchlist_df: pd.DataFrame, is_us: bool = False,
+                                 timeout: float = config.FETCH_BATCH_TIMEOUT) -> pd.DataFrame:
+    """
+    enrich_watchlist_with_data의 비동기 버전.
+
+    종목별 조회를 제공자 세마포어 안에서 동시에 실행하고, timeout 안에 끝나지 않은
+    종목은 조회 실패와 같은 기본값 행으로 채웁니다. 행 순서와 스키마는 동기 버전과 같습니다.
+    조회는 배치 전용 스레드 풀에서 실행하고 제한 시간이 지나면 기다리지 않고 정리하므로
+    느린 종목이 있어도 timeout 안에 반환합니다.
+
+    Args:
+        limiter: 제공자별 동시 요청 제한
+        watchlist_df: 관심 종목 DataFrame
+        is_us: 미국 주식 여부
+        timeout: 전체 조회 제한 시간 (초)
+
+    Returns:
+        데이터가 추가된 DataFrame
+    """
+    provider = YFINANCE if is_us else FDR
+    market = quote_store.US if is_us else quote_store.KR
+    rows = [row for _, row in watchlist_df.iterrows()]
+
+    if not rows:
+        return pd.DataFrame()
+
+    executor = ThreadPoolExecutor(max_workers=min(config.FETCH_MAX_WORKERS, len(rows)),
+                                  thread_name_prefix='watchlist')
+
+    async def fetch_one(row):
+        try:
+            return await limiter.run(provider, data_fetcher.get_quote, str(row['ticker']), market, executor=executor)
+        except Exception as e:
+            print(f"⚠️ {row['ticker']} 데이터 가져오기 실패: {e}")
+            return None
+
+    tasks = [asyncio.ensure_future(fetch_one(row)) for row in rows]
+    try:
+        await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        # 제한 시간을 넘긴 조회는 기다리지 않음 (실행 중인 스레드는 끝나면 스스로 종료)
+        executor.shutdown(wait=False, cancel_futures=True)
+    for row, task in zip(rows, tasks):
+        if not task.done():
+            task.cancel()
+            print(f"⚠️ {row['ticker']} 조회 제한 시간({timeout}초) 초과")
+
+    results = [task.result() if task.done() and not task.cancelled() else None for task in tasks]
+    enriched_data = [data_fetcher.build_enriched_row(row, data, is_us) for row, data in zip(rows, results)]
+
+    return pd.DataFrame(enriched_data)
+
+
+async def _load_watchlist_data(limiter: ProviderLimiter, file_path: str, is_us: bool) -> pd.DataFrame:
+    """CSV 워치리스트를 읽고 시세를 채웁니다 (워치리스트가 비어 있으면 빈 DataFrame)."""
+    watchlist = data_fetcher.load_watchlist(file_path)
+    if watchlist.empty:
+        return pd.DataFrame()
+    return await enrich_watchlist_async(limiter, watchlist, is_us=is_us)
+
+
+def _fetch_hot_us_all(limit: int) -> Dict[str, pd.DataFrame]:
+    """미국 후보 종목 수익률을 한 번 계산한 뒤 모든 기간의 순위를 뽑습니다."""
+    data_fetcher.compute_us_returns()
+    return {period: data_fetcher.fetch_hot_us_stocks(period=period, limit=limit)
+            for period in data_fetcher.HOT_PERIODS}
+
+
+def _fetch_hot_kr_all(limit: int) -> Dict[str, pd.DataFrame]:
+    """한국 ETF 수익률을 한 번 계산한 뒤 모든 기간의 순위를 뽑습니다."""
+    data_fetcher.compute_kr_etf_returns()
+    return {period: data_fetcher.fetch_hot_kr_etfs(period=period, limit=limit)
+            for period in data_fetcher.HOT_PERIODS}
+
+
+# 데이터셋 이름 (탭별 지연 로드 단위)
+ISA = 'isa'
+DIRECT = 'direct'
+EXCHANGE_RATE = 'exchange_rate'
+HOT = 'hot'
+DATASETS = [ISA, DIRECT, EXCHANGE_RATE, HOT]
+
+# 관심 종목 데이터셋: (CSV 경로, 미국 주식 여부)
+WATCHLISTS = {
+    ISA: (config.ISA_WATCHLIST_PATH, False),
+    DIRECT: (config.DIRECT_WATCHLIST_PATH, True),
+}
+
+
+async def _load_hot(limiter: ProviderLimiter, hot_limit: int) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """HOT 미국 주식 / 한국 ETF 순위를 모든 기간에 대해 동시에 가져옵니다."""
+    hot_us, hot_kr = await asyncio.gather(
+        limiter.run(YFINANCE, _fetch_hot_us_all, hot_limit),
+        limiter.run(FDR, _fetch_hot_kr_all, hot_limit)
+    )
+    return {'hot_us': hot_us, 'hot_kr': hot_kr}
+
+
+async def _load_dataset(limiter: ProviderLimiter, name: str, hot_limit: int) -> Any:
+    """데이터셋 하나를 가져옵니다 (name: DATASETS 중 하나)."""
+    if name in WATCHLISTS:
+        file_path, is_us = WATCHLISTS[name]
+        return await _load_watchlist_data(limiter, str(file_path), is_us=is_us)
+    if name == EXCHANGE_RATE:
+        return await limiter.run(YFINANCE, fx_service.get_rate)
+    if name == HOT:
+        return await _load_hot(limiter, hot_limit)
+    raise ValueError(f"알 수 없는 데이터셋: {name}")
+
+
+async def load_dataset_async(name: str, hot_limit: int = 10) -> Any:
+    """
+    데이터셋 하나만 가져옵니다 (활성 탭에 필요한 데이터만 조회할 때 사용).
+
+    Args:
+        name: ISA, DIRECT, EXCHANGE_RATE, HOT
+        hot_limit: HOT 종목 개수
+
+    Returns:
+        ISA / DIRECT: DataFrame, EXCHANGE_RATE: float,
+        HOT: {'hot_us': {period: DataFrame}, 'hot_kr': {period: DataFrame}}
+    """
+    limiter = ProviderLimiter()
+    try:
+        return await _load_dataset(limiter, name, hot_limit)
+    finally:
+        limiter.shutdown()
+
+
+async def load_dashboard_async(hot_limit: int = 10) -> Dict[str, Any]:
+    """
+    대시보드 전체 탭 데이터를 동시에 가져옵니다.
+
+    전체 소요 시간은 각 데이터셋 시간의 합이 아니라 가장 느린 데이터셋에 가까워집니다.
+
+    Args:
+        hot_limit: HOT 종목 개수
+
+    Returns:
+        {
+            'isa': DataFrame,
+            'direct': DataFrame,
+            'exchange_rate': float,
+            'hot_us': {period: DataFrame},
+            'hot_kr': {period: DataFrame}
+        }
+    """
+    limiter = ProviderLimiter()
+    try:
+        isa, direct, exchange_rate, hot = await asyncio.gather(
+            *[_load_dataset(limiter, name, hot_limit) for name in DATASETS]
+        )
+    finally:
+        limiter.shutdown()
+
+    return {
+        'isa': isa,
+        'direct': direct,
+        'exchange_rate': exchange_rate,
+        'hot_us': hot['hot_us'],
+        'hot_kr': hot['hot_kr']
+    }
+
+
+def run(coro) -> Any:
+    """
+    동기 코드(Streamlit 스크립트 등)에서 코루틴을 실행합니다.
+
+    이미 이벤트 루프가 돌고 있는 스레드에서 호출되면 별도 스레드에서 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result = {}
+
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=runner)
+    thread.start()
+    thread.join()
+
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+# 대시보드 전체 로드 요청 병합 (여러 세션이 동시에 로드해도 한 번만 실행)
+_dashboard_flights = SingleFlight('dashboard')
+
+
+def load_dashboard(hot_limit: int = 10) -> Dict[str, Any]:
+    """
+    load_dashboard_async의 동기 버전.
+
+    여러 세션이 동시에 호출하면 하나의 로드를 기다렸다가 결과를 함께 사용합니다.
+    """
+    return _dashboard_flights.do(hot_limit, lambda: run(load_dashboard_async(hot_limit=hot_limit)))
+
+
+# 데이터셋별 로드 요청 병합
+_dataset_flights = SingleFlight('dataset')
+
+
+def load_dataset(name: str, hot_limit: int = 10) -> Any:
+    """
+    load_dataset_async의 동기 버전.
+
+    여러 세션(또는 백그라운드 미리 조회)이 같은 데이터셋을 동시에 요청하면 한 번만 조회합니다.
+    """
+    return _dataset_flights.do((name, hot_limit), lambda: run(load_dataset_async(name, hot_limit=hot_limit)))
+
+
+# 보이지 않는 탭의 데이터셋 미리 조회 (활성 탭 렌더링을 막지 않도록 별도 스레드)
+_prefetch_executor = ThreadPoolExecutor(max_workers=len(DATASETS), thread_name_prefix='dataset-prefetch')
+_prefetches: Dict[tuple, Future] = {}
+_prefetched_at: Dict[tuple, float] = {}
+_prefetch_lock = threading.Lock()
+
+
+def _prefetch_one(name: str, hot_limit: int) -> None:
+    try:
+        load_dataset(name, hot_limit=hot_limit)
+        _prefetched_at[(name, hot_limit)] = time.time()
+    except Exception as e:
+        print(f"⚠️ {name} 데이터 미리 조회 실패: {e}")
+
+
+def prefetch_datasets(names: List[str], hot_limit: int = 10) -> None:
+    """
+    데이터셋을 백그라운드에서 미리 조회해 캐시를 데워 둡니다 (기다리지 않고 바로 반환).
+
+    이미 진행 중이거나 CACHE_TTL 안에 미리 조회한 데이터셋은 건너뜁니다.
+
+    Args:
+        names: 데이터셋 이름 리스트 (DATASETS 중)
+        hot_limit: HOT 종목 개수
+    """
+    with _prefetch_lock:
+        for name in names:
+            key = (name, hot_limit)
+            running = key in _prefetches and not _prefetches[key].done()
+            if running or time.time() - _prefetched_at.get(key, 0) < config.CACHE_TTL:
+                continue
+            _prefetches[key] = _prefetch_executor.submit(_prefetch_one, name, hot_limit)
+
+
+def wait_for_prefetch(timeout: Optional[float] = None) -> None:
+    """진행 중인 미리 조회가 끝날 때까지 기다립니다 (벤치마크에서 측정 사이에 사용)."""
+    with _prefetch_lock:
+        futures = list(_prefetches.values())
+    wait(futures, timeout=timeout)
+
+
+def clear_prefetch_history() -> None:
+    """미리 조회 기록을 지웁니다 (다음 요청 때 다시 미리 조회)."""
+    with _prefetch_lock:
+        _prefetched_at.clear()
+
+
+def _forget_prefetch(name: str) -> None:
+    """데이터셋의 미리 조회 기록을 지웁니다 (다음 요청 때 다시 미리 조회)."""
+    with _prefetch_lock:
+        for key in [key for key in _prefetched_at if key[0] == name]:
+            del _prefetched_at[key]
+
+
+def refresh_dataset(name: str, hot_limit: int = 10) -> None:
+    """
+    데이터셋 하나의 원본 데이터만 캐시를 무시하고 새로 조회합니다.
+
+    관심 종목은 그 워치리스트 종목만, 환율은 환율만, HOT은 순위만 새로 조회하며
+    다른 데이터셋의 캐시는 그대로 둡니다. 이후 load_dataset은 새로 조회한 값으로 만들어집니다.
+
+    Args:
+        name: ISA, DIRECT, EXCHANGE_RATE, HOT
+        hot_limit: HOT 종목 개수
+
+    Examples:
+        >>> refresh_dataset(HOT)  # 관심 종목 / 환율 캐시는 유지
+    """
+    if name in WATCHLISTS:
+        file_path, is_us = WATCHLISTS[name]
+        data_fetcher.refresh_watchlist(str(file_path), is_us)
+    elif name == EXCHANGE_RATE:
+        fx_service.refresh()
+    elif name == HOT:
+        data_fetcher.compute_us_returns.refresh()
+        data_fetcher.refresh_kr_etf_returns()
+        for period in data_fetcher.HOT_PERIODS:
+            data_fetcher.fetch_hot_us_stocks.refresh(period=period, limit=hot_limit)
+            data_fetcher.fetch_hot_kr_etfs.refresh(period=period, limit=hot_limit)
+    else:
+        raise ValueError(f"알 수 없는 데이터셋: {name}")
+    _forget_prefetch(name)
+
+
+def add_to_watchlist(name: str, row: Dict) -> Dict:
+    """
+    관심 종목 CSV에 종목을 추가하고 그 종목 시세만 새로 조회합니다.
+
+    새 시세는 시세 저장소에 들어가므로, 다음 load_dataset은 기존 종목을 저장소에서 읽고
+    새 종목만 합쳐 관심 종목 표를 만듭니다 (기존 종목은 다시 조회하지 않음).
+
+    Args:
+        name: ISA 또는 DIRECT
+        row: CSV에 추가할 행 (ticker, name, type, target_ratio 등)
+
+    Returns:
+        enrich_watchlist_with_data 스키마의 새 행
+    """
+    file_path, is_us = WATCHLISTS[name]
+    data_fetcher.append_to_watchlist(str(file_path), row)
+
+    market = quote_store.US if is_us else quote_store.KR
+    quote = data_fetcher.refresh_ticker(row['ticker'], market)
+    _forget_prefetch(name)
+    return data_fetcher.build_enriched_row(pd.Series(row), quote, is_us)
@@ -14,10 +14,59 @@ DATA_DIR = PROJECT_ROOT / "data"
 ISA_WATCHLIST_PATH = DATA_DIR / "isa_watchlist.csv"
 DIRECT_WATCHLIST_PATH = DATA_DIR / "direct_watchlist.csv"
 
+# 로컬 캐시 경로 (재시작 후에도 유지되는 데이터)
+CACHE_DIR = DATA_DIR / "cache"
+US_METADATA_PATH = CACHE_DIR / "us_metadata.csv"
+PRICE_STORE_DIR = CACHE_DIR / "ohlcv"  # 종목별 일봉 저장 폴더
+PERSISTENT_CACHE_PATH = CACHE_DIR / "quote_cache.sqlite3"  # 조회 결과 영구 캐시
+METRICS_EXPORT_PATH = CACHE_DIR / "metrics.prom"  # 성능 지표 Prometheus 텍스트 파일
+PROVIDER_RECORDINGS_DIR = Path(os.getenv("DASHBOARD_RECORDINGS_DIR", DATA_DIR / "recordings"))  # 기록/재생 응답 폴더
+
+# 데이터 제공자 설정 (환경 변수로 변경 가능)
+PROVIDER_MODE = os.getenv("DASHBOARD_PROVIDER_MODE", "live")  # live: 실제 API / record: 실제 API + 응답 기록 / replay: 기록된 응답만 사용
+REPLAY_LATENCY = float(os.getenv("DASHBOARD_REPLAY_LATENCY", "0"))  # 재생 시 호출마다 넣을 지연 시간 (초)
+REPLAY_LATENCY_JITTER = float(os.getenv("DASHBOARD_REPLAY_JITTER", "0"))  # 재생 지연에 더할 임의 시간 상한 (초)
+
 # API 설정
 CACHE_TTL = 300  # 캐시 유효 시간 (초) - 5분
+BACKGROUND_PREFETCH_ENABLED = True  # 백그라운드에서 캐시 만료 전에 데이터 미리 갱신
+PREFETCH_INTERVAL = CACHE_TTL - 60  # 백그라운드 갱신 간격 (초) - 캐시 만료 1분 전
+MARKET_HOURS_TTL_ENABLED = True  # 장이 닫혀 있는 동안(야간, 주말, 휴장일) 시세 캐시를 다음 개장까지 유지
+MARKET_CLOSE_GRACE = 1800  # 장 마감 후 종가 확정까지 짧은 유효 시간(CACHE_TTL)을 유지하는 시간 (초) - 30분
 REQUEST_TIMEOUT = 10  # API 요청 타임아웃 (초)
 MAX_RETRIES = 3  # API 요청 재시도 횟수
+RETRY_BACKOFF_BASE = 0.5  # 재시도 대기 시간 기준 (초) - 0.5, 1, 2... 범위에서 임의 대기
+RETRY_BACKOFF_MAX = 4  # 재시도 최대 대기 시간 (초)
+CIRCUIT_FAILURE_THRESHOLD = 5  # 데이터 제공자 연속 실패 허용 횟수 (초과 시 요청 차단)
+CIRCUIT_RECOVERY_TIMEOUT = 30  # 요청 차단 후 복구 확인까지 대기 시간 (초)
+CIRCUIT_MAX_RECOVERY_TIMEOUT = 300  # 복구 확인 재시도 최대 간격 (초)
+FETCH_MAX_WORKERS = 8  # 워치리스트 동시 조회 스레드 수 (1이면 순차 조회)
+FETCH_BATCH_TIMEOUT = 30  # 워치리스트 일괄 조회 제한 시간 (초)
+PROVIDER_CONCURRENCY = {'yfinance': 8, 'fdr': 4}  # 데이터 제공자별 최대 동시 요청 수 (비동기 로드)
+BULK_DOWNLOAD_CHUNK_SIZE = 100  # yf.download 한 번에 요청할 티커 수
+BULK_DOWNLOAD_MAX_WORKERS = 4  # yf.download 묶음 동시 요청 수
+PERSISTENT_CACHE_ENABLED = True  # 조회 결과를 SQLite에 저장하여 재시작 후에도 사용
+PERSISTENT_CACHE_MAX_BYTES = 50 * 1024 * 1024  # 영구 캐시 최대 크기 (초과 시 오래된 항목부터 삭제)
+PRICE_HISTORY_START = '2024-01-01'  # 일봉 저장소 최초 다운로드 시작일
+PRICE_STORE_MIN_REFRESH = 60  # 일봉 저장소 신규 데이터 재확인 최소 간격 (초)
+FX_TTL = 300  # 환율 유효 시간 (초) - 외환 시장 거래 중
+FX_CLOSED_TTL = 3600  # 환율 유효 시간 (초) - 주말 외환 시장 휴장 중
+LISTING_TTL = 86400  # 한국 종목 목록(ETF/KR, KRX) 유효 시간 (초) - 1일
+US_METADATA_TTL = 86400  # 미국 종목 메타데이터(종목명, 배당률) 유효 시간 (초) - 1일
+SEARCH_KR_MARKETS = ('ETF/KR', 'KRX')  # 종목 검색 인덱스에 넣을 한국 종목 목록
+SEARCH_US_MARKETS = ('S&P500',)  # 종목 검색 인덱스에 넣을 미국 종목 목록 (FinanceDataReader 시장 코드)
+HOT_US_UNIVERSE = os.getenv("DASHBOARD_HOT_US_UNIVERSE", "S&P500")  # HOT 미국 주식 후보: FinanceDataReader 시장 코드(S&P500, NASDAQ 등) / MAJOR(주요 50종목) / CUSTOM(HOT_US_UNIVERSE_PATH)
+HOT_US_UNIVERSE_PATH = DATA_DIR / "hot_us_universe.csv"  # CUSTOM 후보 종목 CSV (ticker 컬럼, 예: 나스닥 100 구성 종목)
+SEARCH_MISS_TTL = 600  # 없는 티커 검색 결과를 기억하는 시간 (초) - 10분
+SEARCH_MISS_MAX_ENTRIES = 1000  # 검색 실패 캐시 최대 항목 수
+QUOTE_STORE_MAX_BYTES = 8 * 1024 * 1024  # 종목 시세 저장소(메모리) 최대 크기 (초과 시 오래 사용하지 않은 종목부터 삭제)
+
+# 성능 지표 설정
+METRICS_ENABLED = True  # 조회 지연 시간, 재시도, 캐시 적중률 수집
+METRICS_MAX_TRACKED_CALLS = 500  # 느린 호출 추적 최대 항목 수
+METRICS_EXPORT_INTERVAL = 60  # 성능 지표 파일 저장 간격 (초, None이면 저장 안 함)
+METRICS_HTTP_PORT = None  # 로컬 /metrics 엔드포인트 포트 (None이면 사용 안 함, 예: 9108)
+DEBUG_PANEL_ENABLED = True  # 사이드바에 성능 지표 디버그 패널 표시
 
 # 환율 설정 (기본값)
 DEFAULT_USD_KRW = 1320  # 원/달러 기본 환율
@@ -26,10 +75,14 @@ DEFAULT_USD_KRW = 1320  # 원/달러 기본 환율
 US_WITHHOLDING_TAX = 0.15  # 미국 배당 원천징수세 15%
 KR_DIVIDEND_TAX = 0.154  # 한국 배당소득세 15.4%
 ISA_TAX_FREE_LIMIT = 2000000  # ISA 비과세 한도 (원)
+ISA_EXCESS_TAX = 0.099  # ISA 비과세 한도 초과분 분리과세 9.9%
 
 # UI 설정
 STREAMLIT_THEME = "light"
 REFRESH_INTERVAL = 60  # 자동 새로고침 간격 (초) - 사용하지 않을 수도 있음
+LAZY_TABS_ENABLED = True  # 선택한 탭의 데이터만 먼저 불러오고 나머지 탭은 백그라운드에서 미리 조회 (False면 모든 탭을 한 번에 로드)
+TAB_PREFETCH_ENABLED = True  # 지연 로드 모드에서 선택한 탭을 그린 뒤 나머지 탭 데이터셋을 백그라운드에서 미리 조회
+STREAMING_WATCHLIST_ENABLED = True  # 관심 종목 카드를 시세가 도착하는 대로 하나씩 표시하고 요약 테이블은 마지막에 표시 (지연 로드 모드에서만)
 
 # 색상 설정
 COLOR_POSITIVE = "#00C853"  # 상승 색상 (초록)
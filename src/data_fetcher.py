@@ -3,18 +3,115 @@
 yfinance와 FinanceDataReader를 사용하여 ETF 데이터를 가져옵니다.
 """
 
-import yfinance as yf
-import FinanceDataReader as fdr
+import csv
+import os
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import re
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+import threading
 import time
 import config
+import fx_service
+import market_hours
+import metrics
+import persistent_cache
+import price_store
+import providers
+import quote_store
+import resilience
+import search_index
+import symbol_listing
 
 
+def _probe_yfinance() -> None:
+    """yfinance 복구 확인 (서킷이 열렸을 때 백그라운드에서 실행)"""
+    if providers.get(resilience.YFINANCE).get_recent_history('SPY', '5d').empty:
+        raise ValueError("SPY 시세 응답 없음")
+
+
+def _probe_fdr() -> None:
+    """FinanceDataReader 복구 확인 (서킷이 열렸을 때 백그라운드에서 실행)"""
+    start = (pd.Timestamp.today() - pd.Timedelta(days=10)).strftime('%Y-%m-%d')
+    if providers.get(resilience.FDR).get_history('069500', start).empty:
+        raise ValueError("069500 시세 응답 없음")
+
+
+resilience.register_probe(resilience.YFINANCE, _probe_yfinance)
+resilience.register_probe(resilience.FDR, _probe_fdr)
+
+
+def _get_ticker_info(ticker: str) -> Dict:
+    """yfinance 종목 info 딕셔너리를 가져옵니다."""
+    return providers.get(resilience.YFINANCE).get_info(ticker)
+
+
+def has_price(quote: Optional[Dict]) -> bool:
+    """시세 딕셔너리에 현재가가 있는지 확인합니다 (None이나 현재가 없는 응답은 조회 실패로 봄)."""
+    return quote is not None and quote.get('price') is not None and not pd.isna(quote['price'])
+
+
+def _fetch_us_quote(ticker: str) -> Dict:
+    """
+    yfinance로 미국 종목 시세를 한 번 조회합니다 (실패 시 예외).
+
+    Raises:
+        resilience.SymbolNotFoundError: 현재가를 찾을 수 없는 경우 (없는 티커 등)
+    """
+    provider = providers.get(resilience.YFINANCE)
+
+    # 기본 정보 가져오기
+    info = provider.get_info(ticker)
+
+    # 현재가
+    current_price = info.get('currentPrice') or info.get('regularMarketPrice')
+    if current_price is None:
+        # 최근 거래일 종가 사용
+        hist = provider.get_recent_history(ticker, '1d')
+        if not hist.empty:
+            current_price = hist['Close'].iloc[-1]
+    if current_price is None:
+        raise resilience.SymbolNotFoundError(f"{ticker} 현재가 없음")
+
+    # 전일 종가
+    previous_close = info.get('previousClose') or info.get('regularMarketPreviousClose')
+
+    # 등락액 및 등락률 계산
+    if current_price and previous_close:
+        change = current_price - previous_close
+        change_percent = (change / previous_close) * 100
+    else:
+        change = 0
+        change_percent = 0
+
+    # 배당률 (yfinance는 이미 퍼센트 형태로 제공: 8.15 = 8.15%)
+    dividend_yield = info.get('dividendYield')
+    if dividend_yield is None:
+        dividend_yield = 0
+
+    # 종목명
+    name = info.get('longName') or info.get('shortName') or ticker
+
+    return {
+        'ticker': ticker,
+        'name': name,
+        'price': current_price,
+        'change': change,
+        'change_percent': change_percent,
+        'dividend_yield': dividend_yield,
+        'currency': 'USD'
+    }
+
+
+@persistent_cache.cached(ttl=market_hours.ttl_policy(market_hours.NYSE))
 def fetch_us_etf_data(ticker: str, retries: int = config.MAX_RETRIES) -> Optional[Dict]:
     """
     미국 ETF 데이터를 yfinance로 가져옵니다.
 
+    실패 시 지수 백오프로 재시도하고, yfinance 서킷이 열려 있으면 요청 없이 바로
+    None을 반환합니다 (영구 캐시에 이전 값이 있으면 그 값이 대신 반환됨).
+
     Args:
         ticker: ETF 티커 (예: "JEPI", "SCHD")
         retries: 재시도 횟수
@@ -31,65 +128,67 @@ def fetch_us_etf_data(ticker: str, retries: int = config.MAX_RETRIES) -> Optiona
             'currency': str
         }
     """
-    for attempt in range(retries):
-        try:
-            # yfinance 티커 객체 생성
-            stock = yf.Ticker(ticker)
-
-            # 기본 정보 가져오기
-            info = stock.info
-
-            # 현재가
-            current_price = info.get('currentPrice') or info.get('regularMarketPrice')
-            if current_price is None:
-                # 최근 거래일 종가 사용
-                hist = stock.history(period='1d')
-                if not hist.empty:
-                    current_price = hist['Close'].iloc[-1]
-
-            # 전일 종가
-            previous_close = info.get('previousClose') or info.get('regularMarketPreviousClose')
-
-            # 등락액 및 등락률 계산
-            if current_price and previous_close:
-                change = current_price - previous_close
-                change_percent = (change / previous_close) * 100
-            else:
-                change = 0
-                change_percent = 0
-
-            # 배당률 (yfinance는 이미 퍼센트 형태로 제공: 8.15 = 8.15%)
-            dividend_yield = info.get('dividendYield')
-            if dividend_yield is None:
-                dividend_yield = 0
-
-            # 종목명
-            name = info.get('longName') or info.get('shortName') or ticker
-
-            return {
-                'ticker': ticker,
-                'name': name,
-                'price': current_price,
-                'change': change,
-                'change_percent': change_percent,
-                'dividend_yield': dividend_yield,
-                'currency': 'USD'
-            }
+    try:
+        return resilience.call_with_retry(resilience.YFINANCE, _fetch_us_quote, ticker,
+                                          retries=retries, label=ticker)
+    except resilience.CircuitOpenError as e:
+        print(f"⚠️ {ticker} 조회 생략: {e}")
+    except Exception as e:
+        _note_lookup_failure(ticker, quote_store.US, e)  # 시도별 실패 로그는 retry에서 출력
+    return None
 
-        except Exception as e:
-            print(f"⚠️ {ticker} 데이터 가져오기 실패 (시도 {attempt + 1}/{retries}): {e}")
-            if attempt < retries - 1:
-                time.sleep(1)  # 재시도 전 1초 대기
-            else:
-                return None
 
-    return None
+def _fetch_kr_quote(ticker: str) -> Dict:
+    """
+    일봉 저장소에서 한국 종목 시세를 계산합니다 (조회 실패 시 예외).
+
+    Raises:
+        resilience.SymbolNotFoundError: 일봉 데이터가 비어 있는 경우 (없는 종목코드 등)
+    """
+    # 일봉 저장소에서 가져오기 (마지막 저장일 이후 데이터만 새로 받음)
+    df = price_store.get_history(ticker)
+
+    if df.empty:
+        raise resilience.SymbolNotFoundError(f"{ticker} 데이터가 비어있습니다.")
+
+    # 최근 2일 데이터 추출
+    recent_data = df.tail(2)
+
+    # 현재가 (가장 최근 종가)
+    current_price = recent_data['Close'].iloc[-1]
+
+    # 전일가
+    if len(recent_data) >= 2:
+        previous_close = recent_data['Close'].iloc[-2]
+    else:
+        previous_close = current_price
+
+    # 등락액 및 등락률 계산
+    change = current_price - previous_close
+    change_percent = (change / previous_close) * 100 if previous_close != 0 else 0
+
+    # 종목명 (ETF 목록 → 주식 목록 순서로 캐시된 인덱스에서 조회)
+    name = symbol_listing.lookup_name(ticker) or ticker
+
+    return {
+        'ticker': ticker,
+        'name': name,
+        'price': current_price,
+        'change': change,
+        'change_percent': change_percent,
+        'dividend_yield': 0,  # 한국 ETF 배당률은 수동 관리 필요
+        'currency': 'KRW'
+    }
 
 
+@persistent_cache.cached(ttl=market_hours.ttl_policy(market_hours.KRX))
 def fetch_kr_etf_data(ticker: str, retries: int = config.MAX_RETRIES) -> Optional[Dict]:
     """
     한국 ETF 데이터를 FinanceDataReader로 가져옵니다.
 
+    실패 시 지수 백오프로 재시도하고, FinanceDataReader 서킷이 열려 있으면
+    저장소에 있는 마지막 일봉으로 계산합니다.
+
     Args:
         ticker: ETF 종목코드 (예: "479920", "371460")
         retries: 재시도 횟수
@@ -106,107 +205,113 @@ def fetch_kr_etf_data(ticker: str, retries: int = config.MAX_RETRIES) -> Optiona
             'currency': str
         }
     """
-    for attempt in range(retries):
-        try:
-            # 최근 2일 데이터 가져오기 (현재가, 전일가 비교용)
-            df = fdr.DataReader(ticker, start='2024-01-01')  # 충분한 기간
-
-            if df.empty:
-                print(f"⚠️ {ticker} 데이터가 비어있습니다.")
-                return None
-
-            # 최근 2일 데이터 추출
-            recent_data = df.tail(2)
-
-            if len(recent_data) < 1:
-                print(f"⚠️ {ticker} 최근 데이터가 부족합니다.")
-                return None
-
-            # 현재가 (가장 최근 종가)
-            current_price = recent_data['Close'].iloc[-1]
-
-            # 전일가
-            if len(recent_data) >= 2:
-                previous_close = recent_data['Close'].iloc[-2]
-            else:
-                previous_close = current_price
-
-            # 등락액 및 등락률 계산
-            change = current_price - previous_close
-            change_percent = (change / previous_close) * 100 if previous_close != 0 else 0
-
-            # 종목명 가져오기 시도 (ETF 리스트에서 또는 주식 리스트에서)
-            name = ticker  # 기본값
-            try:
-                # ETF 리스트에서 검색
-                etf_list = fdr.StockListing('ETF/KR')
-                if not etf_list.empty:
-                    code_col = 'Code' if 'Code' in etf_list.columns else 'Symbol' if 'Symbol' in etf_list.columns else None
-                    name_col = 'Name' if 'Name' in etf_list.columns else None
-
-                    if code_col and name_col:
-                        matched = etf_list[etf_list[code_col].astype(str) == str(ticker)]
-                        if not matched.empty:
-                            name = matched.iloc[0][name_col]
-
-                # ETF에 없으면 주식 리스트에서 검색
-                if name == ticker:
-                    stock_list = fdr.StockListing('KRX')
-                    if not stock_list.empty:
-                        code_col = 'Code' if 'Code' in stock_list.columns else 'Symbol' if 'Symbol' in stock_list.columns else None
-                        name_col = 'Name' if 'Name' in stock_list.columns else None
-
-                        if code_col and name_col:
-                            matched = stock_list[stock_list[code_col].astype(str) == str(ticker)]
-                            if not matched.empty:
-                                name = matched.iloc[0][name_col]
-            except Exception as e:
-                print(f"⚠️ {ticker} 종목명 조회 실패: {e}")
-
-            return {
-                'ticker': ticker,
-                'name': name,
-                'price': current_price,
-                'change': change,
-                'change_percent': change_percent,
-                'dividend_yield': 0,  # 한국 ETF 배당률은 수동 관리 필요
-                'currency': 'KRW'
-            }
+    try:
+        return resilience.retry(_fetch_kr_quote, ticker, retries=retries, label=ticker)
+    except resilience.CircuitOpenError as e:
+        print(f"⚠️ {ticker} 조회 생략: {e}")
+    except Exception as e:
+        _note_lookup_failure(ticker, quote_store.KR, e)  # 시도별 실패 로그는 retry에서 출력
+    return None
 
-        except Exception as e:
-            print(f"⚠️ {ticker} 데이터 가져오기 실패 (시도 {attempt + 1}/{retries}): {e}")
-            if attempt < retries - 1:
-                time.sleep(1)  # 재시도 전 1초 대기
-            else:
-                return None
 
-    return None
+def get_quote(ticker: str, market: str) -> Optional[Dict]:
+    """
+    종목 시세를 공유 시세 저장소에서 가져옵니다.
+
+    저장소에 유효한 시세가 없을 때만 fetch_us_etf_data / fetch_kr_etf_data로 조회하고
+    결과를 저장소에 넣습니다. 관심 종목, 검색, 상세 정보가 모두 이 함수를 거치므로
+    같은 종목은 어느 탭에서 요청하든 유효 시간 안에 한 번만 조회됩니다.
+
+    Args:
+        ticker: 티커 또는 종목코드
+        market: 'US' 또는 'KR'
+
+    Returns:
+        시세 딕셔너리 (fetch_us_etf_data / fetch_kr_etf_data 형식) 또는 None (현재가가 없는 경우 포함)
+    """
+    ticker = str(ticker)
+    quote = quote_store.store.get(ticker, market)
+    if quote is not None:
+        return quote
+
+    fetch_func = fetch_us_etf_data if market == quote_store.US else fetch_kr_etf_data
+    quote = fetch_func(ticker)
+    if not has_price(quote):
+        return None
+    quote_store.store.put(ticker, market, quote)
+    return quote
+
+
+def _publish_quotes(df: pd.DataFrame, market: str) -> None:
+    """
+    일괄 조회한 시세 표를 시세 저장소에 넣습니다.
+
+    Args:
+        df: columns: ticker, name, price, change, change_percent, dividend_yield, currency
+        market: 'US' 또는 'KR'
+    """
+    columns = ['ticker', 'name', 'price', 'change', 'change_percent', 'dividend_yield', 'currency']
+    quote_store.store.put_many(df.dropna(subset=['price'])[columns].to_dict('records'), market)
 
 
-def fetch_exchange_rate() -> float:
+def refresh_ticker(ticker: str, market: str) -> Optional[Dict]:
     """
-    현재 USD/KRW 환율을 가져옵니다.
+    종목 하나만 캐시를 무시하고 새로 조회하여 영구 캐시와 시세 저장소를 갱신합니다.
+
+    한국 종목은 일봉 저장소의 메모리 캐시도 지워서 마지막 저장일 이후 일봉을 다시 받습니다.
+
+    조회에 실패하면 영구 캐시의 이전 값이 반환되고, 이전 값도 없으면 저장소에서 지웁니다.
+
+    Args:
+        ticker: 티커 또는 종목코드
+        market: 'US' 또는 'KR'
 
     Returns:
-        환율 (실패 시 기본값 반환)
+        시세 딕셔너리 또는 None
+
+    Examples:
+        >>> refresh_ticker('JEPI', quote_store.US)
     """
-    try:
-        # yfinance로 USD/KRW 환율 조회
-        usd_krw = yf.Ticker("KRW=X")
-        rate = usd_krw.info.get('regularMarketPrice')
+    ticker = str(ticker)
+    if market == quote_store.KR:
+        price_store.invalidate(ticker)
+    fetch_func = fetch_us_etf_data if market == quote_store.US else fetch_kr_etf_data
+    quote = fetch_func.refresh(ticker)
+    if has_price(quote):
+        quote_store.store.put(ticker, market, quote)
+    else:
+        quote = None
+        quote_store.store.invalidate(ticker, market)
+    return quote
+
+
+def refresh_watchlist(file_path: str, is_us: bool) -> List[Optional[Dict]]:
+    """
+    워치리스트 종목만 새로 조회합니다 (다른 종목, HOT 순위, 환율 캐시는 유지).
+
+    Args:
+        file_path: 워치리스트 CSV 경로
+        is_us: 미국 주식 여부
+
+    Returns:
+        종목별 시세 딕셔너리 리스트 (워치리스트 순서, 실패한 종목은 None)
+    """
+    watchlist = load_watchlist(file_path)
+    if watchlist.empty:
+        return []
+
+    market = quote_store.US if is_us else quote_store.KR
+    tickers = [str(ticker) for ticker in watchlist['ticker']]
+    with ThreadPoolExecutor(max_workers=config.FETCH_MAX_WORKERS) as executor:
+        return list(executor.map(lambda ticker: refresh_ticker(ticker, market), tickers))
 
-        if rate and rate > 0:
-            return rate
-        else:
-            # 대안: FinanceDataReader 사용
-            df = fdr.DataReader('USD/KRW', start='2024-01-01')
-            if not df.empty:
-                return df['Close'].iloc[-1]
-            else:
-                return config.DEFAULT_USD_KRW
-    except Exception as e:
-        print(f"⚠️ 환율 가져오기 실패: {e}. 기본 환율({config.DEFAULT_USD_KRW}) 사용")
-        return config.DEFAULT_USD_KRW
+
+def clear_cache() -> None:
+    """영구 캐시, 시세 저장소, 메모리 환율, 검색 실패 캐시를 모두 지웁니다."""
+    persistent_cache.clear()
+    quote_store.store.clear()
+    fx_service.clear()
+    clear_search_misses()
 
 
 def load_watchlist(file_path: str) -> pd.DataFrame:
@@ -230,150 +335,568 @@ def load_watchlist(file_path: str) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def enrich_watchlist_with_data(watchlist_df: pd.DataFrame, is_us: bool = False) -> pd.DataFrame:
+def append_to_watchlist(file_path: str, row: Dict) -> None:
+    """
+    관심 종목 CSV에 한 행을 추가합니다.
+
+    값은 CSV 헤더 순서대로 쓰고, 헤더에 있지만 row에 없는 컬럼(shares 등)은 비워 둡니다.
+    파일이 없으면 row의 키로 헤더를 만듭니다.
+
+    Args:
+        file_path: CSV 파일 경로
+        row: 컬럼 → 값 (예: {'ticker': 'JEPI', 'name': ..., 'type': ..., 'target_ratio': 10.0})
+    """
+    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        header = next(csv.reader([content.splitlines()[0]]))
+        prefix = '' if content.endswith('\n') else '\n'
+    else:
+        header, prefix = list(row), None
+
+    with open(file_path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if prefix is None:
+            writer.writerow(header)
+        else:
+            f.write(prefix)
+        writer.writerow([row.get(column, '') for column in header])
+
+
+def build_enriched_row(row: pd.Series, data: Optional[Dict], is_us: bool) -> Dict:
+    """
+    관심 종목 한 행과 조회 결과를 합쳐 표시용 행을 만듭니다.
+
+    Args:
+        row: 관심 종목 DataFrame의 한 행
+        data: fetch_us_etf_data / fetch_kr_etf_data 결과 (실패 시 None)
+        is_us: 미국 주식 여부
+
+    Returns:
+        enrich_watchlist_with_data 스키마의 딕셔너리
+    """
+    ticker = str(row['ticker'])  # 문자열로 변환 (CSV에서 int로 읽힐 수 있음)
+
+    if has_price(data):
+        # 기존 정보 + 새 데이터 병합
+        # CSV에 dividend_yield가 있으면 우선 사용 (한국 ETF용)
+        csv_dividend = row.get('dividend_yield', None)
+        final_dividend = csv_dividend if csv_dividend is not None else data['dividend_yield']
+
+        return {
+            'ticker': ticker,
+            'name': row.get('name', data['name']),
+            'type': row.get('type', ''),
+            'target_ratio': row.get('target_ratio', 0),
+            'price': data['price'],
+            'change': data['change'],
+            'change_percent': data['change_percent'],
+            'dividend_yield': final_dividend,
+            'currency': data['currency']
+        }
+
+    # 데이터 가져오기 실패 시 기본값
+    return {
+        'ticker': ticker,
+        'name': row.get('name', ticker),
+        'type': row.get('type', ''),
+        'target_ratio': row.get('target_ratio', 0),
+        'price': None,
+        'change': None,
+        'change_percent': None,
+        'dividend_yield': row.get('dividend_yield', None),
+        'currency': 'USD' if is_us else 'KRW'
+    }
+
+
+def stream_watchlist_with_data(watchlist_df: pd.DataFrame, is_us: bool = False,
+                               max_workers: int = config.FETCH_MAX_WORKERS,
+                               timeout: float = config.FETCH_BATCH_TIMEOUT) -> Iterator[Tuple[int, Dict]]:
+    """
+    관심 종목 시세를 조회가 끝나는 순서대로 한 행씩 반환하는 제너레이터.
+
+    시세는 get_quote로 공유 시세 저장소를 먼저 확인하고, 저장소에 없는 종목만
+    스레드 풀에서 최대 max_workers개까지 동시에 조회합니다. 느린 종목을 기다리지 않고
+    먼저 끝난 종목부터 반환하므로 화면에 카드를 하나씩 바로 그릴 수 있습니다.
+    timeout 안에 끝나지 않은 종목은 조회 실패와 같은 기본값 행으로 마지막에 반환합니다.
+
+    Args:
+        watchlist_df: 관심 종목 DataFrame
+        is_us: 미국 주식 여부
+        max_workers: 동시 조회 스레드 수 (1 이하면 순차 조회)
+        timeout: 전체 조회 제한 시간 (초, None이면 무제한)
+
+    Yields:
+        (행 위치, enrich_watchlist_with_data 스키마의 딕셔너리) - 모든 행이 한 번씩
+
+    Examples:
+        >>> for idx, row in stream_watchlist_with_data(watchlist, is_us=True):
+        ...     placeholders[idx].write(row['price'])
+    """
+    market = quote_store.US if is_us else quote_store.KR
+    rows = [row for _, row in watchlist_df.iterrows()]
+    tickers = [str(row['ticker']) for row in rows]
+
+    if max_workers is None or max_workers <= 1 or len(rows) <= 1:
+        # 순차 조회
+        for idx, (row, ticker) in enumerate(zip(rows, tickers)):
+            yield idx, build_enriched_row(row, get_quote(ticker, market), is_us)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(rows)))
+    try:
+        futures = {executor.submit(get_quote, ticker, market): idx for idx, ticker in enumerate(tickers)}
+        pending = set(futures)
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                idx = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    print(f"⚠️ {tickers[idx]} 데이터 가져오기 실패: {e}")
+                    data = None
+                yield idx, build_enriched_row(rows[idx], data, is_us)
+        except FuturesTimeoutError:
+            for future in sorted(pending, key=futures.get):
+                idx = futures[future]
+                print(f"⚠️ {tickers[idx]} 조회 제한 시간({timeout}초) 초과")
+                yield idx, build_enriched_row(rows[idx], None, is_us)
+    finally:
+        # 제한 시간을 넘긴 작업(또는 중간에 멈춘 제너레이터의 남은 작업)은 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def enrich_watchlist_with_data(watchlist_df: pd.DataFrame, is_us: bool = False,
+                               max_workers: int = config.FETCH_MAX_WORKERS,
+                               timeout: float = config.FETCH_BATCH_TIMEOUT) -> pd.DataFrame:
     """
     관심 종목 목록에 실시간 데이터를 추가합니다.
 
+    stream_watchlist_with_data의 결과를 모두 모아 원래 행 순서대로 합칩니다.
+    timeout 안에 끝나지 않은 종목은 조회 실패와 같은 기본값 행으로 채워집니다.
+
     Args:
         watchlist_df: 관심 종목 DataFrame
         is_us: 미국 주식 여부
+        max_workers: 동시 조회 스레드 수 (1 이하면 순차 조회)
+        timeout: 전체 조회 제한 시간 (초, None이면 무제한)
 
     Returns:
         데이터가 추가된 DataFrame
     """
-    enriched_data = []
+    enriched_data = [None] * len(watchlist_df)
+    for idx, row in stream_watchlist_with_data(watchlist_df, is_us, max_workers=max_workers, timeout=timeout):
+        enriched_data[idx] = row
+
+    return pd.DataFrame(enriched_data)
+
 
-    for _, row in watchlist_df.iterrows():
-        ticker = str(row['ticker'])  # 문자열로 변환 (CSV에서 int로 읽힐 수 있음)
+# HOT 미국 주식 후보 종목 (S&P 500 주요 종목)
+HOT_US_TICKERS = [
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B', 'UNH', 'JNJ',
+    'V', 'XOM', 'WMT', 'JPM', 'MA', 'PG', 'AVGO', 'HD', 'CVX', 'MRK',
+    'LLY', 'ABBV', 'PEP', 'KO', 'COST', 'MCD', 'TMO', 'CSCO', 'ACN', 'ADBE',
+    'NKE', 'ABT', 'DHR', 'TXN', 'CRM', 'NEE', 'VZ', 'INTC', 'WFC', 'CMCSA',
+    'AMD', 'QCOM', 'PM', 'UNP', 'ORCL', 'BMY', 'HON', 'AMGN', 'RTX', 'UPS'
+]
 
-        # 데이터 가져오기
-        if is_us:
-            data = fetch_us_etf_data(ticker)
+# HOT 미국 주식 후보 구분 (그 외 값은 FinanceDataReader 시장 코드로 종목 목록 사용)
+US_UNIVERSE_MAJOR = 'MAJOR'  # HOT_US_TICKERS
+US_UNIVERSE_CUSTOM = 'CUSTOM'  # HOT_US_UNIVERSE_PATH CSV의 ticker 컬럼
+
+
+def get_us_universe(universe: str = config.HOT_US_UNIVERSE) -> list:
+    """
+    HOT 미국 주식 후보 티커 리스트를 반환합니다.
+
+    Args:
+        universe: 'MAJOR', 'CUSTOM' 또는 FinanceDataReader 시장 코드 (예: 'S&P500', 'NASDAQ')
+
+    Returns:
+        yfinance 형식 티커 리스트 (BRK.B → BRK-B, 중복 제거).
+        후보 목록을 가져오지 못하면 HOT_US_TICKERS
+
+    Examples:
+        >>> len(get_us_universe('S&P500'))
+        503
+    """
+    if universe == US_UNIVERSE_MAJOR:
+        return list(HOT_US_TICKERS)
+
+    try:
+        if universe == US_UNIVERSE_CUSTOM:
+            codes = pd.read_csv(config.HOT_US_UNIVERSE_PATH)['ticker']
         else:
-            data = fetch_kr_etf_data(ticker)
-
-        if data:
-            # 기존 정보 + 새 데이터 병합
-            # CSV에 dividend_yield가 있으면 우선 사용 (한국 ETF용)
-            csv_dividend = row.get('dividend_yield', None)
-            final_dividend = csv_dividend if csv_dividend is not None else data['dividend_yield']
-
-            enriched_row = {
-                'ticker': ticker,
-                'name': row.get('name', data['name']),
-                'type': row.get('type', ''),
-                'target_ratio': row.get('target_ratio', 0),
-                'price': data['price'],
-                'change': data['change'],
-                'change_percent': data['change_percent'],
-                'dividend_yield': final_dividend,
-                'currency': data['currency']
-            }
+            codes = symbol_listing.get_listing(universe)['Code']
+        codes = (str(code).strip().upper().replace('.', '-') for code in codes.dropna())
+        tickers = list(dict.fromkeys(code for code in codes if code))
+    except Exception as e:
+        print(f"⚠️ HOT 미국 주식 후보({universe}) 가져오기 실패: {e}")
+        tickers = []
+
+    if not tickers:
+        print(f"⚠️ HOT 미국 주식 후보({universe})가 비어 있어 주요 {len(HOT_US_TICKERS)}개 종목을 사용합니다.")
+        return list(HOT_US_TICKERS)
+    return tickers
+
+
+# 미국 종목 메타데이터 테이블 (index: ticker, columns: name, dividend_yield, updated_at)
+_US_METADATA_COLUMNS = ['name', 'dividend_yield', 'updated_at']
+_us_metadata: Optional[pd.DataFrame] = None
+_us_metadata_lock = threading.Lock()
+
+
+def _load_us_metadata() -> pd.DataFrame:
+    """디스크에 저장된 미국 종목 메타데이터 테이블을 읽습니다."""
+    try:
+        return pd.read_csv(config.US_METADATA_PATH, index_col='ticker')
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"⚠️ 미국 종목 메타데이터 로드 실패: {e}")
+    return pd.DataFrame(columns=_US_METADATA_COLUMNS).rename_axis('ticker')
+
+
+def _save_us_metadata(table: pd.DataFrame) -> None:
+    """미국 종목 메타데이터 테이블을 디스크에 저장합니다."""
+    try:
+        config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        table.to_csv(config.US_METADATA_PATH)
+    except Exception as e:
+        print(f"⚠️ 미국 종목 메타데이터 저장 실패: {e}")
+
+
+def _fetch_us_metadata_row(ticker: str) -> Optional[Dict]:
+    """yfinance info에서 종목명과 배당률만 가져옵니다."""
+    try:
+        info = resilience.guarded(resilience.YFINANCE, _get_ticker_info, ticker)
+        return {
+            'ticker': ticker,
+            'name': info.get('shortName') or info.get('longName') or ticker,
+            'dividend_yield': info.get('dividendYield') or 0,
+            'updated_at': time.time()
+        }
+    except Exception as e:
+        print(f"⚠️ {ticker} 메타데이터 가져오기 실패: {e}")
+        return None
+
+
+def get_us_metadata(tickers: list) -> pd.DataFrame:
+    """
+    미국 종목의 종목명과 배당률을 메타데이터 테이블에서 가져옵니다.
+
+    테이블에 없거나 US_METADATA_TTL이 지난 종목만 yfinance info로 새로 조회하고,
+    결과는 디스크(US_METADATA_PATH)에 저장되어 재시작 후에도 재사용됩니다.
+    새로 조회하지 못한 종목은 이전 값(없으면 NaN)을 그대로 반환합니다.
+
+    Args:
+        tickers: 티커 리스트
+
+    Returns:
+        ticker 인덱스, name / dividend_yield 컬럼의 DataFrame (tickers 순서)
+    """
+    global _us_metadata
+
+    with _us_metadata_lock:
+        if _us_metadata is None:
+            _us_metadata = _load_us_metadata()
+        table = _us_metadata
+
+    fresh_after = time.time() - config.US_METADATA_TTL
+    fresh = table.index[table['updated_at'].astype(float) > fresh_after]
+    missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in fresh]
+    metrics.inc(metrics.CACHE_LOOKUPS, len(tickers) - len(missing), cache='us_metadata', result='hit')
+    metrics.inc(metrics.CACHE_LOOKUPS, len(missing), cache='us_metadata', result='miss')
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=config.FETCH_MAX_WORKERS) as executor:
+            rows = [row for row in executor.map(_fetch_us_metadata_row, missing) if row]
+
+        if rows:
+            new_rows = pd.DataFrame(rows).set_index('ticker')
+            with _us_metadata_lock:
+                table = pd.concat([_us_metadata.drop(index=new_rows.index, errors='ignore'), new_rows])
+                _us_metadata = table
+                _save_us_metadata(table)
+
+    return table.reindex(tickers)[['name', 'dividend_yield']]
+
+
+def fetch_us_price_snapshot(tickers: list, period: str = '1mo') -> Dict[str, pd.DataFrame]:
+    """
+    여러 미국 종목의 일봉 종가/거래량을 일괄 다운로드로 한 번에 가져옵니다.
+
+    티커는 BULK_DOWNLOAD_CHUNK_SIZE개씩 묶어서 요청하고, 묶음은 최대
+    BULK_DOWNLOAD_MAX_WORKERS개까지 동시에 받으므로 종목 수가 늘어도
+    요청 횟수와 소요 시간이 거의 늘지 않습니다.
+
+    Args:
+        tickers: 티커 리스트
+        period: 조회 기간 (yfinance period 형식, 예: '5d', '1mo')
+
+    Returns:
+        {'Close': DataFrame, 'Volume': DataFrame} (index: 날짜, columns: 티커)
+    """
+    chunk_size = config.BULK_DOWNLOAD_CHUNK_SIZE
+    chunks = [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+    if not chunks:
+        return {'Close': pd.DataFrame(), 'Volume': pd.DataFrame()}
+
+    def download(chunk):
+        try:
+            return resilience.guarded(resilience.YFINANCE, providers.get(resilience.YFINANCE).download, chunk, period)
+        except Exception as e:
+            print(f"⚠️ 일괄 시세 다운로드 실패 ({len(chunk)}개 종목): {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(config.BULK_DOWNLOAD_MAX_WORKERS, len(chunks))) as executor:
+        frames = [data for data in executor.map(download, chunks) if data is not None and not data.empty]
+
+    if not frames:
+        return {'Close': pd.DataFrame(), 'Volume': pd.DataFrame()}
+
+    return {
+        'Close': pd.concat([data['Close'] for data in frames], axis=1).sort_index(),
+        'Volume': pd.concat([data['Volume'] for data in frames], axis=1).sort_index()
+    }
+
+
+# HOT 종목 기간별 수익률 계산 구간 (거래일 수)
+HOT_PERIOD_LOOKBACK = {'1d': 1, '5d': 5, '1mo': 20}
+HOT_PERIODS = list(HOT_PERIOD_LOOKBACK)
+
+
+def _load_kr_close_panel(tickers: list, rows: int) -> Dict[str, pd.DataFrame]:
+    """
+    여러 한국 종목의 최근 종가/거래량을 일봉 저장소에서 읽어 패널로 만듭니다.
+
+    Args:
+        tickers: 종목코드 리스트
+        rows: 종목별로 사용할 최근 거래일 수
+
+    Returns:
+        {'Close': DataFrame, 'Volume': DataFrame} (index: 날짜, columns: 종목코드)
+    """
+    def load_tail(ticker):
+        try:
+            return ticker, price_store.get_history(ticker).tail(rows)
+        except Exception as e:
+            print(f"⚠️ {ticker} 시세 가져오기 실패: {e}")
+            return ticker, None
+
+    with ThreadPoolExecutor(max_workers=config.FETCH_MAX_WORKERS) as executor:
+        histories = {ticker: hist for ticker, hist in executor.map(load_tail, tickers)
+                     if hist is not None and not hist.empty}
+
+    if not histories:
+        return {'Close': pd.DataFrame(), 'Volume': pd.DataFrame()}
+
+    return {
+        'Close': pd.concat({ticker: hist['Close'] for ticker, hist in histories.items()}, axis=1).sort_index(),
+        'Volume': pd.concat({ticker: hist['Volume'] for ticker, hist in histories.items()}, axis=1).sort_index()
+    }
+
+
+def compute_period_returns(closes: pd.DataFrame) -> pd.DataFrame:
+    """
+    종가 패널에서 모든 HOT 기간의 수익률을 한 번에 계산합니다.
+
+    기간 시작 시점 데이터가 없는 종목(신규 상장 등)은 해당 기간 수익률이 NaN입니다.
+
+    Args:
+        closes: 종가 패널 (index: 날짜, columns: 종목코드)
+
+    Returns:
+        index: 종목코드, columns: price, 1d, 5d, 1mo (수익률은 퍼센트)
+    """
+    closes = closes.dropna(how='all').ffill()
+    values = closes.to_numpy(dtype=float)
+    end_prices = values[-1] if len(values) else np.full(closes.shape[1], np.nan)
+
+    returns = {'price': end_prices}
+    for period, lookback in HOT_PERIOD_LOOKBACK.items():
+        if len(values) > lookback:
+            start_prices = values[-lookback - 1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                returns[period] = (end_prices - start_prices) / start_prices * 100
         else:
-            # 데이터 가져오기 실패 시 기본값
-            enriched_row = {
-                'ticker': ticker,
-                'name': row.get('name', ticker),
-                'type': row.get('type', ''),
-                'target_ratio': row.get('target_ratio', 0),
-                'price': None,
-                'change': None,
-                'change_percent': None,
-                'dividend_yield': row.get('dividend_yield', None),
-                'currency': 'USD' if is_us else 'KRW'
-            }
-
-        enriched_data.append(enriched_row)
+            returns[period] = np.full(closes.shape[1], np.nan)
 
-    return pd.DataFrame(enriched_data)
+    return pd.DataFrame(returns, index=closes.columns)
 
 
-def fetch_hot_us_stocks(period: str = '1d', limit: int = 10) -> pd.DataFrame:
+def top_k(df: pd.DataFrame, column: str, k: int) -> pd.DataFrame:
     """
-    미국 S&P 500 상승률 Top 종목을 가져옵니다.
+    column 값 기준 상위 k개 행을 내림차순으로 반환합니다 (NaN 제외).
+
+    전체 정렬 대신 np.argpartition으로 상위 k개만 골라낸 뒤 그 k개만 정렬합니다.
+
+    Args:
+        df: 대상 DataFrame
+        column: 기준 컬럼
+        k: 선택할 개수
+
+    Returns:
+        상위 k개 행 DataFrame
+    """
+    values = df[column].to_numpy(dtype=float)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if k <= 0 or len(candidates) == 0:
+        return df.iloc[[]]
+
+    if len(candidates) > k:
+        partitioned = np.argpartition(-values[candidates], k - 1)[:k]
+        candidates = candidates[partitioned]
+
+    order = candidates[np.argsort(-values[candidates], kind='stable')]
+    return df.iloc[order]
+
+
+# 미국 종목 기간별 수익률 계산용 일봉 다운로드 기간 (1mo = 20거래일 전 종가까지 필요)
+US_RETURNS_DOWNLOAD_PERIOD = '3mo'
+
+
+@persistent_cache.cached(ttl=market_hours.ttl_policy(market_hours.NYSE))
+def compute_us_returns(universe: str = config.HOT_US_UNIVERSE) -> pd.DataFrame:
+    """
+    미국 후보 종목 전체의 1d / 5d / 1mo 수익률을 한 번에 계산합니다.
+
+    후보 종목(get_us_universe)의 일봉을 묶음 단위로 동시에 받아 종가 패널을 만들고,
+    모든 기간 수익률을 벡터 연산으로 함께 계산합니다 (compute_kr_etf_returns와 같은 방식).
+
+    Args:
+        universe: 후보 종목 구분 (get_us_universe 참고)
+
+    Returns:
+        columns: ticker, price, volume, 1d, 5d, 1mo (실패 시 빈 DataFrame)
+    """
+    try:
+        snapshot = fetch_us_price_snapshot(get_us_universe(universe), period=US_RETURNS_DOWNLOAD_PERIOD)
+        if snapshot['Close'].empty:
+            print("⚠️ HOT 미국 주식 시세 데이터가 부족합니다.")
+            return pd.DataFrame()
+
+        returns = compute_period_returns(snapshot['Close'])
+        returns['volume'] = snapshot['Volume'].ffill().iloc[-1].reindex(returns.index)
+        returns.index.name = 'ticker'
+        return returns.dropna(subset=['price']).reset_index()[['ticker', 'price', 'volume'] + list(HOT_PERIOD_LOOKBACK)]
+
+    except Exception as e:
+        print(f"❌ 미국 주식 수익률 계산 실패: {e}")
+        return pd.DataFrame()
+
+
+@persistent_cache.cached(ttl=market_hours.ttl_policy(market_hours.NYSE))
+def fetch_hot_us_stocks(period: str = '1d', limit: int = 10, universe: str = config.HOT_US_UNIVERSE) -> pd.DataFrame:
+    """
+    미국 주식 상승률 Top 종목을 가져옵니다.
+
+    후보 종목 전체의 기간별 수익률(compute_us_returns)에서 상위 limit개를 고르고,
+    종목명/배당률은 상위 limit개 종목만 메타데이터 테이블에서 채웁니다.
 
     Args:
         period: 기간 ('1d', '5d', '1mo')
         limit: 상위 몇 개 (기본 10개)
+        universe: 후보 종목 구분 (기본 HOT_US_UNIVERSE, get_us_universe 참고)
 
     Returns:
         상승률 상위 종목 DataFrame
     """
     try:
-        # S&P 500 구성 종목 가져오기
-        sp500 = yf.Ticker("^GSPC")
-
-        # S&P 500 주요 종목 리스트 (상위 100개 정도만 체크 - 속도 최적화)
-        # 실제로는 API로 전체 리스트를 가져와야 하지만, 여기서는 주요 종목만
-        major_tickers = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B', 'UNH', 'JNJ',
-            'V', 'XOM', 'WMT', 'JPM', 'MA', 'PG', 'AVGO', 'HD', 'CVX', 'MRK',
-            'LLY', 'ABBV', 'PEP', 'KO', 'COST', 'MCD', 'TMO', 'CSCO', 'ACN', 'ADBE',
-            'NKE', 'ABT', 'DHR', 'TXN', 'CRM', 'NEE', 'VZ', 'INTC', 'WFC', 'CMCSA',
-            'AMD', 'QCOM', 'PM', 'UNP', 'ORCL', 'BMY', 'HON', 'AMGN', 'RTX', 'UPS'
-        ]
-
-        hot_stocks = []
-
-        for ticker in major_tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period='5d' if period == '1d' else '1mo')
-
-                if len(hist) < 2:
-                    continue
-
-                # 기간별 수익률 계산
-                if period == '1d':
-                    start_price = hist['Close'].iloc[-2]
-                    end_price = hist['Close'].iloc[-1]
-                elif period == '5d':
-                    start_price = hist['Close'].iloc[0]
-                    end_price = hist['Close'].iloc[-1]
-                else:  # 1mo
-                    start_price = hist['Close'].iloc[0]
-                    end_price = hist['Close'].iloc[-1]
-
-                change_percent = ((end_price - start_price) / start_price) * 100
-
-                # 기본 정보 가져오기
-                info = stock.info
-                name = info.get('shortName', ticker)
-                current_price = hist['Close'].iloc[-1]
-                volume = hist['Volume'].iloc[-1]
-                dividend_yield = info.get('dividendYield', 0)
-
-                hot_stocks.append({
-                    'ticker': ticker,
-                    'name': name,
-                    'price': current_price,
-                    'change_percent': change_percent,
-                    'volume': volume,
-                    'dividend_yield': dividend_yield,
-                    'currency': 'USD'
-                })
-
-            except Exception as e:
-                print(f"⚠️ {ticker} 데이터 가져오기 실패: {e}")
-                continue
-
-        # DataFrame 생성 및 정렬
-        df = pd.DataFrame(hot_stocks)
-        if not df.empty:
-            df = df.sort_values('change_percent', ascending=False).head(limit)
-            df = df.reset_index(drop=True)
+        returns = compute_us_returns(universe)
+        if returns.empty or period not in HOT_PERIOD_LOOKBACK:
+            return pd.DataFrame()
 
-        return df
+        df = top_k(returns, period, limit).set_index('ticker')
+        if df.empty:
+            return pd.DataFrame()
+        df['change_percent'] = df[period]
+
+        # 종목명 / 배당률은 상위 종목만 메타데이터 테이블에서 조회
+        metadata = get_us_metadata(df.index.tolist())
+        df['name'] = metadata['name'].fillna(pd.Series(df.index, index=df.index))
+        df['dividend_yield'] = metadata['dividend_yield'].fillna(0).astype(float)
+        df['currency'] = 'USD'
+
+        # 상위 종목의 전일 대비 시세를 시세 저장소에 공유 (상세 정보/관심 종목에서 재사용)
+        daily_percent = df['1d'].fillna(0.0)
+        daily = df.assign(change=df['price'] - df['price'] / (1 + daily_percent / 100),
+                          change_percent=daily_percent)
+        _publish_quotes(daily.reset_index(), quote_store.US)
+
+        return df.reset_index()[['ticker', 'name', 'price', 'change_percent', 'volume', 'dividend_yield', 'currency']]
 
     except Exception as e:
         print(f"❌ HOT 미국 주식 데이터 가져오기 실패: {e}")
         return pd.DataFrame()
 
 
+def refresh_kr_etf_returns() -> pd.DataFrame:
+    """
+    한국 ETF 전체의 일봉 메모리 캐시를 지우고 수익률을 새로 계산합니다.
+
+    Returns:
+        compute_kr_etf_returns 결과
+    """
+    etf_list = symbol_listing.get_listing('ETF/KR')
+    if not etf_list.empty:
+        price_store.invalidate_many(etf_list['Code'].tolist())
+    return compute_kr_etf_returns.refresh()
+
+
+@persistent_cache.cached(ttl=market_hours.ttl_policy(market_hours.KRX))
+def compute_kr_etf_returns() -> pd.DataFrame:
+    """
+    한국 상장 ETF 전체의 1d / 5d / 1mo 수익률을 한 번에 계산합니다.
+
+    전체 ETF 목록의 일봉을 저장소에서 읽어 종가 패널을 만들고, 모든 기간
+    수익률을 벡터 연산으로 함께 계산합니다. 결과가 캐시되므로 기간을 바꿔
+    조회해도 다시 계산하지 않습니다.
+
+    Returns:
+        columns: ticker, name, price, volume, 1d, 5d, 1mo (실패 시 빈 DataFrame)
+    """
+    try:
+        # 한국 전체 ETF 리스트 가져오기 (캐시)
+        etf_list = symbol_listing.get_listing('ETF/KR')
+
+        if etf_list.empty:
+            print("⚠️ 한국 ETF 리스트를 가져올 수 없습니다.")
+            return pd.DataFrame()
+
+        panel = _load_kr_close_panel(etf_list['Code'].tolist(), rows=max(HOT_PERIOD_LOOKBACK.values()) + 1)
+        if panel['Close'].empty:
+            return pd.DataFrame()
+
+        returns = compute_period_returns(panel['Close'])
+        returns['volume'] = panel['Volume'].ffill().iloc[-1]
+        name_index = symbol_listing.get_name_index('ETF/KR')
+        returns['name'] = [name_index.get(ticker, ticker) for ticker in returns.index]
+        returns.index.name = 'ticker'
+
+        # 전체 ETF의 전일 대비 시세를 시세 저장소에 공유 (관심 종목/검색에서 재사용)
+        quotes = returns.reset_index()
+        quotes['change_percent'] = quotes['1d'].fillna(0.0)
+        quotes['change'] = quotes['price'] - quotes['price'] / (1 + quotes['change_percent'] / 100)
+        quotes['dividend_yield'] = 0
+        quotes['currency'] = 'KRW'
+        _publish_quotes(quotes, quote_store.KR)
+
+        return returns.reset_index()[['ticker', 'name', 'price', 'volume'] + list(HOT_PERIOD_LOOKBACK)]
+
+    except Exception as e:
+        print(f"❌ 한국 ETF 수익률 계산 실패: {e}")
+        return pd.DataFrame()
+
+
+@persistent_cache.cached(ttl=market_hours.ttl_policy(market_hours.KRX))
 def fetch_hot_kr_etfs(period: str = '1d', limit: int = 10) -> pd.DataFrame:
     """
     한국 ETF 수익률 Top 종목을 가져옵니다.
 
+    전체 ETF의 기간별 수익률(compute_kr_etf_returns)에서 상위 limit개를 고릅니다.
+
     Args:
         period: 기간 ('1d', '5d', '1mo')
         limit: 상위 몇 개 (기본 10개)
@@ -381,83 +904,97 @@ def fetch_hot_kr_etfs(period: str = '1d', limit: int = 10) -> pd.DataFrame:
     Returns:
         수익률 상위 ETF DataFrame
     """
-    try:
-        # 한국 전체 ETF 리스트 가져오기
-        etf_list = fdr.StockListing('ETF/KR')
+    returns = compute_kr_etf_returns()
+    if returns.empty or period not in HOT_PERIOD_LOOKBACK:
+        return pd.DataFrame()
 
-        if etf_list.empty:
-            print("⚠️ 한국 ETF 리스트를 가져올 수 없습니다.")
-            return pd.DataFrame()
+    df = top_k(returns, period, limit).rename(columns={period: 'change_percent'})
+    df['dividend_yield'] = 0  # 한국 ETF는 배당률 데이터 없음
+    df['currency'] = 'KRW'
 
-        # 컬럼명 확인 (디버깅용)
-        print(f"📋 ETF 리스트 컬럼: {etf_list.columns.tolist()}")
-
-        hot_etfs = []
-
-        # 상위 50개 ETF만 체크 (속도 최적화 - 200개에서 50개로 감소)
-        for idx, etf_row in etf_list.head(50).iterrows():
-            # 컬럼명이 'Code' 또는 'Symbol' 또는 인덱스일 수 있음
-            if 'Code' in etf_list.columns:
-                ticker = str(etf_row['Code'])
-            elif 'Symbol' in etf_list.columns:
-                ticker = str(etf_row['Symbol'])
-            else:
-                ticker = str(etf_row.name)  # 인덱스가 티커인 경우
-
-            if 'Name' in etf_list.columns:
-                name = etf_row['Name']
-            else:
-                name = ticker
-
-            try:
-                # 기간별 데이터 가져오기
-                if period == '1d':
-                    df = fdr.DataReader(ticker, start='2024-01-01')
-                    if len(df) < 2:
-                        continue
-                    start_price = df['Close'].iloc[-2]
-                    end_price = df['Close'].iloc[-1]
-                elif period == '5d':
-                    df = fdr.DataReader(ticker, start='2024-01-01')
-                    if len(df) < 5:
-                        continue
-                    start_price = df['Close'].iloc[-6]
-                    end_price = df['Close'].iloc[-1]
-                else:  # 1mo
-                    df = fdr.DataReader(ticker, start='2023-12-01')
-                    if len(df) < 20:
-                        continue
-                    start_price = df['Close'].iloc[-21]
-                    end_price = df['Close'].iloc[-1]
-
-                change_percent = ((end_price - start_price) / start_price) * 100
-                volume = df['Volume'].iloc[-1]
-
-                hot_etfs.append({
-                    'ticker': ticker,
-                    'name': name,
-                    'price': end_price,
-                    'change_percent': change_percent,
-                    'volume': volume,
-                    'dividend_yield': 0,  # 한국 ETF는 배당률 데이터 없음
-                    'currency': 'KRW'
-                })
-
-            except Exception as e:
-                # 개별 종목 실패는 조용히 넘어감 (로그만 출력)
-                continue
-
-        # DataFrame 생성 및 정렬
-        df = pd.DataFrame(hot_etfs)
-        if not df.empty:
-            df = df.sort_values('change_percent', ascending=False).head(limit)
-            df = df.reset_index(drop=True)
+    return df[['ticker', 'name', 'price', 'change_percent', 'volume', 'dividend_yield', 'currency']].reset_index(drop=True)
 
-        return df
 
+# 미국 티커 형태 (예: AAPL, BRK-B, BRK.B)
+_TICKER_PATTERN = re.compile(r'[A-Za-z][A-Za-z.\-]{0,5}')
+
+# 검색 실패 캐시: (정규화 검색어, 시장) → 만료 시각
+# 없는 티커(오타 등)를 다시 검색하면 재시도 대기 없이 바로 실패를 반환합니다.
+_search_misses: Dict[Tuple[str, str], float] = {}
+_search_misses_lock = threading.Lock()
+
+
+def _is_known_miss(key: Tuple[str, str]) -> bool:
+    """최근에 조회해서 없던 검색어인지 확인합니다 (만료된 항목은 삭제)."""
+    with _search_misses_lock:
+        expires_at = _search_misses.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            del _search_misses[key]
+            expires_at = None
+    metrics.record_cache_lookup('search_miss', expires_at is not None, market=key[1])
+    return expires_at is not None
+
+
+def _record_miss(key: Tuple[str, str]) -> None:
+    """검색 실패를 SEARCH_MISS_TTL 동안 기억합니다 (SEARCH_MISS_MAX_ENTRIES를 넘으면 가장 먼저 만료될 항목부터 삭제)."""
+    with _search_misses_lock:
+        _search_misses[key] = time.time() + config.SEARCH_MISS_TTL
+        if len(_search_misses) > config.SEARCH_MISS_MAX_ENTRIES:
+            for old_key, _ in sorted(_search_misses.items(), key=lambda item: item[1])[:len(_search_misses) // 10 + 1]:
+                del _search_misses[old_key]
+
+
+def _note_lookup_failure(ticker: str, market: str, error: Exception) -> None:
+    """
+    시세 조회 실패 원인이 없는 종목이면 검색 실패 캐시에 기록합니다.
+
+    제공자가 응답했지만 데이터가 없는 경우(SymbolNotFoundError, 404 등)만 기록하고,
+    연결 오류 / 시간 초과 / 5xx / 429 같은 제공자 장애는 종목이 없다는 뜻이 아니므로 기록하지 않습니다.
+    """
+    if not resilience.is_provider_failure(error):
+        _record_miss((search_index.normalize(ticker), market))
+
+
+def clear_search_misses() -> None:
+    """검색 실패 캐시를 비웁니다."""
+    with _search_misses_lock:
+        _search_misses.clear()
+
+
+def _lookup_ticker(query: str, market: str) -> Optional[Dict]:
+    """
+    검색어를 티커/종목코드로 보고 시세를 조회합니다.
+
+    제공자가 종목이 없다고 응답하면(빈 데이터, 현재가 없음, 404 등) (검색어, 시장)이
+    실패 캐시에 기록되고, 유효 시간 동안은 데이터 제공자에 다시 묻지 않습니다.
+    제공자 장애(연결 오류, 시간 초과, 5xx/429, 서킷 열림)로 실패한 경우는 없는 티커로
+    볼 수 없으므로 기록하지 않습니다 (fetch_us_etf_data / fetch_kr_etf_data에서 판단).
+
+    Args:
+        query: 검색어 (예: "JEPI", "005930")
+        market: 'US' 또는 'KR'
+
+    Returns:
+        get_quote 결과 또는 None
+    """
+    key = (search_index.normalize(query), market)
+    if _is_known_miss(key):
+        return None
+
+    ticker = query.upper() if market == 'US' else query
+
+    try:
+        data = get_quote(ticker, market)
     except Exception as e:
-        print(f"❌ HOT 한국 ETF 데이터 가져오기 실패: {e}")
-        return pd.DataFrame()
+        print(f"⚠️ {ticker} 검색 조회 실패: {e}")
+        return None
+
+    return data if has_price(data) else None
+
+
+def _is_korean_query(query: str) -> bool:
+    """한글 음절 또는 초성이 포함된 검색어인지 확인합니다."""
+    return any('\uac00' <= char <= '\ud7a3' for char in query) or search_index.has_chosung(query)
 
 
 def search_stock_multiple(query: str) -> list:
@@ -465,98 +1002,43 @@ def search_stock_multiple(query: str) -> list:
     종목 티커 또는 종목명으로 검색하여 매칭되는 모든 종목 리스트를 반환합니다.
 
     Args:
-        query: 검색할 티커 또는 종목명 (예: "AAPL", "005930", "삼성전자", "커버드콜")
+        query: 검색할 티커, 종목코드, 종목명 일부 또는 초성 (예: "AAPL", "005930", "삼성전자", "커버드콜", "ㅋㅂㄷㅋ")
 
     Returns:
-        매칭된 종목들의 리스트 (각 항목은 {'ticker', 'name', 'market'} 딕셔너리)
+        매칭된 종목들의 리스트 (각 항목은 {'ticker', 'name', 'market'} 딕셔너리, 관련도 순)
     """
     query = query.strip()
-    results = []
 
     if not query:
+        return []
+
+    # 1. 검색 인덱스 (한국 ETF/주식 종목명, 종목코드, 미국 티커, 초성)
+    try:
+        results = search_index.search(query, limit=10)
+    except Exception as e:
+        print(f"⚠️ 종목 검색 인덱스 조회 실패: {e}")
+        results = []
+
+    # 한글/초성 검색은 인덱스 결과로 종료
+    if _is_korean_query(query):
         return results
 
-    # 1. 한글이 포함되어 있으면 바로 한국 ETF 리스트 검색
-    if any('\uac00' <= char <= '\ud7a3' for char in query):
-        try:
-            # 한국 ETF 리스트 가져오기
-            etf_list = fdr.StockListing('ETF/KR')
-
-            if not etf_list.empty:
-                # 종목명 컬럼 확인
-                name_col = 'Name' if 'Name' in etf_list.columns else None
-                code_col = 'Code' if 'Code' in etf_list.columns else 'Symbol' if 'Symbol' in etf_list.columns else None
-
-                if name_col and code_col:
-                    # 종목명에 검색어가 포함되는 ETF 찾기 (최대 10개)
-                    matched = etf_list[etf_list[name_col].str.contains(query, case=False, na=False)].head(10)
-
-                    for _, row in matched.iterrows():
-                        results.append({
-                            'ticker': str(row[code_col]),
-                            'name': row[name_col],
-                            'market': 'KR'
-                        })
-                    return results  # 한글 검색은 여기서 종료
-        except Exception as e:
-            print(f"⚠️ 한국어 종목명 검색 실패: {e}")
+    # 종목코드/티커가 정확히 일치하면 바로 반환
+    if any(result['ticker'].upper() == query.upper() for result in results):
         return results
 
-    # 2. 숫자로만 이루어진 티커는 한국 주식/ETF (005930 같은 형태)
+    # 2. 인덱스에 없는 숫자 종목코드는 한국 주식/ETF로 직접 조회 (005930 같은 형태)
     if query.isdigit():
-        try:
-            # 먼저 리스트에서 종목명 찾기
-            ticker_name = query
-            try:
-                # ETF 리스트에서 검색
-                etf_list = fdr.StockListing('ETF/KR')
-                if not etf_list.empty:
-                    code_col = 'Code' if 'Code' in etf_list.columns else 'Symbol' if 'Symbol' in etf_list.columns else None
-                    name_col = 'Name' if 'Name' in etf_list.columns else None
-
-                    if code_col and name_col:
-                        matched = etf_list[etf_list[code_col].astype(str) == str(query)]
-                        if not matched.empty:
-                            ticker_name = matched.iloc[0][name_col]
-
-                # ETF에 없으면 주식 리스트에서 검색
-                if ticker_name == query:
-                    stock_list = fdr.StockListing('KRX')
-                    if not stock_list.empty:
-                        code_col = 'Code' if 'Code' in stock_list.columns else 'Symbol' if 'Symbol' in stock_list.columns else None
-                        name_col = 'Name' if 'Name' in stock_list.columns else None
-
-                        if code_col and name_col:
-                            matched = stock_list[stock_list[code_col].astype(str) == str(query)]
-                            if not matched.empty:
-                                ticker_name = matched.iloc[0][name_col]
-            except:
-                pass
-
-            # 데이터가 있는지 확인
-            kr_data = fetch_kr_etf_data(query)
-            if kr_data:
-                results.append({
-                    'ticker': query,
-                    'name': ticker_name,  # 리스트에서 찾은 종목명 사용
-                    'market': 'KR'
-                })
-                return results  # 티커 정확히 일치하면 바로 반환
-        except:
-            pass
-
-    # 3. 알파벳이 포함된 경우 미국 주식으로 시도
-    try:
-        us_data = fetch_us_etf_data(query.upper())
+        kr_data = _lookup_ticker(query, 'KR')
+        if kr_data:
+            return [{'ticker': query, 'name': kr_data['name'], 'market': 'KR'}] + results
+        return results
+
+    # 3. 인덱스에 없는 티커는 미국 주식으로 직접 조회
+    if _TICKER_PATTERN.fullmatch(query):
+        us_data = _lookup_ticker(query, 'US')
         if us_data:
-            results.append({
-                'ticker': query.upper(),
-                'name': us_data.get('name', query.upper()),
-                'market': 'US'
-            })
-            return results
-    except:
-        pass
+            return [{'ticker': query.upper(), 'name': us_data.get('name', query.upper()), 'market': 'US'}] + results
 
     return results
 
@@ -566,7 +1048,7 @@ def search_stock(query: str) -> Optional[Dict]:
     종목 티커 또는 종목명으로 검색하여 정보를 가져옵니다.
 
     Args:
-        query: 검색할 티커 또는 종목명 (예: "AAPL", "005930", "삼성전자", "커버드콜")
+        query: 검색할 티커, 종목명 또는 초성 (예: "AAPL", "005930", "삼성전자", "커버드콜", "ㅅㅅㅈㅈ")
 
     Returns:
         종목 정보 딕셔너리 또는 None
@@ -576,51 +1058,33 @@ def search_stock(query: str) -> Optional[Dict]:
     if not query:
         return None
 
-    # 1. 먼저 미국 주식으로 티커 검색 시도 (대문자 변환)
-    try:
-        us_data = fetch_us_etf_data(query.upper())
-        if us_data:
-            us_data['market'] = 'US'
-            return us_data
-    except:
-        pass
-
-    # 2. 한국 주식/ETF 티커로 검색 시도
-    try:
-        kr_data = fetch_kr_etf_data(query)
-        if kr_data:
-            kr_data['market'] = 'KR'
-            return kr_data
-    except:
-        pass
-
-    # 3. 한국어 종목명으로 검색 (한글이 포함된 경우)
-    if any('\uac00' <= char <= '\ud7a3' for char in query):
+    # 1. 한국어 종목명/초성으로 검색 (가장 잘 맞는 종목 사용, 티커 조회는 생략)
+    if _is_korean_query(query):
         try:
-            # 한국 ETF 리스트 가져오기
-            etf_list = fdr.StockListing('ETF/KR')
-
-            if not etf_list.empty:
-                # 종목명 컬럼 확인
-                name_col = 'Name' if 'Name' in etf_list.columns else None
-                code_col = 'Code' if 'Code' in etf_list.columns else 'Symbol' if 'Symbol' in etf_list.columns else None
-
-                if name_col and code_col:
-                    # 종목명에 검색어가 포함되는 ETF 찾기
-                    matched = etf_list[etf_list[name_col].str.contains(query, case=False, na=False)]
-
-                    if not matched.empty:
-                        # 첫 번째 매칭 결과 사용
-                        first_match = matched.iloc[0]
-                        ticker = str(first_match[code_col])
-
-                        # 해당 티커로 데이터 가져오기
-                        kr_data = fetch_kr_etf_data(ticker)
-                        if kr_data:
-                            kr_data['market'] = 'KR'
-                            kr_data['name'] = first_match[name_col]  # 정확한 종목명 사용
-                            return kr_data
+            matched = search_index.search(query, limit=1)
+
+            if matched:
+                # 해당 티커로 데이터 가져오기
+                first_match = matched[0]
+                data = get_quote(first_match['ticker'], first_match['market'])
+                if has_price(data):
+                    data['market'] = first_match['market']
+                    data['name'] = first_match['name']  # 정확한 종목명 사용
+                    return data
         except Exception as e:
             print(f"⚠️ 한국어 종목명 검색 실패: {e}")
+        return None
+
+    # 2. 미국 주식으로 티커 검색 시도 (대문자 변환)
+    us_data = _lookup_ticker(query, 'US')
+    if us_data:
+        us_data['market'] = 'US'
+        return us_data
+
+    # 3. 한국 주식/ETF 티커로 검색 시도
+    kr_data = _lookup_ticker(query, 'KR')
+    if kr_data:
+        kr_data['market'] = 'KR'
+        return kr_data
 
     return None
@@ -0,0 +1,144 @@
+"""
+환율 서비스 모듈
+USD/KRW 현재 환율을 메모리에 캐시하고, 일별 환율 시계열은 일봉 저장소(price_store)에
+쌓아두고 마지막 저장일 이후만 받아 갱신합니다.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+import pandas as pd
+import config
+import metrics
+import persistent_cache
+import price_store
+import providers
+import resilience
+
+
+FX_PAIR = 'KRW=X'  # yfinance 환율 심볼
+FX_SYMBOL = 'USD/KRW'  # FinanceDataReader 환율 심볼 (일봉 저장소 키)
+
+# 메모리 캐시: {'rate': float, 'fetched_at': float}
+_current = {'rate': None, 'fetched_at': 0.0}
+_lock = threading.Lock()
+
+
+def is_fx_market_open(now: Optional[datetime] = None) -> bool:
+    """
+    외환 시장 거래 시간인지 확인합니다 (일요일 22:00 ~ 금요일 22:00 UTC).
+
+    Args:
+        now: 기준 시각 (None이면 현재 시각)
+    """
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    weekday, hour = now.weekday(), now.hour
+    if weekday == 5:  # 토요일
+        return False
+    if weekday == 4:  # 금요일 22시 마감
+        return hour < 22
+    if weekday == 6:  # 일요일 22시 개장
+        return hour >= 22
+    return True
+
+
+def current_ttl(now: Optional[datetime] = None) -> float:
+    """메모리 환율 유효 시간 (초) - 외환 시장 휴장 중에는 환율이 바뀌지 않으므로 길게"""
+    return config.FX_TTL if is_fx_market_open(now) else config.FX_CLOSED_TTL
+
+
+def get_series(start: str = config.PRICE_HISTORY_START) -> pd.Series:
+    """
+    일별 USD/KRW 환율 종가 시계열을 반환합니다.
+
+    일봉 저장소에 쌓아둔 데이터를 사용하며, 새로 고칠 때는 마지막 저장일 이후만 받습니다.
+
+    Args:
+        start: 저장된 데이터가 없을 때 받기 시작할 날짜
+
+    Returns:
+        index: 날짜, name: 'usd_krw' (실패 시 빈 Series)
+    """
+    try:
+        history = price_store.get_history(FX_SYMBOL, start=start)
+    except Exception as e:
+        print(f"⚠️ 환율 시계열 가져오기 실패: {e}")
+        return pd.Series(dtype=float, name='usd_krw')
+
+    if history.empty or 'Close' not in history:
+        return pd.Series(dtype=float, name='usd_krw')
+    return history['Close'].dropna().rename('usd_krw')
+
+
+@persistent_cache.cached(ttl=config.FX_TTL)
+def fetch_rate() -> Optional[float]:
+    """
+    현재 USD/KRW 환율을 조회합니다 (영구 캐시 사용).
+
+    yfinance 실시간 환율 → 일별 환율 시계열의 마지막 종가 순서로 사용합니다.
+    둘 다 실패하면 None을 반환하므로 영구 캐시에 남아 있는 마지막 정상 환율이 대신 반환됩니다
+    (기본 환율은 호출하는 쪽에서 적용).
+
+    Returns:
+        환율 또는 None (실패 시)
+    """
+    try:
+        rate = resilience.guarded(resilience.YFINANCE, providers.get(resilience.YFINANCE).get_fx_rate, FX_PAIR)
+        if rate and rate > 0:
+            return float(rate)
+    except Exception as e:
+        print(f"⚠️ yfinance 환율 가져오기 실패: {e}")
+
+    # 대안: 저장된 일별 환율 (마지막 저장일 이후만 새로 받음)
+    series = get_series()
+    if not series.empty:
+        return float(series.iloc[-1])
+    return None
+
+
+def _store(rate: Optional[float]) -> float:
+    """조회한 환율을 메모리에 저장합니다 (조회 실패 시 저장하지 않고 기본 환율 반환)."""
+    if rate is None:
+        print(f"⚠️ 환율 가져오기 실패. 기본 환율({config.DEFAULT_USD_KRW}) 사용")
+        return config.DEFAULT_USD_KRW
+    with _lock:
+        _current['rate'] = rate
+        _current['fetched_at'] = time.time()
+    return rate
+
+
+def get_rate() -> float:
+    """
+    현재 USD/KRW 환율을 반환합니다.
+
+    유효 시간(current_ttl) 안에는 메모리 값을 그대로 반환하므로 화면을 다시 그릴 때마다
+    조회하지 않습니다.
+
+    Returns:
+        환율 (조회 실패 시 마지막 정상 환율, 그것도 없으면 기본 환율)
+
+    Examples:
+        >>> get_rate()
+        1385.2
+    """
+    with _lock:
+        rate, fetched_at = _current['rate'], _current['fetched_at']
+    hit = rate is not None and time.time() - fetched_at < current_ttl()
+    metrics.record_cache_lookup('fx', hit)
+    if hit:
+        return rate
+    return _store(fetch_rate())
+
+
+def refresh() -> float:
+    """캐시를 무시하고 환율을 새로 조회합니다 (백그라운드 갱신용)."""
+    return _store(fetch_rate.refresh())
+
+
+def clear() -> None:
+    """메모리 환율을 지웁니다 (다음 조회 때 영구 캐시 / 데이터 제공자에서 다시 가져옴)."""
+    with _lock:
+        _current['rate'] = None
+        _current['fetched_at'] = 0.0
+
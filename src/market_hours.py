@@ -0,0 +1,171 @@
+"""
+거래 시간 모듈
+KRX / NYSE 거래일(주말, 휴장일)과 정규장 시간을 기준으로 캐시 유효 시간을 정합니다.
+장중에는 짧은 유효 시간(CACHE_TTL)을 쓰고, 장이 닫혀 있으면 시세가 바뀌지 않으므로
+다음 정규장 개장 시각까지 캐시를 유지합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+from zoneinfo import ZoneInfo
+import config
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """거래소 정규장 정보 (시각은 거래소 현지 시간)"""
+    name: str
+    tz: ZoneInfo
+    open: time
+    close: time
+    holidays: FrozenSet[date]
+    early_closes: Dict[date, time]
+
+
+def _dates(*values: str) -> FrozenSet[date]:
+    return frozenset(date.fromisoformat(value) for value in values)
+
+
+# 휴장일 (주말 제외) - 거래소 공지에 맞춰 매년 추가
+# 표에 없는 해는 휴장일을 모르므로 평일을 모두 거래일로 봄 (캐시가 짧아질 뿐 오래된 시세를 보여주지는 않음)
+KRX_HOLIDAYS = _dates(
+    # 2025
+    '2025-01-01', '2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30', '2025-03-03',
+    '2025-05-01', '2025-05-05', '2025-05-06', '2025-06-03', '2025-06-06', '2025-08-15',
+    '2025-10-03', '2025-10-06', '2025-10-07', '2025-10-08', '2025-10-09', '2025-12-25', '2025-12-31',
+    # 2026
+    '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02', '2026-05-01',
+    '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17', '2026-09-24', '2026-09-25',
+    '2026-10-05', '2026-10-09', '2026-12-25', '2026-12-31',
+    # 2027
+    '2027-01-01', '2027-02-08', '2027-02-09', '2027-03-01', '2027-05-05', '2027-05-13',
+    '2027-08-16', '2027-09-14', '2027-09-15', '2027-09-16', '2027-10-04', '2027-10-11',
+    '2027-12-27', '2027-12-31',
+)
+
+NYSE_HOLIDAYS = _dates(
+    # 2025
+    '2025-01-01', '2025-01-09', '2025-01-20', '2025-02-17', '2025-04-18', '2025-05-26',
+    '2025-06-19', '2025-07-04', '2025-09-01', '2025-11-27', '2025-12-25',
+    # 2026
+    '2026-01-01', '2026-01-19', '2026-02-16', '2026-04-03', '2026-05-25', '2026-06-19',
+    '2026-07-03', '2026-09-07', '2026-11-26', '2026-12-25',
+    # 2027
+    '2027-01-01', '2027-01-18', '2027-02-15', '2027-03-26', '2027-05-31', '2027-06-18',
+    '2027-07-05', '2027-09-06', '2027-11-25', '2027-12-24',
+)
+
+# 조기 폐장일 (13:00 마감)
+NYSE_EARLY_CLOSES = {day: time(13, 0) for day in _dates(
+    '2025-07-03', '2025-11-28', '2025-12-24', '2026-11-27', '2026-12-24', '2027-11-26',
+)}
+
+KRX = Exchange('KRX', ZoneInfo('Asia/Seoul'), time(9, 0), time(15, 30), KRX_HOLIDAYS, {})
+NYSE = Exchange('NYSE', ZoneInfo('America/New_York'), time(9, 30), time(16, 0), NYSE_HOLIDAYS, NYSE_EARLY_CLOSES)
+
+# 거래소별 휴장일 표의 마지막 연도 (이후 날짜를 조회하면 한 번 경고)
+_HOLIDAYS_UNTIL = {exchange.name: max(exchange.holidays).year for exchange in (KRX, NYSE)}
+_coverage_warned = set()
+
+
+def _check_coverage(exchange: Exchange, day: date) -> None:
+    """휴장일 표가 끝난 해의 날짜면 거래소별로 한 번만 경고를 출력합니다."""
+    until = _HOLIDAYS_UNTIL.get(exchange.name)
+    if until is not None and day.year > until and exchange.name not in _coverage_warned:
+        _coverage_warned.add(exchange.name)
+        print(f"⚠️ {exchange.name} 휴장일 표가 {until}년까지만 있습니다. "
+              f"{day.year}년 휴장일을 market_hours.py에 추가하세요 (그 전까지 평일은 모두 거래일로 처리).")
+
+
+def _local_now(exchange: Exchange, now: Optional[datetime]) -> datetime:
+    """기준 시각을 거래소 현지 시간으로 변환합니다 (None이면 현재 시각)."""
+    return now.astimezone(exchange.tz) if now is not None else datetime.now(exchange.tz)
+
+
+def is_trading_day(exchange: Exchange, day: date) -> bool:
+    """주말과 휴장일이 아닌 날인지 확인합니다."""
+    _check_coverage(exchange, day)
+    return day.weekday() < 5 and day not in exchange.holidays
+
+
+def session(exchange: Exchange, day: date) -> Optional[Tuple[datetime, datetime]]:
+    """
+    거래일의 정규장 (개장, 마감) 시각을 반환합니다.
+
+    Returns:
+        (개장 datetime, 마감 datetime) 또는 None (휴장일)
+    """
+    if not is_trading_day(exchange, day):
+        return None
+    close = exchange.early_closes.get(day, exchange.close)
+    return (datetime.combine(day, exchange.open, exchange.tz),
+            datetime.combine(day, close, exchange.tz))
+
+
+def is_active(exchange: Exchange, now: Optional[datetime] = None) -> bool:
+    """
+    시세가 바뀔 수 있는 시간인지 확인합니다.
+
+    정규장 시간과, 종가가 확정되어 데이터 제공자에 반영될 때까지의
+    마감 후 유예 시간(MARKET_CLOSE_GRACE)을 포함합니다.
+    """
+    now = _local_now(exchange, now)
+    hours = session(exchange, now.date())
+    return hours is not None and hours[0] <= now < hours[1] + timedelta(seconds=config.MARKET_CLOSE_GRACE)
+
+
+def next_open(exchange: Exchange, now: Optional[datetime] = None) -> datetime:
+    """
+    다음 정규장 개장 시각을 반환합니다 (거래 중이면 다음 거래일 개장 시각).
+
+    Examples:
+        >>> next_open(KRX, datetime(2026, 10, 17, 12, 0, tzinfo=KRX.tz))  # 토요일
+        datetime.datetime(2026, 10, 19, 9, 0, tzinfo=zoneinfo.ZoneInfo(key='Asia/Seoul'))
+    """
+    now = _local_now(exchange, now)
+    day = now.date()
+    # 연휴가 길어도 2주 안에는 개장함
+    for _ in range(15):
+        hours = session(exchange, day)
+        if hours is not None and now < hours[0]:
+            return hours[0]
+        day += timedelta(days=1)
+    return now + timedelta(days=1)
+
+
+def cache_ttl(exchange: Exchange, now: Optional[datetime] = None) -> float:
+    """
+    거래소 시세의 캐시 유효 시간 (초)을 반환합니다.
+
+    장중(마감 후 유예 시간 포함)에는 CACHE_TTL, 장이 닫혀 있으면 다음 개장 시각까지입니다.
+    MARKET_HOURS_TTL_ENABLED가 False이면 항상 CACHE_TTL입니다.
+
+    Args:
+        exchange: KRX 또는 NYSE
+        now: 기준 시각 (None이면 현재 시각)
+
+    Examples:
+        >>> cache_ttl(NYSE, datetime(2026, 10, 16, 11, 0, tzinfo=NYSE.tz))  # 금요일 장중
+        300
+        >>> cache_ttl(NYSE, datetime(2026, 10, 16, 17, 0, tzinfo=NYSE.tz))  # 월요일 09:30까지
+        232200.0
+    """
+    if not config.MARKET_HOURS_TTL_ENABLED or is_active(exchange, now):
+        return config.CACHE_TTL
+    now = _local_now(exchange, now)
+    return max(config.CACHE_TTL, (next_open(exchange, now) - now).total_seconds())
+
+
+def ttl_policy(exchange: Exchange) -> Callable[[], float]:
+    """
+    저장 시점마다 cache_ttl을 계산하는 유효 시간 함수를 반환합니다 (persistent_cache.cached용).
+
+    Examples:
+        >>> @persistent_cache.cached(ttl=ttl_policy(KRX))
+        ... def fetch_kr_etf_data(ticker): ...
+    """
+    def ttl() -> float:
+        return cache_ttl(exchange)
+    ttl.__name__ = f"{exchange.name.lower()}_ttl"
+    return ttl
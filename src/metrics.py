@@ -0,0 +1,322 @@
+"""
+성능 지표 모듈
+데이터 제공자 호출과 캐시 조회의 지연 시간 히스토그램, 재시도/실패 횟수,
+캐시 적중률을 수집하고 Prometheus 텍스트 형식으로 내보냅니다.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import pandas as pd
+import config
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+
+# 지연 시간 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 지표 이름
+PROVIDER_LATENCY = 'provider_call_latency_seconds'
+PROVIDER_CALLS = 'provider_calls_total'
+PROVIDER_FAILURES = 'provider_failures_total'
+PROVIDER_RETRIES = 'provider_retries_total'
+FETCH_LATENCY = 'fetch_latency_seconds'
+CACHE_LOOKUPS = 'cache_lookups_total'
+SINGLEFLIGHT_SHARED = 'singleflight_shared_total'
+QUOTE_STORE_EVICTIONS = 'quote_store_evictions_total'
+
+_HELP = {
+    PROVIDER_LATENCY: '데이터 제공자 호출 지연 시간',
+    PROVIDER_CALLS: '데이터 제공자 호출 횟수',
+    PROVIDER_FAILURES: '데이터 제공자 호출 실패 횟수',
+    PROVIDER_RETRIES: '데이터 제공자 호출 재시도 횟수',
+    FETCH_LATENCY: 'data_fetcher 함수 지연 시간 (캐시 포함)',
+    CACHE_LOOKUPS: '캐시 조회 횟수 (result=hit/miss)',
+    SINGLEFLIGHT_SHARED: '진행 중인 조회 결과를 함께 사용한 호출 수',
+    QUOTE_STORE_EVICTIONS: '메모리 한도 초과로 시세 저장소에서 지운 종목 수',
+}
+
+# 라벨은 정렬된 (이름, 값) 튜플로 저장
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """누적 버킷 방식의 지연 시간 히스토그램 (Prometheus histogram과 같은 구조)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한으로 근사한 분위수 (+Inf 버킷이면 최댓값)"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+
+_lock = threading.Lock()
+_histograms: Dict[str, Dict[Labels, Histogram]] = {}
+_counters: Dict[str, Dict[Labels, float]] = {}
+_slowest: Dict[str, float] = {}  # 캐시 키(함수+인자)별 최근 지연 시간
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def inc(name: str, amount: float = 1, **labels) -> None:
+    """카운터를 증가시킵니다."""
+    if not config.METRICS_ENABLED:
+        return
+    key = _labels(labels)
+    with _lock:
+        series = _counters.setdefault(name, {})
+        series[key] = series.get(key, 0) + amount
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    """지연 시간을 히스토그램에 기록합니다."""
+    if not config.METRICS_ENABLED:
+        return
+    key = _labels(labels)
+    with _lock:
+        series = _histograms.setdefault(name, {})
+        if key not in series:
+            series[key] = Histogram()
+        series[key].observe(seconds)
+
+
+@contextmanager
+def timer(name: str, **labels):
+    """
+    블록 실행 시간을 히스토그램에 기록하는 컨텍스트 매니저.
+
+    Examples:
+        >>> with timer(PROVIDER_LATENCY, provider='yfinance', call='download'):
+        ...     yf.download(...)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def record_call(key: str, seconds: float) -> None:
+    """개별 호출(예: 티커별 조회)의 지연 시간을 기록합니다 (느린 종목 찾기용)."""
+    if not config.METRICS_ENABLED:
+        return
+    with _lock:
+        _slowest[key] = seconds
+        if len(_slowest) > config.METRICS_MAX_TRACKED_CALLS:
+            # 가장 빠른 항목부터 버림
+            for fast_key, _ in sorted(_slowest.items(), key=lambda item: item[1])[:len(_slowest) // 2]:
+                del _slowest[fast_key]
+
+
+def record_cache_lookup(cache: str, hit: bool, **labels) -> None:
+    """캐시 적중/실패를 기록합니다."""
+    inc(CACHE_LOOKUPS, cache=cache, result='hit' if hit else 'miss', **labels)
+
+
+def reset() -> None:
+    """수집된 지표를 모두 지웁니다."""
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+        _slowest.clear()
+
+
+def latency_summary() -> pd.DataFrame:
+    """
+    히스토그램별 호출 수, 평균, p50/p95(버킷 근사), 최댓값 요약표.
+
+    Returns:
+        columns: metric, labels, count, avg_ms, p50_ms, p95_ms, max_ms
+    """
+    with _lock:
+        rows = [
+            {
+                'metric': name,
+                'labels': ', '.join(f"{k}={v}" for k, v in labels),
+                'count': hist.count,
+                'avg_ms': hist.total / hist.count * 1000 if hist.count else 0.0,
+                'p50_ms': hist.quantile(0.5) * 1000,
+                'p95_ms': hist.quantile(0.95) * 1000,
+                'max_ms': hist.max * 1000
+            }
+            for name, series in _histograms.items()
+            for labels, hist in series.items()
+        ]
+    return pd.DataFrame(rows, columns=['metric', 'labels', 'count', 'avg_ms', 'p50_ms', 'p95_ms', 'max_ms'])
+
+
+def counter_summary() -> pd.DataFrame:
+    """카운터 요약표 (columns: metric, labels, value)"""
+    with _lock:
+        rows = [
+            {'metric': name, 'labels': ', '.join(f"{k}={v}" for k, v in labels), 'value': value}
+            for name, series in _counters.items()
+            for labels, value in series.items()
+        ]
+    return pd.DataFrame(rows, columns=['metric', 'labels', 'value'])
+
+
+def cache_hit_ratios() -> pd.DataFrame:
+    """
+    캐시별 적중률 요약표.
+
+    Returns:
+        columns: cache, hits, misses, hit_ratio
+    """
+    totals: Dict[str, Dict[str, float]] = {}
+    with _lock:
+        for labels, value in _counters.get(CACHE_LOOKUPS, {}).items():
+            label_dict = dict(labels)
+            entry = totals.setdefault(label_dict['cache'], {'hits': 0, 'misses': 0})
+            entry['hits' if label_dict['result'] == 'hit' else 'misses'] += value
+
+    rows = [
+        {'cache': cache, 'hits': entry['hits'], 'misses': entry['misses'],
+         'hit_ratio': entry['hits'] / (entry['hits'] + entry['misses'])}
+        for cache, entry in totals.items()
+    ]
+    return pd.DataFrame(rows, columns=['cache', 'hits', 'misses', 'hit_ratio'])
+
+
+def slowest_calls(limit: int = 10) -> List[Tuple[str, float]]:
+    """가장 느린 개별 호출 목록 [(키, 초), ...]"""
+    with _lock:
+        return sorted(_slowest.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def _escape(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ''
+    escaped = (f'{key}="{_escape(value)}"' for key, value in items)
+    return '{' + ','.join(escaped) + '}'
+
+
+def render_prometheus() -> str:
+    """수집된 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    lines = []
+    with _lock:
+        for name, series in sorted(_counters.items()):
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in series.items():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        for name, series in sorted(_histograms.items()):
+            lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, hist in series.items():
+                cumulative = 0
+                for bound, count in zip(hist.buckets, hist.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', str(bound)))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {hist.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {hist.total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {hist.count}")
+
+    return '\n'.join(lines) + '\n'
+
+
+def export_to_file(path: Optional[Path] = None) -> Path:
+    """
+    Prometheus 텍스트 형식으로 파일에 저장합니다 (node_exporter textfile collector 등에서 사용).
+
+    Args:
+        path: 저장 경로 (None이면 METRICS_EXPORT_PATH)
+
+    Returns:
+        저장된 파일 경로
+    """
+    path = Path(path or config.METRICS_EXPORT_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_text(render_prometheus(), encoding='utf-8')
+    tmp_path.replace(path)  # 읽는 쪽이 중간 상태를 보지 않도록 교체
+    return path
+
+
+def _make_handler():
+    """/metrics 요청 처리 클래스 (http.server는 서버를 켤 때만 import)"""
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip('/') not in ('', '/metrics'):
+                self.send_error(404)
+                return
+            body = render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 로그 출력하지 않음
+
+    return MetricsHandler
+
+
+_server: Optional['ThreadingHTTPServer'] = None
+
+
+def start_http_server(port: Optional[int] = None, host: str = '127.0.0.1') -> Optional['ThreadingHTTPServer']:
+    """
+    로컬 /metrics 엔드포인트를 백그라운드 스레드로 시작합니다 (프로세스당 한 번).
+
+    Args:
+        port: 포트 (None이면 METRICS_HTTP_PORT, 그것도 None이면 시작하지 않음)
+        host: 바인딩 주소 (기본: 로컬만)
+
+    Returns:
+        실행 중인 서버 또는 None
+    """
+    global _server
+
+    port = port if port is not None else config.METRICS_HTTP_PORT
+    if port is None:
+        return None
+    if _server is not None:
+        return _server
+
+    from http.server import ThreadingHTTPServer
+
+    try:
+        _server = ThreadingHTTPServer((host, port), _make_handler())
+    except OSError as e:
+        print(f"⚠️ 성능 지표 서버 시작 실패 (포트 {port}): {e}")
+        return None
+
+    threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
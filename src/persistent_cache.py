@@ -0,0 +1,248 @@
+"""
+영구 캐시 모듈
+data_fetcher 함수 결과를 SQLite 파일에 저장하여 Streamlit 재시작 후에도
+유효 시간(TTL) 안의 데이터를 바로 사용할 수 있게 합니다.
+"""
+
+import functools
+import inspect
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+import pandas as pd
+import config
+import metrics
+from singleflight import SingleFlight
+
+
+# 캐시 미스를 나타내는 표식 (None도 캐시 값이 될 수 있으므로 별도 객체 사용)
+MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    func TEXT NOT NULL,
+    value BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+# 조회된 키의 마지막 사용 시각 (읽을 때마다 쓰지 않고 모아 두었다가 저장/정리 때 한 번에 반영)
+_touched: Dict[str, float] = {}
+_TOUCH_FLUSH_SIZE = 500  # 모인 사용 시각이 이 개수를 넘으면 조회 중에도 반영
+
+# 캐시 키별 진행 중인 조회 (동시 요청 병합)
+_flights = SingleFlight('persistent_cache')
+
+
+def _get_conn() -> sqlite3.Connection:
+    """SQLite 연결을 반환합니다 (최초 호출 시 파일과 테이블 생성). _lock 안에서 호출해야 합니다."""
+    global _conn
+    if _conn is None:
+        config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(str(config.PERSISTENT_CACHE_PATH), check_same_thread=False, timeout=10)
+        # 여러 Streamlit 프로세스가 같은 파일을 읽고 쓸 수 있도록 WAL 모드 사용
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute(_SCHEMA)
+        _conn.commit()
+    return _conn
+
+
+def _is_empty_result(value: Any) -> bool:
+    """조회 실패로 보고 캐시하지 않을 결과인지 확인합니다."""
+    if value is None:
+        return True
+    if isinstance(value, pd.DataFrame) and value.empty:
+        return True
+    return False
+
+
+def _flush_touched(conn: sqlite3.Connection) -> None:
+    """모아 둔 사용 시각을 반영합니다 (커밋은 호출하는 쪽에서). _lock 안에서 호출해야 합니다."""
+    if _touched:
+        conn.executemany("UPDATE cache SET accessed_at = ? WHERE key = ?",
+                         [(accessed_at, key) for key, accessed_at in _touched.items()])
+        _touched.clear()
+
+
+def get(key: str, allow_expired: bool = False) -> Any:
+    """
+    캐시 값을 가져옵니다.
+
+    사용 시각(accessed_at)은 바로 쓰지 않고 메모리에 모아 두었다가 다음 저장(put) 때
+    함께 반영하므로 캐시 적중은 쓰기 없이 읽기만 합니다.
+
+    Args:
+        key: 캐시 키
+        allow_expired: True면 유효 시간이 지난 값도 반환
+
+    Returns:
+        캐시 값 또는 MISSING (없거나 만료된 경우)
+    """
+    if not config.PERSISTENT_CACHE_ENABLED:
+        return MISSING
+
+    now = time.time()
+    try:
+        with _lock:
+            conn = _get_conn()
+            row = conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[1] <= now and not allow_expired):
+                return MISSING
+            _touched[key] = now
+            if len(_touched) >= _TOUCH_FLUSH_SIZE:
+                _flush_touched(conn)
+                conn.commit()
+        return pickle.loads(row[0])
+    except Exception as e:
+        print(f"⚠️ 영구 캐시 읽기 실패 ({key}): {e}")
+        return MISSING
+
+
+def put(key: str, value: Any, ttl: float, func_name: str = '') -> None:
+    """
+    캐시 값을 저장하고, 전체 크기가 PERSISTENT_CACHE_MAX_BYTES를 넘으면 오래된 항목을 지웁니다.
+
+    Args:
+        key: 캐시 키
+        value: 저장할 값 (pickle 가능해야 함)
+        ttl: 유효 시간 (초)
+        func_name: 값을 만든 함수 이름 (통계/삭제용)
+    """
+    if not config.PERSISTENT_CACHE_ENABLED:
+        return
+
+    now = time.time()
+    try:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, func, value, created_at, expires_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, func_name, blob, now, now + ttl, now, len(blob))
+            )
+            _touched.pop(key, None)
+            _flush_touched(conn)
+            _evict(conn)
+            conn.commit()
+    except Exception as e:
+        print(f"⚠️ 영구 캐시 저장 실패 ({key}): {e}")
+
+
+def _evict(conn: sqlite3.Connection) -> None:
+    """전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다."""
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+    if total <= config.PERSISTENT_CACHE_MAX_BYTES:
+        return
+
+    for key, size in conn.execute("SELECT key, size FROM cache ORDER BY accessed_at").fetchall():
+        if total <= config.PERSISTENT_CACHE_MAX_BYTES:
+            break
+        conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        total -= size
+
+
+def clear(func_name: Optional[str] = None) -> None:
+    """
+    캐시를 비웁니다.
+
+    Args:
+        func_name: 지정하면 해당 함수의 항목만 삭제
+    """
+    try:
+        with _lock:
+            conn = _get_conn()
+            if func_name is None:
+                _touched.clear()
+                conn.execute("DELETE FROM cache")
+            else:
+                conn.execute("DELETE FROM cache WHERE func = ?", (func_name,))
+            conn.commit()
+    except Exception as e:
+        print(f"⚠️ 영구 캐시 초기화 실패: {e}")
+
+
+def make_key(func_name: str, bound_args: Tuple) -> str:
+    """함수 이름과 인자로 캐시 키를 만듭니다 (예: "data_fetcher.fetch_us_etf_data('JEPI', 3)")."""
+    return f"{func_name}{bound_args!r}"
+
+
+def cached(ttl: Union[float, Callable[[], float]] = config.CACHE_TTL) -> Callable:
+    """
+    함수 결과를 영구 캐시에 저장하는 데코레이터.
+
+    인자는 기본값까지 채운 뒤 키로 사용하므로 fetch(x)와 fetch(x, retries=3)은
+    같은 항목을 공유합니다. None이나 빈 DataFrame(조회 실패)은 저장하지 않고,
+    유효 시간이 지난 이전 값이 남아 있으면 그 값을 대신 반환합니다
+    (제공자 장애 중에는 마지막 정상 값을 표시). 캐시에 없는 같은 인자의 호출이
+    동시에 들어오면 조회는 한 번만 실행되고 나머지는 그 결과를 기다려 받습니다.
+    조회를 맡은 호출은 실행 직전에 캐시를 다시 확인하므로, 앞선 조회가 막 저장한
+    값이 있으면 제공자를 다시 부르지 않습니다.
+
+    데코레이트된 함수에는 다음 속성이 추가됩니다.
+        refresh(*args, **kwargs): 캐시를 무시하고 새로 조회한 뒤 저장
+        cache_key(*args, **kwargs): 인자에 해당하는 캐시 키
+
+    Args:
+        ttl: 유효 시간 (초) 또는 저장할 때마다 유효 시간을 계산하는 함수
+             (예: market_hours.ttl_policy(market_hours.NYSE) - 장이 닫혀 있으면 다음 개장까지)
+
+    Examples:
+        >>> @cached(ttl=300)
+        ... def fetch_us_etf_data(ticker): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        func_name = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+
+        def cache_key(*args, **kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return make_key(func_name, tuple(bound.arguments.values()))
+
+        def fetch_and_store(key, args, kwargs):
+            value = func(*args, **kwargs)
+            if _is_empty_result(value):
+                stale = get(key, allow_expired=True)
+                return value if stale is MISSING else stale
+            put(key, value, ttl() if callable(ttl) else ttl, func_name)
+            return value
+
+        def load(key, args, kwargs):
+            # 캐시 확인과 조회 시작 사이에 앞선 조회가 끝나 저장했을 수 있으므로 다시 확인
+            value = get(key)
+            return fetch_and_store(key, args, kwargs) if value is MISSING else value
+
+        def refresh(*args, **kwargs):
+            # 같은 키를 동시에 조회하면 한 번만 실행하고 결과를 공유
+            key = cache_key(*args, **kwargs)
+            return _flights.do(key, fetch_and_store, key, args, kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = cache_key(*args, **kwargs)
+            start = time.perf_counter()
+            value = get(key)
+            metrics.record_cache_lookup('persistent', value is not MISSING, function=func.__qualname__)
+            if value is MISSING:
+                value = _flights.do(key, load, key, args, kwargs)
+            elapsed = time.perf_counter() - start
+            metrics.observe(metrics.FETCH_LATENCY, elapsed, function=func.__qualname__)
+            metrics.record_call(key, elapsed)
+            return value
+
+        wrapper.refresh = refresh
+        wrapper.cache_key = cache_key
+        wrapper.func_name = func_name
+        return wrapper
+
+    return decorator
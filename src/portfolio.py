@@ -0,0 +1,213 @@
+"""
+포트폴리오 평가 모듈
+관심 종목 CSV의 보유 수량/평균 매입가와 실시간 시세, 환율로
+평가액, 손익, 목표 비중 대비 현재 비중, 세후 배당금을 계산합니다.
+
+모든 계산은 종목 전체에 대한 pandas/NumPy 벡터 연산으로 처리합니다.
+"""
+
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+import config
+import utils
+
+
+# 보유 정보 컬럼 (관심 종목 CSV에 선택적으로 추가)
+# shares: 보유 수량, avg_price: 평균 매입가 (종목 통화 기준)
+HOLDING_COLUMNS = ['shares', 'avg_price']
+
+# 계좌 구분
+ISA_ACCOUNT = 'ISA'
+DIRECT_ACCOUNT = '직투'
+
+_POSITION_COLUMNS = ['account', 'ticker', 'name', 'currency', 'price', 'change_percent',
+                     'dividend_yield', 'target_ratio', 'shares', 'avg_price']
+_VALUE_COLUMNS = ['fx', 'market_value', 'market_value_krw', 'cost_basis_krw', 'pnl_krw', 'return_pct',
+                  'weight', 'weight_gap', 'annual_dividend_krw', 'after_tax_dividend_krw', 'monthly_dividend_krw']
+
+
+def extract_holdings(watchlist_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    관심 종목 DataFrame에서 보유 수량과 평균 매입가를 꺼냅니다.
+
+    CSV에 shares / avg_price 컬럼이 없거나 비어 있으면 0으로 채웁니다.
+
+    Args:
+        watchlist_df: load_watchlist 결과
+
+    Returns:
+        columns: ticker, shares, avg_price
+    """
+    if 'ticker' not in watchlist_df:
+        return pd.DataFrame(columns=['ticker'] + HOLDING_COLUMNS)
+
+    holdings = pd.DataFrame({'ticker': watchlist_df['ticker'].astype(str)})
+    for column in HOLDING_COLUMNS:
+        if column in watchlist_df:
+            holdings[column] = pd.to_numeric(watchlist_df[column], errors='coerce').fillna(0.0)
+        else:
+            holdings[column] = 0.0
+
+    # 같은 종목이 여러 줄이면 수량 합산, 평균 매입가는 수량 가중 평균
+    if holdings['ticker'].duplicated().any():
+        holdings['cost'] = holdings['shares'] * holdings['avg_price']
+        holdings = holdings.groupby('ticker', as_index=False, sort=False)[['shares', 'cost']].sum()
+        holdings['avg_price'] = np.where(holdings['shares'] > 0,
+                                         holdings['cost'] / holdings['shares'].where(holdings['shares'] > 0), 0.0)
+        holdings = holdings.drop(columns='cost')
+
+    return holdings
+
+
+def build_positions(enriched_df: pd.DataFrame, watchlist_df: pd.DataFrame, account: str) -> pd.DataFrame:
+    """
+    시세가 추가된 관심 종목과 보유 정보를 합쳐 계좌의 포지션 표를 만듭니다.
+
+    Args:
+        enriched_df: enrich_watchlist_with_data 결과
+        watchlist_df: 같은 계좌의 관심 종목 CSV (보유 정보 포함)
+        account: 계좌 이름 (ISA_ACCOUNT, DIRECT_ACCOUNT)
+
+    Returns:
+        columns: account, ticker, name, currency, price, change_percent,
+                 dividend_yield, target_ratio, shares, avg_price
+    """
+    if enriched_df.empty:
+        return pd.DataFrame(columns=_POSITION_COLUMNS)
+
+    positions = enriched_df.drop(columns=HOLDING_COLUMNS, errors='ignore').copy()
+    positions['ticker'] = positions['ticker'].astype(str)
+    positions = positions.drop_duplicates('ticker').merge(extract_holdings(watchlist_df), on='ticker', how='left')
+    positions[HOLDING_COLUMNS] = positions[HOLDING_COLUMNS].fillna(0.0)
+    positions['account'] = account
+
+    return positions[_POSITION_COLUMNS]
+
+
+def value_positions(positions: pd.DataFrame, exchange_rate: float) -> pd.DataFrame:
+    """
+    포지션 전체의 평가액, 손익, 비중, 배당금을 계산합니다 (원화 기준).
+
+    비중은 계좌 안에서의 평가액 비중이며 목표 비중(target_ratio)과의 차이를 함께 구합니다.
+    세후 배당금은 utils.calculate_after_tax_dividend와 같은 세율을 적용하고,
+    ISA 계좌는 배당금 합계 중 비과세 한도(ISA_TAX_FREE_LIMIT)를 넘는 부분만
+    ISA_EXCESS_TAX로 분리과세한다고 가정합니다.
+
+    Args:
+        positions: build_positions 결과 (여러 계좌를 이어 붙여도 됨)
+        exchange_rate: USD/KRW 환율
+
+    Returns:
+        positions에 fx, market_value, market_value_krw, cost_basis_krw, pnl_krw, return_pct,
+        weight, weight_gap, annual_dividend_krw, after_tax_dividend_krw, monthly_dividend_krw 컬럼 추가
+    """
+    df = positions.copy()
+    if df.empty:
+        return df.reindex(columns=list(df.columns) + _VALUE_COLUMNS)
+
+    is_usd = (df['currency'] == 'USD').to_numpy()
+    price = pd.to_numeric(df['price'], errors='coerce').to_numpy(dtype=float)
+    shares = df['shares'].to_numpy(dtype=float)
+    avg_price = df['avg_price'].to_numpy(dtype=float)
+    dividend_yield = pd.to_numeric(df['dividend_yield'], errors='coerce').fillna(0).to_numpy(dtype=float)
+    target_ratio = pd.to_numeric(df['target_ratio'], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+    fx = np.where(is_usd, exchange_rate, 1.0)
+    market_value = price * shares
+    market_value_krw = market_value * fx
+    cost_basis_krw = avg_price * shares * fx
+    pnl_krw = market_value_krw - cost_basis_krw
+
+    df['fx'] = fx
+    df['market_value'] = market_value
+    df['market_value_krw'] = market_value_krw
+    df['cost_basis_krw'] = cost_basis_krw
+    df['pnl_krw'] = pnl_krw
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['return_pct'] = np.where(cost_basis_krw > 0, pnl_krw / cost_basis_krw * 100, np.nan)
+
+    # 계좌별 비중 (평가액 합계가 0인 계좌는 0)
+    account_total = df.groupby('account')['market_value_krw'].transform('sum').to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = np.where(account_total > 0, np.nan_to_num(market_value_krw) / account_total * 100, 0.0)
+    df['weight'] = weight
+    df['weight_gap'] = weight - target_ratio
+
+    # 배당금 (세전 → 세후)
+    annual_dividend = np.nan_to_num(market_value_krw) * dividend_yield / 100
+    tax_factor = np.where(is_usd, utils.calculate_after_tax_dividend(1.0, is_us=True),
+                          utils.calculate_after_tax_dividend(1.0, is_us=False))
+
+    is_isa = (df['account'] == ISA_ACCOUNT).to_numpy()
+    if is_isa.any():
+        isa_total = annual_dividend[is_isa].sum()
+        excess = max(0.0, isa_total - config.ISA_TAX_FREE_LIMIT)
+        isa_factor = 1 - config.ISA_EXCESS_TAX * (excess / isa_total) if isa_total > 0 else 1.0
+        tax_factor = np.where(is_isa, isa_factor, tax_factor)
+
+    df['annual_dividend_krw'] = annual_dividend
+    df['after_tax_dividend_krw'] = annual_dividend * tax_factor
+    df['monthly_dividend_krw'] = df['after_tax_dividend_krw'] / 12
+
+    return df
+
+
+def summarize(valued: pd.DataFrame) -> pd.DataFrame:
+    """
+    계좌별 / 전체 합계를 계산합니다.
+
+    시세가 없는 보유 종목은 평가액과 손익 합계에서 빠지므로, 수익률도 시세가 있는
+    종목의 매입액만으로 계산하고 빠진 종목 수는 unpriced로 따로 알려줍니다
+    (cost_basis_krw는 모든 보유 종목의 매입액 합계).
+
+    Args:
+        valued: value_positions 결과
+
+    Returns:
+        index: 계좌 이름 + '전체', columns: market_value_krw, cost_basis_krw, pnl_krw,
+        return_pct, annual_dividend_krw, after_tax_dividend_krw, monthly_dividend_krw, unpriced
+    """
+    sum_columns = ['market_value_krw', 'cost_basis_krw', 'pnl_krw',
+                   'annual_dividend_krw', 'after_tax_dividend_krw', 'monthly_dividend_krw']
+    if valued.empty:
+        return pd.DataFrame(columns=sum_columns + ['return_pct', 'unpriced'])
+
+    priced = valued['market_value_krw'].notna()
+    totals = valued[sum_columns].assign(
+        priced_cost_krw=valued['cost_basis_krw'].where(priced, 0.0),
+        unpriced=(~priced & (valued['shares'] > 0)).astype(int)
+    )
+    by_account = totals.groupby(valued['account'], sort=False).sum()
+    by_account.loc['전체'] = by_account.sum()
+    cost = by_account.pop('priced_cost_krw')
+    by_account['return_pct'] = (by_account['pnl_krw'] / cost.where(cost > 0)) * 100
+    by_account['unpriced'] = by_account.pop('unpriced').astype(int)
+
+    return by_account
+
+
+def value_portfolio(accounts: Dict[str, tuple], exchange_rate: Optional[float] = None) -> Dict[str, pd.DataFrame]:
+    """
+    여러 계좌를 한 번에 평가합니다.
+
+    Args:
+        accounts: {계좌 이름: (enriched_df, watchlist_df)}
+        exchange_rate: USD/KRW 환율 (None이면 기본 환율)
+
+    Returns:
+        {'positions': value_positions 결과, 'summary': summarize 결과}
+
+    Examples:
+        >>> result = value_portfolio({ISA_ACCOUNT: (isa_data, isa_watchlist)}, 1380)
+        >>> result['summary'].loc['전체', 'market_value_krw']
+    """
+    if exchange_rate is None:
+        exchange_rate = config.DEFAULT_USD_KRW
+
+    frames = [build_positions(enriched, watchlist, account) for account, (enriched, watchlist) in accounts.items()]
+    frames = [frame for frame in frames if not frame.empty]
+    positions = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=_POSITION_COLUMNS)
+
+    valued = value_positions(positions, exchange_rate)
+    return {'positions': valued, 'summary': summarize(valued)}
@@ -0,0 +1,192 @@
+"""
+시세 저장소 모듈
+FinanceDataReader 일봉(OHLCV) 데이터를 종목별 로컬 파일에 쌓아두고,
+새로 고칠 때는 마지막 저장일 이후의 데이터만 받아서 병합합니다.
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+import threading
+import time
+import config
+import metrics
+import providers
+import resilience
+
+
+# 종목별 메모리 캐시: {'history': DataFrame, 'checked_at': float}
+_histories: Dict[str, Dict] = {}
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _get_lock(ticker: str) -> threading.Lock:
+    """종목별 락을 반환합니다 (같은 종목을 동시에 두 번 갱신하지 않도록)."""
+    with _locks_guard:
+        if ticker not in _locks:
+            _locks[ticker] = threading.Lock()
+        return _locks[ticker]
+
+
+def _history_path(ticker: str) -> Path:
+    """종목별 저장 파일 경로 (예: '069500' → ohlcv/069500.csv, 'USD/KRW' → ohlcv/USD_KRW.csv)"""
+    return config.PRICE_STORE_DIR / f"{ticker.replace('/', '_')}.csv"
+
+
+def _read_history(ticker: str) -> pd.DataFrame:
+    """저장된 일봉 데이터를 읽습니다 (없으면 빈 DataFrame)."""
+    try:
+        return pd.read_csv(_history_path(ticker), index_col=0, parse_dates=True)
+    except FileNotFoundError:
+        return pd.DataFrame()
+    except Exception as e:
+        print(f"⚠️ {ticker} 저장된 시세 로드 실패: {e}")
+        return pd.DataFrame()
+
+
+def _write_history(ticker: str, history: pd.DataFrame) -> None:
+    """일봉 데이터를 저장합니다."""
+    try:
+        config.PRICE_STORE_DIR.mkdir(parents=True, exist_ok=True)
+        history.to_csv(_history_path(ticker))
+    except Exception as e:
+        print(f"⚠️ {ticker} 시세 저장 실패: {e}")
+
+
+def _append_history(ticker: str, rows: pd.DataFrame) -> None:
+    """저장 파일 끝에 새 일봉 행만 추가합니다."""
+    try:
+        rows.to_csv(_history_path(ticker), mode='a', header=False)
+    except Exception as e:
+        print(f"⚠️ {ticker} 시세 저장 실패: {e}")
+
+
+def changed_rows(stored: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """
+    새로 받은 일봉 중 저장된 데이터에 없거나 값이 바뀐 행만 남깁니다.
+
+    마지막 저장일을 다시 받기 때문에 겹치는 날짜가 항상 생기며, 값이 같으면 버립니다.
+
+    Args:
+        stored: 기존 일봉 데이터
+        delta: 새로 받은 일봉 데이터
+
+    Returns:
+        새 날짜 또는 값이 바뀐 날짜의 행 (delta 순서)
+    """
+    if stored.empty or delta.empty or not delta.columns.isin(stored.columns).all():
+        return delta
+
+    overlap = delta.index.isin(stored.index)
+    if not overlap.any():
+        return delta
+
+    try:
+        new_values = delta[overlap].to_numpy(dtype=float)
+        old_values = stored.loc[delta.index[overlap], delta.columns].to_numpy(dtype=float)
+    except (ValueError, TypeError):
+        return delta  # 숫자가 아닌 컬럼은 비교하지 않고 모두 바뀐 것으로 봄
+    same = np.isclose(new_values, old_values, equal_nan=True).all(axis=1)
+    keep = ~overlap
+    keep[np.flatnonzero(overlap)[~same]] = True
+    return delta[keep]
+
+
+def merge_history(stored: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """
+    저장된 일봉 데이터에 새로 받은 데이터를 병합합니다.
+
+    같은 날짜가 겹치면 새로 받은 값을 사용합니다 (장중에 저장된 마지막 봉 갱신).
+
+    Args:
+        stored: 기존 일봉 데이터
+        delta: 새로 받은 일봉 데이터
+
+    Returns:
+        날짜순으로 정렬된 병합 결과
+    """
+    if stored.empty:
+        return delta.sort_index()
+    if delta.empty:
+        return stored
+
+    merged = pd.concat([stored, delta])
+    merged = merged[~merged.index.duplicated(keep='last')]
+    return merged.sort_index()
+
+
+def get_history(ticker: str, start: str = config.PRICE_HISTORY_START,
+                max_age: Optional[float] = None) -> pd.DataFrame:
+    """
+    종목의 일봉 데이터를 반환합니다.
+
+    저장된 데이터가 없으면 start부터 전체를 받고, 있으면 마지막 저장일부터의
+    데이터만 받아서 병합합니다. 바뀐 행이 없으면 파일을 쓰지 않고, 새 날짜만 있으면
+    파일 끝에 추가합니다 (마지막 저장일 값이 바뀐 경우에만 전체를 다시 씀). 마지막 확인 후 max_age초가 지나지 않았으면
+    네트워크 요청 없이 메모리에 있는 데이터를 그대로 반환합니다.
+
+    Args:
+        ticker: 종목코드 (예: "069500") 또는 FinanceDataReader 심볼 (예: "USD/KRW")
+        start: 저장된 데이터가 없을 때 받기 시작할 날짜
+        max_age: 재확인 간격 (초, None이면 PRICE_STORE_MIN_REFRESH)
+
+    Returns:
+        날짜 인덱스의 OHLCV DataFrame
+
+    Raises:
+        Exception: 저장된 데이터가 없는데 다운로드에도 실패한 경우
+    """
+    ticker = str(ticker)
+    if max_age is None:
+        max_age = config.PRICE_STORE_MIN_REFRESH
+
+    entry = _histories.get(ticker)
+    if entry is not None and time.time() - entry['checked_at'] < max_age:
+        metrics.record_cache_lookup('price_store', True)
+        return entry['history']
+
+    metrics.record_cache_lookup('price_store', False)
+    with _get_lock(ticker):
+        entry = _histories.get(ticker)
+        if entry is not None and time.time() - entry['checked_at'] < max_age:
+            return entry['history']
+
+        stored = entry['history'] if entry is not None else _read_history(ticker)
+
+        # 마지막 저장일도 다시 받음 (장중에 저장된 봉을 최종 값으로 갱신)
+        fetch_start = stored.index[-1].strftime('%Y-%m-%d') if not stored.empty else start
+
+        try:
+            delta = resilience.guarded(resilience.FDR, providers.get(resilience.FDR).get_history, ticker, fetch_start)
+        except Exception as e:
+            if stored.empty:
+                raise
+            print(f"⚠️ {ticker} 신규 시세 가져오기 실패, 저장된 데이터 사용: {e}")
+            delta = pd.DataFrame()
+
+        # 겹치는 날짜 중 값이 같은 행은 버리고, 새 날짜만 있으면 파일 끝에 추가
+        delta = changed_rows(stored, delta)
+        history = merge_history(stored, delta)
+        if not delta.empty:
+            appendable = (not stored.empty and delta.index.min() > stored.index[-1]
+                          and delta.columns.equals(stored.columns) and _history_path(ticker).exists())
+            if appendable:
+                _append_history(ticker, delta)
+            else:
+                _write_history(ticker, history)
+
+        _histories[ticker] = {'history': history, 'checked_at': time.time()}
+        return history
+
+
+def invalidate(ticker: str) -> None:
+    """다음 조회 시 신규 데이터를 다시 확인하도록 종목의 메모리 캐시를 지웁니다."""
+    _histories.pop(str(ticker), None)
+
+
+def invalidate_many(tickers: Iterable[str]) -> None:
+    """여러 종목의 메모리 캐시를 지웁니다 (저장된 파일은 유지)."""
+    for ticker in tickers:
+        invalidate(ticker)
@@ -0,0 +1,228 @@
+"""
+데이터 제공자 모듈
+시세/일봉/종목 목록/환율 조회를 DataProvider 인터페이스로 추상화합니다.
+yfinance와 FinanceDataReader 구현, 그리고 실제 응답을 파일로 기록했다가
+네트워크 없이 재생하는 기록/재생 제공자를 제공합니다.
+
+yfinance / FinanceDataReader는 무거우므로 실제 조회가 일어날 때 메서드 안에서 import합니다.
+캐시만으로 화면을 그리는 실행에서는 두 패키지를 전혀 불러오지 않습니다.
+"""
+
+import hashlib
+import pickle
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import pandas as pd
+import config
+from resilience import YFINANCE, FDR
+
+
+# 제공자 동작 모드
+LIVE = 'live'  # 실제 API 호출
+RECORD = 'record'  # 실제 API 호출 + 응답을 파일로 기록
+REPLAY = 'replay'  # 기록된 응답만 사용 (네트워크 없음)
+
+
+class DataProvider:
+    """
+    데이터 제공자 인터페이스.
+
+    제공자가 지원하지 않는 메서드는 NotImplementedError를 던집니다
+    (예: FinanceDataReader는 get_info 미지원).
+    """
+
+    name = 'base'
+
+    def get_info(self, ticker: str) -> Dict:
+        """종목 정보 딕셔너리 (현재가, 전일 종가, 종목명, 배당률 등 - yfinance info 형식)"""
+        raise NotImplementedError(f"{self.name}: get_info 미지원")
+
+    def get_recent_history(self, ticker: str, period: str = '1d') -> pd.DataFrame:
+        """최근 기간(period: '1d', '5d', '1mo' 등)의 일봉 데이터"""
+        raise NotImplementedError(f"{self.name}: get_recent_history 미지원")
+
+    def download(self, tickers: List[str], period: str = '1mo') -> pd.DataFrame:
+        """여러 종목의 일봉 데이터를 한 번에 조회 (columns: (항목, 티커) MultiIndex)"""
+        raise NotImplementedError(f"{self.name}: download 미지원")
+
+    def get_history(self, symbol: str, start: str) -> pd.DataFrame:
+        """start 이후 일봉 데이터 (종목코드 또는 'USD/KRW' 같은 환율 심볼)"""
+        raise NotImplementedError(f"{self.name}: get_history 미지원")
+
+    def get_listing(self, market: str) -> pd.DataFrame:
+        """시장별 종목 목록 ('ETF/KR', 'KRX' 등)"""
+        raise NotImplementedError(f"{self.name}: get_listing 미지원")
+
+    def get_fx_rate(self, pair: str = 'KRW=X') -> Optional[float]:
+        """현재 환율 (예: 'KRW=X' → 1달러당 원화)"""
+        raise NotImplementedError(f"{self.name}: get_fx_rate 미지원")
+
+
+class YFinanceProvider(DataProvider):
+    """yfinance 기반 제공자 (미국 종목, 환율)"""
+
+    name = YFINANCE
+
+    def get_info(self, ticker: str) -> Dict:
+        import yfinance as yf
+        return yf.Ticker(ticker).info
+
+    def get_recent_history(self, ticker: str, period: str = '1d') -> pd.DataFrame:
+        import yfinance as yf
+        return yf.Ticker(ticker).history(period=period)
+
+    def download(self, tickers: List[str], period: str = '1mo') -> pd.DataFrame:
+        import yfinance as yf
+        return yf.download(tickers, period=period, interval='1d', group_by='column',
+                           auto_adjust=True, progress=False, threads=True)
+
+    def get_fx_rate(self, pair: str = 'KRW=X') -> Optional[float]:
+        return self.get_info(pair).get('regularMarketPrice')
+
+
+class FinanceDataReaderProvider(DataProvider):
+    """FinanceDataReader 기반 제공자 (한국 종목 일봉, 종목 목록, 환율 일봉)"""
+
+    name = FDR
+
+    def get_history(self, symbol: str, start: str) -> pd.DataFrame:
+        import FinanceDataReader as fdr
+        return fdr.DataReader(symbol, start=start)
+
+    def get_listing(self, market: str) -> pd.DataFrame:
+        import FinanceDataReader as fdr
+        return fdr.StockListing(market)
+
+
+class RecordReplayProvider(DataProvider):
+    """
+    응답 기록/재생 제공자.
+
+    RECORD 모드에서는 내부 제공자를 호출하고 응답을 파일(pickle)로 저장하며,
+    REPLAY 모드에서는 저장된 응답만 반환합니다. 재생 시 latency(초)만큼
+    지연을 넣어 실제 네트워크 조회와 비슷한 조건에서 성능을 측정할 수 있습니다.
+
+    기록 파일 위치: {directory}/{제공자 이름}/{메서드}/{인자 해시}.pkl
+    """
+
+    def __init__(self, name: str, mode: str, directory: Path, inner: Optional[DataProvider] = None,
+                 latency: float = 0.0, jitter: float = 0.0):
+        if mode == RECORD and inner is None:
+            raise ValueError("RECORD 모드에는 내부 제공자가 필요합니다.")
+        self.name = name
+        self.mode = mode
+        self.directory = Path(directory) / name
+        self.inner = inner
+        self.latency = latency
+        self.jitter = jitter
+        self._lock = threading.Lock()
+
+    def _path(self, method: str, args: tuple) -> Path:
+        digest = hashlib.sha1(repr(args).encode('utf-8')).hexdigest()
+        return self.directory / method / f"{digest}.pkl"
+
+    def _call(self, method: str, *args) -> Any:
+        path = self._path(method, args)
+
+        if self.mode == REPLAY:
+            if self.latency or self.jitter:
+                time.sleep(self.latency + random.uniform(0, self.jitter))
+            try:
+                with open(path, 'rb') as f:
+                    recorded = pickle.load(f)
+            except FileNotFoundError:
+                raise LookupError(f"{self.name}.{method}{args} 기록 없음") from None
+            if isinstance(recorded, BaseException):
+                raise recorded
+            return recorded
+
+        # RECORD: 실패 응답도 기록해서 재생 시 같은 오류를 재현
+        try:
+            result = getattr(self.inner, method)(*args)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            self._save(path, e)
+            raise
+        self._save(path, result)
+        return result
+
+    def _save(self, path: Path, value: Any) -> None:
+        try:
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'wb') as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ 응답 기록 실패 ({path}): {e}")
+
+    def get_info(self, ticker: str) -> Dict:
+        return self._call('get_info', ticker)
+
+    def get_recent_history(self, ticker: str, period: str = '1d') -> pd.DataFrame:
+        return self._call('get_recent_history', ticker, period)
+
+    def download(self, tickers: List[str], period: str = '1mo') -> pd.DataFrame:
+        return self._call('download', tuple(tickers), period)
+
+    def get_history(self, symbol: str, start: str) -> pd.DataFrame:
+        return self._call('get_history', symbol, start)
+
+    def get_listing(self, market: str) -> pd.DataFrame:
+        return self._call('get_listing', market)
+
+    def get_fx_rate(self, pair: str = 'KRW=X') -> Optional[float]:
+        return self._call('get_fx_rate', pair)
+
+
+_LIVE_PROVIDERS = {
+    YFINANCE: YFinanceProvider,
+    FDR: FinanceDataReaderProvider,
+}
+
+_providers: Dict[str, DataProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def _create(name: str) -> DataProvider:
+    """config.PROVIDER_MODE에 맞는 제공자를 만듭니다."""
+    mode = config.PROVIDER_MODE
+    if mode == LIVE:
+        return _LIVE_PROVIDERS[name]()
+    if mode == RECORD:
+        return RecordReplayProvider(name, RECORD, config.PROVIDER_RECORDINGS_DIR, inner=_LIVE_PROVIDERS[name]())
+    if mode == REPLAY:
+        return RecordReplayProvider(name, REPLAY, config.PROVIDER_RECORDINGS_DIR,
+                                    latency=config.REPLAY_LATENCY, jitter=config.REPLAY_LATENCY_JITTER)
+    raise ValueError(f"알 수 없는 제공자 모드: {mode}")
+
+
+def get(name: str) -> DataProvider:
+    """
+    이름에 해당하는 제공자를 반환합니다 (프로세스당 하나씩 생성).
+
+    Args:
+        name: YFINANCE 또는 FDR
+    """
+    with _providers_lock:
+        if name not in _providers:
+            _providers[name] = _create(name)
+        return _providers[name]
+
+
+def set_provider(name: str, provider: Optional[DataProvider]) -> None:
+    """
+    제공자를 교체합니다 (벤치마크/테스트에서 가짜 제공자 주입용).
+
+    Args:
+        name: YFINANCE 또는 FDR
+        provider: 사용할 제공자 (None이면 다음 get 호출 시 config 기준으로 다시 생성)
+    """
+    with _providers_lock:
+        if provider is None:
+            _providers.pop(name, None)
+        else:
+            _providers[name] = provider
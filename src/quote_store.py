@@ -0,0 +1,114 @@
+"""
+시세 저장소 (메모리) 모듈
+종목 단위 시세(현재가, 등락률, 배당률 등)를 (티커, 시장) 키로 프로세스 전체에서 공유합니다.
+관심 종목, HOT 종목, 검색, 상세 정보가 모두 이 저장소를 거치므로 같은 종목은
+유효 시간 안에 한 번만 조회됩니다. 메모리 한도를 넘으면 가장 오래 사용하지 않은 종목부터 지웁니다.
+"""
+
+import copy
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+import config
+import market_hours
+import metrics
+
+
+# 시장 구분
+US = 'US'
+KR = 'KR'
+
+# 시장별 거래소 (시세 유효 시간 계산용)
+EXCHANGES = {US: market_hours.NYSE, KR: market_hours.KRX}
+
+Key = Tuple[str, str]
+
+
+class QuoteStore:
+    """
+    LRU 방식의 종목 시세 저장소.
+
+    항목: (티커, 시장) → {'quote': 시세 딕셔너리, 'expires_at': 만료 시각, 'size': 바이트}
+
+    만료 시각은 저장할 때 시장별 거래 시간으로 정합니다 (장중 CACHE_TTL, 장이 닫혀 있으면 다음 개장까지).
+    """
+
+    def __init__(self, max_bytes: int = config.QUOTE_STORE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: 'OrderedDict[Key, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, ticker: str, market: str) -> Optional[Dict]:
+        """
+        저장된 시세를 반환합니다.
+
+        Args:
+            ticker: 티커 또는 종목코드
+            market: US 또는 KR
+
+        Returns:
+            시세 딕셔너리 복사본 또는 None (없거나 오래된 경우)
+        """
+        key = (str(ticker), market)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None and now < entry['expires_at']
+            if hit:
+                self._entries.move_to_end(key)
+                quote = entry['quote']
+
+        metrics.record_cache_lookup('quote_store', hit, market=market)
+        return copy.copy(quote) if hit else None
+
+    def put(self, ticker: str, market: str, quote: Dict) -> None:
+        """시세를 저장하고, 메모리 한도를 넘으면 오래 사용하지 않은 종목부터 지웁니다."""
+        if not quote:
+            return
+        key = (str(ticker), market)
+        size = len(pickle.dumps(quote, protocol=pickle.HIGHEST_PROTOCOL))
+        exchange = EXCHANGES.get(market)
+        ttl = market_hours.cache_ttl(exchange) if exchange else config.CACHE_TTL
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old['size']
+            now = time.time()
+            self._entries[key] = {'quote': copy.copy(quote), 'expires_at': now + ttl, 'size': size}
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= evicted['size']
+                metrics.inc(metrics.QUOTE_STORE_EVICTIONS)
+
+    def put_many(self, quotes: Iterable[Dict], market: str) -> None:
+        """여러 종목 시세를 한 번에 저장합니다 (각 시세의 'ticker' 사용)."""
+        for quote in quotes:
+            self.put(quote['ticker'], market, quote)
+
+    def invalidate(self, ticker: str, market: Optional[str] = None) -> None:
+        """종목 시세를 지웁니다 (market이 None이면 모든 시장)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == str(ticker) and market in (None, key[1])]:
+                self.total_bytes -= self._entries.pop(key)['size']
+
+    def clear(self) -> None:
+        """저장된 시세를 모두 지웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict:
+        """저장소 상태 {'entries', 'bytes', 'max_bytes'}"""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.total_bytes, 'max_bytes': self.max_bytes}
+
+
+# 프로세스 전체에서 공유하는 저장소
+store = QuoteStore()
@@ -0,0 +1,259 @@
+"""
+장애 대응 모듈
+데이터 제공자 호출에 지수 백오프(지터 포함) 재시도와 제공자별 서킷 브레이커를 적용합니다.
+제공자 장애 시에는 연속 실패 후 요청을 바로 차단하고, 백그라운드에서 복구 여부를 확인합니다.
+연결 오류, 시간 초과, 5xx/429 응답만 장애로 보고, 없는 종목이나 빈 결과는 재시도하지도
+실패로 세지도 않습니다.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+import config
+import metrics
+
+
+# 데이터 제공자 이름
+YFINANCE = 'yfinance'
+FDR = 'fdr'
+
+# 서킷 상태
+CLOSED = 'closed'  # 정상 (모든 요청 허용)
+OPEN = 'open'  # 차단 (요청 즉시 실패)
+HALF_OPEN = 'half_open'  # 복구 확인 중 (요청 하나만 허용)
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않았을 때 발생하는 예외"""
+
+
+class SymbolNotFoundError(LookupError):
+    """제공자는 정상 응답했지만 종목 데이터가 없을 때 발생하는 예외 (없는 티커, 빈 응답)"""
+
+
+def _http_status(error: BaseException) -> Optional[int]:
+    """HTTP 오류 예외의 응답 상태 코드 (requests/curl_cffi: response.status_code, urllib: code)"""
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is None:
+        status = getattr(error, 'code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """
+    제공자 장애로 인한 예외인지 확인합니다.
+
+    연결 오류, 시간 초과, 5xx / 429(요청 한도 초과) 응답만 장애로 봅니다.
+    404 같은 4xx 응답, SymbolNotFoundError, 응답 파싱 오류는 요청한 종목의 문제이므로
+    다시 요청해도 결과가 같고, 서킷 브레이커의 실패로 세지 않습니다.
+
+    Examples:
+        >>> is_provider_failure(TimeoutError())
+        True
+        >>> is_provider_failure(SymbolNotFoundError('QQXA'))
+        False
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = _http_status(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    # yfinance는 요청 한도 초과를 YFRateLimitError로 알림
+    if 'RateLimit' in type(error).__name__:
+        return True
+    return isinstance(error, OSError)  # ConnectionError, TimeoutError, requests/curl_cffi 전송 오류
+
+
+class CircuitBreaker:
+    """
+    데이터 제공자 하나에 대한 서킷 브레이커.
+
+    연속 실패가 failure_threshold번 쌓이면 서킷을 열고 recovery_timeout 동안
+    요청을 차단합니다. probe 함수가 등록되어 있으면 백그라운드 스레드에서
+    복구를 확인해 성공 시 서킷을 닫고, 없으면 recovery_timeout 후 첫 요청을
+    시험 요청(half-open)으로 보냅니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = config.CIRCUIT_FAILURE_THRESHOLD,
+                 recovery_timeout: float = config.CIRCUIT_RECOVERY_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.probe: Optional[Callable[[], Any]] = None
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_attempt = 0
+        self._probe_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인합니다."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self.probe is None and time.time() - self.opened_at >= self.recovery_timeout:
+                # 시험 요청 하나만 통과
+                self.state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """요청 성공을 기록합니다 (서킷 닫기)."""
+        with self._lock:
+            if self.state != CLOSED:
+                print(f"✅ {self.name} 서킷 복구")
+            self._close()
+
+    def record_failure(self) -> None:
+        """요청 실패를 기록합니다 (한도를 넘으면 서킷 열기)."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self._open()
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._probe_attempt = 0
+        if self._probe_timer is not None:
+            self._probe_timer.cancel()
+            self._probe_timer = None
+
+    def _open(self) -> None:
+        print(f"⛔ {self.name} 서킷 열림 (연속 실패 {self.failures}회) - {self.recovery_timeout}초 동안 요청 차단")
+        self.state = OPEN
+        self.opened_at = time.time()
+        self._schedule_probe(self.recovery_timeout)
+
+    def _schedule_probe(self, delay: float) -> None:
+        """delay초 뒤 백그라운드에서 복구 확인 요청을 보냅니다."""
+        if self.probe is None:
+            return
+        self._probe_timer = threading.Timer(delay, self._run_probe)
+        self._probe_timer.daemon = True
+        self._probe_timer.start()
+
+    def _run_probe(self) -> None:
+        try:
+            self.probe()
+        except Exception as e:
+            with self._lock:
+                if self.state != OPEN:
+                    return
+                self._probe_attempt += 1
+                delay = backoff_delay(self._probe_attempt, base=self.recovery_timeout,
+                                      cap=config.CIRCUIT_MAX_RECOVERY_TIMEOUT)
+                print(f"⚠️ {self.name} 복구 확인 실패: {e} - {delay:.0f}초 후 재확인")
+                self._schedule_probe(delay)
+            return
+        self.record_success()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """데이터 제공자의 서킷 브레이커를 반환합니다 (없으면 생성)."""
+    with _breakers_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(provider)
+        return _breakers[provider]
+
+
+def register_probe(provider: str, probe: Callable[[], Any]) -> None:
+    """
+    서킷이 열렸을 때 백그라운드에서 실행할 복구 확인 함수를 등록합니다.
+
+    Args:
+        provider: 데이터 제공자 이름
+        probe: 가벼운 요청 하나를 보내고 실패 시 예외를 던지는 함수
+    """
+    get_breaker(provider).probe = probe
+
+
+def backoff_delay(attempt: int, base: float = config.RETRY_BACKOFF_BASE,
+                  cap: float = config.RETRY_BACKOFF_MAX) -> float:
+    """
+    지수 백오프 대기 시간을 계산합니다 (full jitter).
+
+    Args:
+        attempt: 재시도 횟수 (0부터)
+        base: 첫 대기 시간 상한 (초)
+        cap: 최대 대기 시간 (초)
+
+    Returns:
+        0 ~ min(cap, base * 2^attempt) 사이의 임의 대기 시간 (초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def guarded(provider: str, func: Callable, *args, **kwargs) -> Any:
+    """
+    서킷 브레이커를 거쳐 제공자 함수를 한 번 호출합니다.
+
+    func의 예외 중 제공자 장애(is_provider_failure)만 서킷 실패로 기록하고,
+    없는 종목 같은 오류는 제공자가 정상 응답한 것이므로 성공으로 기록합니다.
+
+    Raises:
+        CircuitOpenError: 서킷이 열려 있는 경우
+        Exception: func에서 발생한 예외
+    """
+    breaker = get_breaker(provider)
+    call = getattr(func, '__name__', 'call')
+    if not breaker.allow_request():
+        metrics.inc(metrics.PROVIDER_FAILURES, provider=provider, error='CircuitOpen')
+        raise CircuitOpenError(f"{provider} 요청 차단 중 (서킷 열림)")
+
+    metrics.inc(metrics.PROVIDER_CALLS, provider=provider, call=call)
+    try:
+        with metrics.timer(metrics.PROVIDER_LATENCY, provider=provider, call=call):
+            result = func(*args, **kwargs)
+    except Exception as e:
+        metrics.inc(metrics.PROVIDER_FAILURES, provider=provider, error=type(e).__name__)
+        if is_provider_failure(e):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        raise
+
+    breaker.record_success()
+    return result
+
+
+def retry(func: Callable, *args, retries: int = config.MAX_RETRIES, label: str = '', **kwargs) -> Any:
+    """
+    제공자 장애(is_provider_failure)로 실패하면 지수 백오프로 재시도합니다.
+    서킷이 열려 있거나 없는 종목 같은 오류는 재시도하지 않고 바로 실패합니다.
+
+    Args:
+        func: 호출할 함수
+        retries: 최대 시도 횟수
+        label: 로그에 표시할 이름 (예: 티커)
+
+    Raises:
+        CircuitOpenError: 서킷이 열려 있는 경우
+        Exception: 마지막 시도에서 발생한 예외
+    """
+    for attempt in range(retries):
+        try:
+            return func(*args, **kwargs)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            if not is_provider_failure(e):
+                print(f"⚠️ {label} 데이터 가져오기 실패: {e}")
+                raise
+            print(f"⚠️ {label} 데이터 가져오기 실패 (시도 {attempt + 1}/{retries}): {e}")
+            if attempt >= retries - 1:
+                raise
+            metrics.inc(metrics.PROVIDER_RETRIES, target=label or getattr(func, '__name__', 'call'))
+            time.sleep(backoff_delay(attempt))
+
+
+def call_with_retry(provider: str, func: Callable, *args, retries: int = config.MAX_RETRIES,
+                    label: str = '', **kwargs) -> Any:
+    """서킷 브레이커와 백오프 재시도를 함께 적용하여 제공자 함수를 호출합니다."""
+    return retry(guarded, provider, func, *args, retries=retries, label=label, **kwargs)
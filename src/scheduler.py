@@ -0,0 +1,172 @@
+"""
+백그라운드 데이터 갱신 모듈
+APScheduler로 워치리스트, 환율, HOT 종목 데이터를 캐시 만료 전에 미리 갱신합니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+import config
+import data_fetcher
+import fx_service
+import market_hours
+import metrics
+import quote_store
+import search_index
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+
+HOT_LIMIT = 10
+
+_scheduler: Optional['BackgroundScheduler'] = None
+
+
+def _is_active(exchange: market_hours.Exchange) -> bool:
+    """시세를 강제로 새로 조회할 시간인지 (장중 또는 마감 후 유예 시간, 거래 시간 TTL을 끄면 항상)"""
+    return not config.MARKET_HOURS_TTL_ENABLED or market_hours.is_active(exchange)
+
+
+def _updater(func, exchange: market_hours.Exchange):
+    """
+    갱신에 사용할 함수를 고릅니다.
+
+    장중(마감 후 유예 시간 포함)에는 캐시를 무시하고 새로 조회하는 func.refresh,
+    장이 닫혀 있으면 시세가 바뀌지 않으므로 캐시가 없거나 만료된 경우에만 조회하는 func를 반환합니다.
+    """
+    if _is_active(exchange):
+        return func.refresh
+    return func
+
+
+def refresh_watchlist(file_path: str, is_us: bool) -> None:
+    """
+    워치리스트 종목 시세를 새로 조회하여 영구 캐시와 시세 저장소에 저장합니다.
+
+    장이 닫혀 있으면 캐시가 없거나 만료된 종목만 조회합니다.
+
+    Args:
+        file_path: 워치리스트 CSV 경로
+        is_us: 미국 주식 여부
+    """
+    market = quote_store.US if is_us else quote_store.KR
+    if _is_active(quote_store.EXCHANGES[market]):
+        data_fetcher.refresh_watchlist(file_path, is_us)
+        return
+
+    watchlist = data_fetcher.load_watchlist(file_path)
+    if watchlist.empty:
+        return
+    tickers = [str(ticker) for ticker in watchlist['ticker']]
+    with ThreadPoolExecutor(max_workers=config.FETCH_MAX_WORKERS) as executor:
+        list(executor.map(lambda ticker: data_fetcher.get_quote(ticker, market), tickers))
+
+
+def refresh_watchlists() -> None:
+    """ISA / 미국 직투 워치리스트를 갱신합니다."""
+    refresh_watchlist(str(config.ISA_WATCHLIST_PATH), is_us=False)
+    refresh_watchlist(str(config.DIRECT_WATCHLIST_PATH), is_us=True)
+
+
+def refresh_exchange_rate() -> None:
+    """USD/KRW 환율과 일별 환율 시계열을 갱신합니다."""
+    fx_service.refresh()
+    fx_service.get_series()
+
+
+def refresh_hot_lists() -> None:
+    """HOT 미국 주식 / 한국 ETF 순위를 모든 기간에 대해 갱신합니다 (장이 닫힌 시장은 만료된 경우에만)."""
+    update_us = _updater(data_fetcher.fetch_hot_us_stocks, market_hours.NYSE)
+    update_kr = _updater(data_fetcher.fetch_hot_kr_etfs, market_hours.KRX)
+
+    # 기간별 수익률은 시장별로 한 번에 계산되므로 먼저 갱신
+    _updater(data_fetcher.compute_us_returns, market_hours.NYSE)()
+    _updater(data_fetcher.compute_kr_etf_returns, market_hours.KRX)()
+
+    for period in data_fetcher.HOT_PERIODS:
+        update_us(period=period, limit=HOT_LIMIT)
+        update_kr(period=period, limit=HOT_LIMIT)
+
+
+def _run_job(job) -> None:
+    """작업 실패가 스케줄러를 멈추지 않도록 예외를 로그로만 남깁니다."""
+    try:
+        job()
+    except Exception as e:
+        print(f"⚠️ 백그라운드 갱신 실패 ({job.__name__}): {e}")
+
+
+def start() -> Optional['BackgroundScheduler']:
+    """
+    백그라운드 스케줄러를 시작합니다 (프로세스당 한 번, 중복 호출 시 기존 스케줄러 반환).
+
+    갱신 작업은 시작 즉시 한 번 실행된 뒤 PREFETCH_INTERVAL 간격으로 반복됩니다.
+    PREFETCH_INTERVAL은 CACHE_TTL보다 짧아야 캐시가 만료되기 전에 갱신됩니다.
+    장이 닫힌 시장의 시세는 캐시가 다음 개장까지 유지되므로 새로 조회하지 않습니다.
+    종목 검색 인덱스도 시작 시 미리 만들어 둡니다.
+    METRICS_EXPORT_INTERVAL이 설정되어 있으면 성능 지표 파일도 주기적으로 저장합니다.
+
+    Returns:
+        실행 중인 스케줄러 (BACKGROUND_PREFETCH_ENABLED가 False면 None)
+    """
+    global _scheduler
+
+    if not config.BACKGROUND_PREFETCH_ENABLED:
+        return None
+    if _scheduler is not None and _scheduler.running:
+        return _scheduler
+
+    # APScheduler는 백그라운드 갱신을 켤 때만 import (시작 시간 단축)
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    scheduler = BackgroundScheduler(daemon=True)
+    now = datetime.now()
+
+    for job in (refresh_exchange_rate, refresh_watchlists, refresh_hot_lists):
+        scheduler.add_job(
+            _run_job,
+            'interval',
+            args=[job],
+            id=job.__name__,
+            seconds=config.PREFETCH_INTERVAL,
+            next_run_time=now,
+            max_instances=1,
+            coalesce=True
+        )
+
+    # 종목 검색 인덱스는 첫 검색 전에 미리 생성
+    scheduler.add_job(
+        _run_job,
+        'interval',
+        args=[search_index.get_index],
+        id='build_search_index',
+        seconds=config.LISTING_TTL,
+        next_run_time=now,
+        max_instances=1,
+        coalesce=True
+    )
+
+    if config.METRICS_EXPORT_INTERVAL:
+        scheduler.add_job(
+            _run_job,
+            'interval',
+            args=[metrics.export_to_file],
+            id='export_metrics',
+            seconds=config.METRICS_EXPORT_INTERVAL,
+            max_instances=1,
+            coalesce=True
+        )
+
+    scheduler.start()
+    _scheduler = scheduler
+    return scheduler
+
+
+def shutdown() -> None:
+    """백그라운드 스케줄러를 중지합니다."""
+    global _scheduler
+
+    if _scheduler is not None and _scheduler.running:
+        _scheduler.shutdown(wait=False)
+    _scheduler = None
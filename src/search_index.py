@@ -0,0 +1,254 @@
+"""
+종목 검색 인덱스 모듈
+한국 주식/ETF 종목명과 미국 티커를 메모리 인덱스로 만들어
+부분 문자열(n-gram), 접두어, 초성("ㅋㅂㄷㅋ" → 커버드콜) 검색을 제공합니다.
+"""
+
+import bisect
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Set
+import config
+import symbol_listing
+
+
+# 한글 초성 (유니코드 음절 순서)
+CHOSUNG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+_CHOSUNG_SET = set(CHOSUNG)
+_HANGUL_START = 0xAC00
+_HANGUL_END = 0xD7A3
+_SYLLABLES_PER_CHOSUNG = 21 * 28
+
+# 매칭 종류별 순위 (낮을수록 먼저 표시)
+RANK_EXACT_CODE = 0  # 종목코드/티커 일치
+RANK_EXACT_NAME = 1  # 종목명 일치
+RANK_CODE_PREFIX = 2  # 종목코드/티커 접두어
+RANK_NAME_PREFIX = 3  # 종목명 접두어
+RANK_WORD_PREFIX = 4  # 종목명 중간 단어의 접두어 (예: "커버드" → "KODEX 커버드콜")
+RANK_SUBSTRING = 5  # 종목명 부분 문자열
+RANK_CHOSUNG = 6  # 초성 일치
+
+# 시장별 순위 (같은 매칭 종류 안에서 ETF → 한국 주식 → 미국 순)
+_MARKET_ORDER = {'ETF/KR': 0, 'KRX': 1, 'US': 2}
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화: NFC 조합, 소문자, 공백 제거"""
+    return ''.join(unicodedata.normalize('NFC', str(text)).lower().split())
+
+
+def to_chosung(text: str) -> str:
+    """
+    한글 음절을 초성으로 바꿉니다 (한글이 아닌 문자는 그대로).
+
+    Examples:
+        >>> to_chosung("kodex커버드콜")
+        'kodexㅋㅂㄷㅋ'
+    """
+    return ''.join(
+        CHOSUNG[(ord(char) - _HANGUL_START) // _SYLLABLES_PER_CHOSUNG]
+        if _HANGUL_START <= ord(char) <= _HANGUL_END else char
+        for char in text
+    )
+
+
+def has_chosung(text: str) -> bool:
+    """초성 자음(ㄱ~ㅎ)이 포함된 검색어인지 확인합니다."""
+    return any(char in _CHOSUNG_SET for char in text)
+
+
+def _ngrams(text: str, n: int) -> Set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class SearchIndex:
+    """
+    종목 검색 인덱스.
+
+    종목명(정규화)과 초성 문자열의 1-gram / 2-gram 역색인으로 후보를 좁힌 뒤
+    실제 포함 여부를 확인하고, 코드/이름 접두어는 정렬된 키 목록에서 이진 탐색합니다.
+    """
+
+    def __init__(self, entries: Sequence[Dict]):
+        """
+        Args:
+            entries: [{'ticker', 'name', 'market'}] (market: 'ETF/KR', 'KRX', 'US')
+        """
+        self.entries: List[Dict] = []
+        self.names: List[str] = []
+        self.codes: List[str] = []
+        self.chosungs: List[str] = []
+        self.words: List[List[str]] = []
+        self.orders: List[tuple] = []  # (시장 순위, 이름 길이) - 같은 매칭 종류 안에서 정렬용
+        self._grams: Dict[str, Set[int]] = {}
+        self._chosung_grams: Dict[str, Set[int]] = {}
+        self._codes_sorted: List[tuple] = []  # (정규화 코드, 번호)
+        self._names_sorted: List[tuple] = []  # (정규화 이름, 번호)
+
+        seen = set()
+        for entry in entries:
+            key = (str(entry['ticker']), entry['market'] == 'US')
+            if key in seen:
+                continue
+            seen.add(key)
+            self._add(str(entry['ticker']), str(entry['name']), entry['market'])
+
+        self._codes_sorted.sort()
+        self._names_sorted.sort()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _add(self, ticker: str, name: str, market: str) -> None:
+        idx = len(self.entries)
+        name_norm = normalize(name)
+        chosung = to_chosung(name_norm)
+
+        self.entries.append({'ticker': ticker, 'name': name, 'market': 'US' if market == 'US' else 'KR'})
+        self.names.append(name_norm)
+        self.codes.append(normalize(ticker))
+        self.chosungs.append(chosung)
+        self.words.append([normalize(word) for word in unicodedata.normalize('NFC', name).split()])
+        self.orders.append((_MARKET_ORDER.get(market, len(_MARKET_ORDER)), len(name_norm)))
+
+        for gram in _ngrams(name_norm, 1) | _ngrams(name_norm, 2):
+            self._grams.setdefault(gram, set()).add(idx)
+        for gram in _ngrams(chosung, 1) | _ngrams(chosung, 2):
+            self._chosung_grams.setdefault(gram, set()).add(idx)
+
+        self._codes_sorted.append((self.codes[idx], idx))
+        self._names_sorted.append((name_norm, idx))
+
+    @staticmethod
+    def _prefix_range(keys: List[tuple], prefix: str) -> List[int]:
+        """정렬된 (키, 번호) 목록에서 prefix로 시작하는 항목 번호"""
+        start = bisect.bisect_left(keys, (prefix,))
+        end = bisect.bisect_left(keys, (prefix + '\uffff',))
+        return [idx for _, idx in keys[start:end]]
+
+    @staticmethod
+    def _candidates(grams: Dict[str, Set[int]], query: str) -> Set[int]:
+        """query의 모든 n-gram을 포함하는 항목 번호 (포함 여부 확인 전 후보)"""
+        keys = _ngrams(query, 2) if len(query) >= 2 else {query}
+        postings = sorted((grams.get(key, set()) for key in keys), key=len)
+        if not postings or not postings[0]:
+            return set()
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        검색어와 일치하는 종목을 순위대로 반환합니다.
+
+        Args:
+            query: 종목코드, 티커, 종목명 일부 또는 초성 (예: "0695", "AAPL", "커버드콜", "ㅋㅂㄷㅋ")
+            limit: 최대 결과 수
+
+        Returns:
+            [{'ticker', 'name', 'market'}] (market: 'KR' 또는 'US')
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        ranks: Dict[int, int] = {}
+
+        def mark(indices, rank):
+            for idx in indices:
+                if rank < ranks.get(idx, RANK_CHOSUNG + 1):
+                    ranks[idx] = rank
+
+        if has_chosung(query):
+            # 초성 검색: 검색어의 완성 음절도 초성으로 바꿔서 비교
+            chosung_query = to_chosung(query)
+            mark((idx for idx in self._candidates(self._chosung_grams, chosung_query)
+                  if chosung_query in self.chosungs[idx]), RANK_CHOSUNG)
+        else:
+            mark(self._prefix_range(self._codes_sorted, query), RANK_CODE_PREFIX)
+            mark(self._prefix_range(self._names_sorted, query), RANK_NAME_PREFIX)
+            for idx in self._candidates(self._grams, query):
+                if query in self.names[idx]:
+                    if any(word.startswith(query) for word in self.words[idx]):
+                        mark((idx,), RANK_WORD_PREFIX)
+                    else:
+                        mark((idx,), RANK_SUBSTRING)
+
+            for idx, rank in list(ranks.items()):
+                if self.codes[idx] == query:
+                    ranks[idx] = RANK_EXACT_CODE
+                elif self.names[idx] == query:
+                    ranks[idx] = RANK_EXACT_NAME
+
+        ordered = sorted(ranks, key=lambda idx: (ranks[idx], self.orders[idx], self.names[idx]))
+        return [dict(self.entries[idx]) for idx in ordered[:limit]]
+
+
+_index: Optional[SearchIndex] = None
+_built_at = 0.0
+_build_lock = threading.Lock()
+
+
+def _collect_entries() -> List[Dict]:
+    """인덱스에 넣을 종목 목록 (한국 ETF, 한국 주식, 미국 종목)"""
+    entries = []
+    for market in config.SEARCH_KR_MARKETS:
+        listing = symbol_listing.get_listing(market)
+        entries.extend({'ticker': code, 'name': name, 'market': market}
+                       for code, name in zip(listing['Code'], listing['Name']))
+
+    for market in config.SEARCH_US_MARKETS:
+        listing = symbol_listing.get_listing(market)
+        entries.extend({'ticker': code, 'name': name, 'market': 'US'}
+                       for code, name in zip(listing['Code'], listing['Name']))
+
+    # 미국 목록을 받지 못해도 관심 종목 / HOT 후보 티커는 검색되도록 추가
+    import data_fetcher  # data_fetcher가 이 모듈을 import하므로 순환 참조를 피해 함수 안에서 import
+    watchlist = data_fetcher.load_watchlist(str(config.DIRECT_WATCHLIST_PATH))
+    if {'ticker', 'name'} <= set(watchlist.columns):
+        entries.extend({'ticker': str(ticker), 'name': name, 'market': 'US'}
+                       for ticker, name in zip(watchlist['ticker'], watchlist['name']))
+    entries.extend({'ticker': ticker, 'name': ticker, 'market': 'US'} for ticker in data_fetcher.HOT_US_TICKERS)
+
+    return entries
+
+
+def get_index() -> SearchIndex:
+    """
+    검색 인덱스를 반환합니다 (최초 호출 시 생성, LISTING_TTL마다 다시 생성).
+
+    Returns:
+        SearchIndex (종목 목록을 받지 못한 시장은 빠진 상태)
+    """
+    global _index, _built_at
+
+    if _index is not None and time.time() - _built_at < config.LISTING_TTL:
+        return _index
+
+    with _build_lock:
+        if _index is None or time.time() - _built_at >= config.LISTING_TTL:
+            _index = SearchIndex(_collect_entries())
+            _built_at = time.time()
+        return _index
+
+
+def search(query: str, limit: int = 10) -> List[Dict]:
+    """
+    종목 검색 (get_index().search 단축 함수).
+
+    Examples:
+        >>> search("ㅋㅂㄷㅋ", limit=3)
+        [{'ticker': '441640', 'name': 'KODEX 미국배당커버드콜액티브', 'market': 'KR'}, ...]
+    """
+    return get_index().search(query, limit)
+
+
+def clear() -> None:
+    """인덱스를 지웁니다 (다음 검색 때 다시 생성)."""
+    global _index
+    with _build_lock:
+        _index = None
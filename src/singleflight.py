@@ -0,0 +1,71 @@
+"""
+요청 병합(single-flight) 모듈
+같은 데이터를 동시에 요청한 호출들이 하나의 진행 중인 조회를 기다렸다가
+그 결과를 함께 사용하도록 합니다. 캐시가 만료된 직후 여러 세션이 동시에
+접속해도 데이터 제공자에는 요청이 한 번만 갑니다.
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+import metrics
+
+
+class _Call:
+    """진행 중인 조회 하나 (완료되면 event가 설정됨)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    키별로 진행 중인 조회를 하나만 실행하는 그룹.
+
+    Examples:
+        >>> flights = SingleFlight('dashboard')
+        >>> flights.do(('JEPI',), fetch_us_etf_data, 'JEPI')  # 동시에 호출해도 조회는 한 번
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """
+        같은 key의 조회가 진행 중이면 기다렸다가 그 결과를, 아니면 직접 조회한 결과를 반환합니다.
+
+        기다린 호출은 결과의 복사본을 받으므로 호출한 쪽에서 결과를 수정해도
+        다른 호출에 영향이 없습니다. 조회가 예외로 끝나면 기다린 호출에도 같은 예외가 전달됩니다.
+
+        Args:
+            key: 조회를 구분하는 키 (예: 캐시 키)
+            func: 조회 함수
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            metrics.inc(metrics.SINGLEFLIGHT_SHARED, group=self.name)
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
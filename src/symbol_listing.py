@@ -0,0 +1,186 @@
+"""
+종목 목록 캐시 모듈
+FinanceDataReader 종목 목록(ETF/KR, KRX)을 프로세스 단위로 캐시하고
+종목코드 → 종목명 인덱스를 제공합니다.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+import threading
+import time
+import config
+import metrics
+import providers
+import resilience
+
+
+# 이름 조회 시 기본 검색 순서 (ETF 먼저, 없으면 전체 주식)
+DEFAULT_MARKETS = ('ETF/KR', 'KRX')
+
+# 시장별 캐시 항목: {'listing': DataFrame, 'names': Dict[str, str], 'loaded_at': float}
+_listings: Dict[str, Dict] = {}
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _get_lock(market: str) -> threading.Lock:
+    """시장별 로드 락을 반환합니다 (같은 목록을 동시에 두 번 받지 않도록)."""
+    with _locks_guard:
+        if market not in _locks:
+            _locks[market] = threading.Lock()
+        return _locks[market]
+
+
+def _listing_path(market: str) -> Path:
+    """시장별 목록 파일 경로 (예: 'ETF/KR' → listing_ETF_KR.csv)"""
+    return config.CACHE_DIR / f"listing_{market.replace('/', '_')}.csv"
+
+
+def _normalize(listing: pd.DataFrame) -> pd.DataFrame:
+    """
+    종목코드 컬럼을 'Code'로 통일합니다.
+
+    FinanceDataReader 버전에 따라 'Code' 또는 'Symbol' 컬럼을 사용합니다.
+    """
+    if 'Code' not in listing.columns and 'Symbol' in listing.columns:
+        listing = listing.rename(columns={'Symbol': 'Code'})
+
+    if 'Code' not in listing.columns or 'Name' not in listing.columns:
+        raise ValueError(f"종목 목록 컬럼을 인식할 수 없습니다: {listing.columns.tolist()}")
+
+    listing = listing.copy()
+    listing['Code'] = listing['Code'].astype(str)
+    return listing.reset_index(drop=True)
+
+
+def _load_from_disk(market: str) -> Optional[Dict]:
+    """디스크에 저장된 목록을 읽습니다 (없거나 읽을 수 없으면 None)."""
+    path = _listing_path(market)
+    try:
+        listing = _normalize(pd.read_csv(path, dtype={'Code': str, 'Symbol': str}))
+        return _make_entry(listing, loaded_at=path.stat().st_mtime)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ {market} 종목 목록 파일 로드 실패: {e}")
+        return None
+
+
+def _save_to_disk(market: str, listing: pd.DataFrame) -> None:
+    """목록을 디스크에 저장합니다."""
+    try:
+        config.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        listing.to_csv(_listing_path(market), index=False)
+    except Exception as e:
+        print(f"⚠️ {market} 종목 목록 저장 실패: {e}")
+
+
+def _make_entry(listing: pd.DataFrame, loaded_at: float) -> Dict:
+    """목록과 코드 → 종목명 인덱스로 캐시 항목을 만듭니다."""
+    return {
+        'listing': listing,
+        'names': dict(zip(listing['Code'], listing['Name'])),
+        'loaded_at': loaded_at
+    }
+
+
+def _is_fresh(entry: Optional[Dict]) -> bool:
+    return entry is not None and time.time() - entry['loaded_at'] < config.LISTING_TTL
+
+
+def _get_entry(market: str) -> Optional[Dict]:
+    """
+    시장별 캐시 항목을 반환합니다.
+
+    메모리 → 디스크 → FinanceDataReader 순서로 찾고, 다운로드에 실패하면
+    유효 시간이 지난 이전 목록이라도 반환합니다.
+    """
+    entry = _listings.get(market)
+    if _is_fresh(entry):
+        metrics.record_cache_lookup('listing', True, market=market)
+        return entry
+
+    metrics.record_cache_lookup('listing', False, market=market)
+    with _get_lock(market):
+        # 락을 기다리는 동안 다른 스레드가 이미 로드했을 수 있음
+        entry = _listings.get(market)
+        if _is_fresh(entry):
+            return entry
+
+        disk_entry = _load_from_disk(market)
+        if _is_fresh(disk_entry):
+            _listings[market] = disk_entry
+            return disk_entry
+
+        try:
+            listing = _normalize(resilience.guarded(resilience.FDR, providers.get(resilience.FDR).get_listing, market))
+            if listing.empty:
+                raise ValueError("빈 목록")
+            _save_to_disk(market, listing)
+            entry = _make_entry(listing, loaded_at=time.time())
+        except Exception as e:
+            print(f"⚠️ {market} 종목 목록 가져오기 실패: {e}")
+            entry = entry or disk_entry
+
+        if entry is not None:
+            _listings[market] = entry
+        return entry
+
+
+def get_listing(market: str = 'ETF/KR') -> pd.DataFrame:
+    """
+    종목 목록을 반환합니다 (LISTING_TTL 동안 캐시).
+
+    Args:
+        market: FinanceDataReader 시장 코드 ('ETF/KR', 'KRX' 등)
+
+    Returns:
+        'Code', 'Name' 컬럼을 포함한 종목 목록 DataFrame (실패 시 빈 DataFrame)
+    """
+    entry = _get_entry(market)
+    if entry is None:
+        return pd.DataFrame(columns=['Code', 'Name'])
+    return entry['listing']
+
+
+def get_name_index(market: str = 'ETF/KR') -> Dict[str, str]:
+    """
+    종목코드 → 종목명 딕셔너리를 반환합니다.
+
+    Args:
+        market: FinanceDataReader 시장 코드
+
+    Returns:
+        {종목코드: 종목명} 딕셔너리 (실패 시 빈 딕셔너리)
+    """
+    entry = _get_entry(market)
+    return entry['names'] if entry is not None else {}
+
+
+def lookup_name(code: str, markets: Sequence[str] = DEFAULT_MARKETS) -> Optional[str]:
+    """
+    종목코드로 종목명을 찾습니다.
+
+    Args:
+        code: 종목코드 (예: "005930")
+        markets: 검색할 시장 순서 (앞 시장에서 찾으면 뒤 시장은 로드하지 않음)
+
+    Returns:
+        종목명 또는 None (찾지 못한 경우)
+
+    Examples:
+        >>> lookup_name("005930")
+        '삼성전자'
+    """
+    code = str(code)
+    for market in markets:
+        name = get_name_index(market).get(code)
+        if name is not None:
+            return name
+    return None
+
+
+def clear() -> None:
+    """메모리 캐시를 비웁니다 (디스크 파일은 유지)."""
+    _listings.clear()